@@ -0,0 +1,5 @@
+"""Offline benchmarks for the Nuvix bots.
+
+Handlers and helpers run against the fake Discord objects in :mod:`benchmarks.fakes`;
+nothing connects to Discord. Run ``python -m benchmarks --help`` from the repo root.
+"""
@@ -0,0 +1,59 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: command line
+#   python -m benchmarks                      run everything, compare with the saved baseline
+#   python -m benchmarks -k utils             only cases whose name contains "utils"
+#   python -m benchmarks --save               record a new baseline
+#   python -m benchmarks --check              exit 1 on a regression (for CI)
+# ==================================================
+
+import argparse
+import os
+import sys
+
+from benchmarks import harness
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Offline benchmarks for the Nuvix bots.")
+    parser.add_argument("-k", dest="pattern", help="only run cases whose name contains this text")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--min-time", type=float, default=0.01, help="minimum seconds per round")
+    parser.add_argument("--baseline", default=harness.BASELINE)
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="fail when a case is slower than the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown for --check (0.25 = +25%%)")
+    args = parser.parse_args(argv)
+    args.baseline = os.path.abspath(args.baseline)  # prepare_environment() changes directory
+
+    harness.prepare_environment()
+    cases = harness.collect(args.pattern)
+    if not cases:
+        print("No benchmark matched.")
+        return 1
+    skipped = []
+    results = harness.run(cases, rounds=args.rounds, min_time=args.min_time, skipped=skipped)
+
+    baseline = harness.load(args.baseline) if os.path.exists(args.baseline) else None
+    print(harness.report(results, baseline))
+
+    if args.save:
+        harness.save(results, args.baseline)
+        print(f"💾 Baseline saved to {args.baseline}")
+    if args.check:
+        if baseline is None:
+            print(f"No baseline at {args.baseline}; run with --save first.")
+            return 1
+        regressions = harness.compare(results, baseline, args.tolerance)
+        for name, ratio in regressions:
+            print(f"❌ {name} is {(ratio - 1) * 100:.0f} % slower than the baseline")
+        failed = len(cases) - len(results) - len(skipped)  # optional packages missing is not a failure
+        if failed:
+            print(f"❌ {failed} case(s) failed")
+        if regressions or failed:
+            return 1
+        print("✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: slash-command handlers
+# ==================================================
+
+from discord import app_commands
+
+from benchmarks.fakes import FakeMember, make_interaction
+from benchmarks.harness import OWNER_ROLE_ID, aio, load_bot
+
+BOTS = (
+    "nuvix_ai", "nuvix_apps", "nuvix_backup", "nuvix_information", "nuvix_invoices",
+    "nuvix_machine", "nuvix_management", "nuvix_sanctions", "nuvix_system", "nuvix_tickets",
+)
+
+
+def _status_case(bot_name: str):
+    def case(benchmark):
+        status = load_bot(bot_name)["status"]
+        interaction = make_interaction(role_ids=[OWNER_ROLE_ID])
+
+        async def invoke():
+            # what discord.py runs for /status once the interaction is parsed: checks, then the callback
+            interaction.reset()
+            if all(check(interaction) for check in status.checks):
+                await status.callback(interaction)
+            return interaction.response.sent
+
+        sent = benchmark(aio(invoke))
+        assert sent and sent[0][1]["embed"].title == "✅ Connected"
+    return case
+
+
+# One /status case per bot: they share the code today, this catches one drifting.
+for _name in BOTS:
+    globals()[f"bench_status_{_name[6:]}"] = _status_case(_name)
+
+
+def _owner_only():
+    return load_bot("nuvix_backup")["owner_only"]
+
+
+def bench_owner_only_role(benchmark):
+    owner_only = _owner_only()
+    interaction = make_interaction(role_ids=[OWNER_ROLE_ID])
+    assert benchmark(owner_only, interaction) is True
+
+
+def bench_owner_only_admin(benchmark):
+    owner_only = _owner_only()
+    interaction = make_interaction(admin=True)
+    assert benchmark(owner_only, interaction) is True
+
+
+def bench_owner_only_denied(benchmark):
+    # worst case: every role is scanned and every fallback is tried
+    owner_only = _owner_only()
+    interaction = make_interaction(extra_roles=25)
+    assert benchmark(owner_only, interaction) is False
+
+# ==============================
+# 📋 Read-only commands
+# ==============================
+def _command_case(bot_name: str, command: str, *args, role_ids=(OWNER_ROLE_ID,)):
+    """Checks, then the callback (or the command's error handler when a check fails),
+    against the bot's own state in the scratch data dir."""
+    def case(benchmark):
+        cmd = load_bot(bot_name)[command]
+        interaction = make_interaction(role_ids=list(role_ids))
+        call_args = [a(interaction) if callable(a) else a for a in args]
+
+        async def invoke():
+            interaction.reset()
+            if all(check(interaction) for check in cmd.checks):
+                await cmd.callback(interaction, *call_args)
+            else:
+                await cmd.on_error(interaction, app_commands.CheckFailure())
+            return interaction.response.sent + interaction.followup.sent
+
+        sent = benchmark(aio(invoke))
+        assert sent, f"/{cmd.name} sent nothing"
+        return sent
+    return case
+
+
+def _member(interaction):
+    return FakeMember(name="customer", guild=interaction.guild)
+
+
+bench_ticket_stats = _command_case("nuvix_tickets", "ticket_stats", None)
+bench_serverstats = _command_case("nuvix_information", "serverstats")
+bench_apps_review = _command_case("nuvix_apps", "apps_review", None)
+bench_invoices_of = _command_case("nuvix_invoices", "invoices_of", _member)
+bench_sanctions_of = _command_case("nuvix_sanctions", "sanctions", _member)
+bench_bulk_jobs = _command_case("nuvix_management", "bulk_jobs")
+bench_ai_cache = _command_case("nuvix_ai", "ai_cache")
+# a non-owner: the check fails and the per-command error handler answers
+bench_ticket_stats_denied = _command_case("nuvix_tickets", "ticket_stats", None, role_ids=())
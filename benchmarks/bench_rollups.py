@@ -0,0 +1,48 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: ticket rollups (nuvix_tickets/rollups.py)
+# ==================================================
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.harness import ROOT_DIR
+
+sys.path.insert(0, os.path.join(ROOT_DIR, "nuvix_tickets"))
+from rollups import TicketRollups  # noqa: E402
+
+CATEGORIES = ("Purchases", "Replace", "Support", "Partnership", "Other")
+
+
+def _filled(tmp: str) -> TicketRollups:
+    """A full 7-day window: every hour × category bucket populated."""
+    rollups = TicketRollups(os.path.join(tmp, "ticket_rollups.bin"))
+    now = time.time()
+    for i in range(168 * len(CATEGORIES)):
+        ts = now - (i // len(CATEGORIES)) * 3600
+        rollups.ticket_opened(i, CATEGORIES[i % len(CATEGORIES)], ts - 600)
+        rollups.staff_replied(i, ts - 300)
+        rollups.ticket_closed(i, ts)
+    return rollups
+
+
+def bench_dashboard_7d(benchmark):
+    with tempfile.TemporaryDirectory() as tmp:
+        assert len(benchmark(_filled(tmp).window, 168)) == len(CATEGORIES)
+
+
+def bench_ticket_lifecycle(benchmark):
+    # open + first reply + assignment + close, as the event handlers call it
+    with tempfile.TemporaryDirectory() as tmp:
+        rollups = _filled(tmp)
+        ids = iter(range(10**6, 10**9))
+
+        def lifecycle():
+            channel = next(ids)
+            rollups.ticket_opened(channel, "Purchases")
+            rollups.staff_replied(channel)
+            rollups.ticket_assigned(channel)
+            rollups.ticket_closed(channel)
+
+        benchmark(lifecycle)
@@ -0,0 +1,100 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: runtime profiles
+# Same work under the stdlib runtime (asyncio + json) and the fast one
+# (uvloop + orjson). Fast cases are skipped when the package isn't installed.
+# For end-to-end throughput: python -m benchmarks.loadtest run <bot> --runtime both
+# ==================================================
+
+import asyncio
+import contextlib
+import tempfile
+from dataclasses import asdict
+
+import event_bus
+import runtime
+import serialization
+import utils
+from benchmarks.fakes import make_interaction
+from benchmarks.harness import OWNER_ROLE_ID, Skip, aio, load_bot, working_dir
+
+BURST = 100  # interactions in flight at once, each in its own task like discord.py dispatches them
+
+
+@contextlib.contextmanager
+def _json_backend(fast: bool):
+    previous = serialization.backend() == "orjson"
+    if serialization.use(fast) != ("orjson" if fast else "json"):
+        raise Skip("orjson is not installed")
+    try:
+        yield
+    finally:
+        serialization.use(previous)
+
+
+def _loop_factory(fast: bool):
+    if not fast:
+        return asyncio.new_event_loop
+    if runtime.uvloop is None:
+        raise Skip("uvloop is not installed")
+    return runtime.uvloop.new_event_loop
+
+# ==============================
+# 🧾 Log writes
+# ==============================
+def _log_case(fast: bool):
+    def case(benchmark):
+        entry = {"user": "benyx1", "cmd": "open_ticket:Purchases", "channel": 1432829783602888775,
+                 "reason": "Compra — método de pago"}
+        with _json_backend(fast), tempfile.TemporaryDirectory() as tmp, working_dir(tmp):
+            benchmark(utils.log_to_json, "cmd_use", entry)
+            with open("logs/cmd_use.json", encoding="utf-8") as f:
+                assert serialization.loads(f.readline())["data"] == entry
+    return case
+
+
+bench_log_to_json_stdlib = _log_case(False)
+bench_log_to_json_fast = _log_case(True)
+
+# ==============================
+# 📡 Event bus wire format
+# ==============================
+def _bus_case(fast: bool):
+    def case(benchmark):
+        closed = event_bus.TicketClosed(guild_id=1432829605298962534, channel_id=1432829783602888775,
+                                        closed_by=1310330017963839622,
+                                        transcript_path="data/tickets_logs/ticket-benyx1.txt")
+        event = event_bus.Event(closed.type, asdict(closed), source="nuvix_tickets")
+        with _json_backend(fast):
+            decoded = benchmark(lambda: event_bus.Event.decode(event.encode()))
+        assert decoded.payload == event.payload
+    return case
+
+
+bench_bus_roundtrip_stdlib = _bus_case(False)
+bench_bus_roundtrip_fast = _bus_case(True)
+
+# ==============================
+# ⚡ Interaction burst
+# ==============================
+def _burst_case(fast: bool):
+    def case(benchmark):
+        status = load_bot("nuvix_tickets")["status"]
+        interactions = [make_interaction(role_ids=[OWNER_ROLE_ID]) for _ in range(BURST)]
+
+        async def handle(interaction):
+            interaction.reset()
+            if all(check(interaction) for check in status.checks):
+                await status.callback(interaction)
+
+        async def burst():
+            await asyncio.gather(*(asyncio.create_task(handle(i)) for i in interactions))
+            return interactions
+
+        benchmark.extra_info["interactions_per_call"] = BURST
+        done = benchmark(aio(burst, _loop_factory(fast)))
+        assert all(i.response.sent for i in done)
+    return case
+
+
+bench_interaction_burst_stdlib = _burst_case(False)
+bench_interaction_burst_fast = _burst_case(True)
@@ -0,0 +1,45 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: ticket transcripts (nuvix_tickets/transcripts.py, transcript_archive.py)
+# ==================================================
+
+import os
+import sys
+import tempfile
+
+import transcript_archive
+from benchmarks.harness import ROOT_DIR
+
+sys.path.insert(0, os.path.join(ROOT_DIR, "nuvix_tickets"))
+import transcripts  # noqa: E402
+
+NAMES = {"1310330017963839622": "benyx1"}
+
+
+def _transcript(lines: int) -> str:
+    authors = ("Nuvix Tickets#0972", "benyx1", "Nuvix Invoices#3203")
+    return "\n".join(
+        f"[2025-11-02 23:{i // 60 % 60:02d}:{i % 60:02d}] {authors[i % 3]}: "
+        + ("<@1310330017963839622> assigned themself to this ticket." if i % 50 == 0 else f"mensaje {i} <b>&</b>")
+        for i in range(lines)
+    )
+
+
+def bench_parse_500_lines(benchmark):
+    assert len(benchmark(transcripts.parse_transcript, _transcript(500))) == 500
+
+
+def bench_render_500_lines(benchmark):
+    page = benchmark(transcripts.render_transcript, _transcript(500), NAMES, "benyx1-233322", "Nuvix")
+    assert "@benyx1" in page and "<b>" not in page
+
+
+def bench_archive_get_10k(benchmark):
+    # random access into a 10k-transcript archive spread over several segments
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = transcript_archive.TranscriptArchive(tmp, segment_bytes=4 * 1024 * 1024)
+        body = _transcript(20).encode("utf-8")
+        archive.append((f"benyx1-{i:06d}", 1762126422 + i, body) for i in range(10_000))
+        view = benchmark(archive.get, "benyx1-004242", 1762126422 + 4242)
+        assert view == body
+        del view
+        archive.close()
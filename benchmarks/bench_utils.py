@@ -0,0 +1,51 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: shared helpers (utils.py)
+# ==================================================
+
+import json
+import tempfile
+
+import utils
+from benchmarks.fakes import FakeMember, FakeRole
+from benchmarks.harness import STAFF_ROLE_ID, working_dir
+
+
+def _member(extra_roles: int, staff: bool) -> FakeMember:
+    roles = [FakeRole() for _ in range(extra_roles)]
+    if staff:
+        roles.append(FakeRole(id=STAFF_ROLE_ID))
+    return FakeMember(roles=roles)
+
+
+def bench_can_staff_hit(benchmark):
+    assert benchmark(utils.can_staff, _member(5, staff=True)) is True
+
+
+def bench_can_staff_miss(benchmark):
+    assert benchmark(utils.can_staff, _member(5, staff=False)) is False
+
+
+def bench_can_staff_many_roles(benchmark):
+    assert benchmark(utils.can_staff, _member(50, staff=True)) is True
+
+
+def bench_can_owner_or_coowner_miss(benchmark):
+    assert benchmark(utils.can_owner_or_coowner, _member(5, staff=True)) is False
+
+
+def bench_default_embed(benchmark):
+    embed = benchmark(utils.default_embed, "🎫 Ticket", "Opened by <@1310330017963839622>")
+    assert embed.footer.text
+
+
+def bench_default_embed_to_dict(benchmark):
+    # what discord.py serializes for every send/edit
+    benchmark(lambda: utils.default_embed("🎫 Ticket", "Opened by <@1310330017963839622>").to_dict())
+
+
+def bench_log_to_json(benchmark):
+    entry = {"user": "benyx1", "cmd": "open_ticket:Purchases", "channel": 1432829783602888775}
+    with tempfile.TemporaryDirectory() as tmp, working_dir(tmp):
+        benchmark(utils.log_to_json, "cmd_use", entry)
+        with open("logs/cmd_use.json", encoding="utf-8") as f:
+            assert json.loads(f.readline())["data"] == entry
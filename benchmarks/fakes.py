@@ -0,0 +1,136 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: fake Discord objects
+# Just enough of Interaction / Member / Guild for handlers and helpers to run offline.
+# ==================================================
+
+import itertools
+from dataclasses import dataclass, field
+
+_ids = itertools.count(1_000_000_000_000_000_000)
+
+
+def snowflake() -> int:
+    return next(_ids)
+
+
+@dataclass(eq=False)
+class FakeRole:
+    id: int = field(default_factory=snowflake)
+    name: str = "role"
+
+
+@dataclass
+class FakePermissions:
+    administrator: bool = False
+
+
+@dataclass(eq=False)
+class FakeGuild:
+    id: int = field(default_factory=snowflake)
+    owner_id: int = 0
+    name: str = "Nuvix Market"
+    members: list = field(default_factory=list)
+    channels: list = field(default_factory=list)
+    roles: list = field(default_factory=list)
+
+    @property
+    def member_count(self) -> int:
+        return len(self.members)
+
+    def get_role(self, role_id: int):
+        return next((r for r in self.roles if r.id == role_id), None)
+
+    def get_member(self, user_id: int):
+        return next((m for m in self.members if m.id == user_id), None)
+
+
+@dataclass(eq=False)
+class FakeMember:
+    id: int = field(default_factory=snowflake)
+    name: str = "member"
+    roles: list = field(default_factory=list)
+    guild: FakeGuild | None = None
+    bot: bool = False
+    guild_permissions: FakePermissions = field(default_factory=FakePermissions)
+    status: str = "offline"
+
+    @property
+    def display_name(self) -> str:
+        return self.name
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+
+class FakeResponse:
+    """``interaction.response``: records what the handler sent instead of calling Discord."""
+
+    def __init__(self):
+        self.sent = []
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def send_message(self, content=None, **kwargs):
+        self._done = True
+        self.sent.append((content, kwargs))
+
+    async def defer(self, **kwargs):
+        self._done = True
+
+    async def edit_message(self, **kwargs):
+        self._done = True
+        self.sent.append((None, kwargs))
+
+
+class FakeFollowup:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append((content, kwargs))
+
+
+@dataclass(eq=False)
+class FakeInteraction:
+    user: FakeMember
+    guild: FakeGuild | None
+    channel_id: int = field(default_factory=snowflake)
+    response: FakeResponse = field(default_factory=FakeResponse)
+    followup: FakeFollowup = field(default_factory=FakeFollowup)
+
+    @property
+    def guild_id(self):
+        return self.guild.id if self.guild else None
+
+    def reset(self):
+        """Fresh response/followup so one object can be reused across benchmark rounds."""
+        self.response = FakeResponse()
+        self.followup = FakeFollowup()
+
+
+def make_guild(members: int = 0, role_ids=(), staff_every: int = 10) -> FakeGuild:
+    """A guild with ``members`` members; every ``staff_every``-th one gets ``role_ids``."""
+    guild = FakeGuild()
+    guild.roles = [FakeRole(id=r) for r in role_ids]
+    filler = [FakeRole() for _ in range(3)]
+    for i in range(members):
+        roles = list(filler)
+        if role_ids and staff_every and i % staff_every == 0:
+            roles += guild.roles
+        guild.members.append(FakeMember(name=f"member{i}", roles=roles, guild=guild))
+    return guild
+
+
+def make_interaction(guild: FakeGuild | None = None, role_ids=(), extra_roles: int = 5,
+                     admin: bool = False, is_owner: bool = False) -> FakeInteraction:
+    """An interaction whose user carries ``extra_roles`` unrelated roles before ``role_ids``
+    (matching scans the whole role list, so the position matters)."""
+    guild = guild or FakeGuild()
+    roles = [FakeRole() for _ in range(extra_roles)] + [FakeRole(id=r) for r in role_ids]
+    user = FakeMember(roles=roles, guild=guild, guild_permissions=FakePermissions(admin))
+    if is_owner:
+        guild.owner_id = user.id
+    return FakeInteraction(user=user, guild=guild)
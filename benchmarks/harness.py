@@ -0,0 +1,251 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: harness
+# A small pytest-benchmark-like runner: cases receive a ``benchmark`` callable,
+# results can be saved as a baseline and compared against it.
+# ==================================================
+
+import asyncio
+import atexit
+import contextlib
+import importlib
+import json
+import os
+import pkgutil
+import platform
+import runpy
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+# Fixed settings so numbers don't depend on the local .env (role IDs from utils.py).
+OWNER_ROLE_ID = 1432829605298962534
+STAFF_ROLE_ID = 1432829631852970095
+BENCH_ENV = {
+    "NUVIX_ENV_FILE": os.devnull,
+    "OWNER_ROLE_ID": str(OWNER_ROLE_ID),
+    "OWNER_ROLE_IDS": str(OWNER_ROLE_ID),
+    "COOWNER_ROLE_IDS": "1432829606066520144",
+    "HIGHSTAFF_ROLE_IDS": "1432829628938059886",
+    "STAFF_ROLE_IDS": str(STAFF_ROLE_ID),
+    "BANNER_URL": "https://example.invalid/banner.png",
+}
+
+# Databases, caches and job files the bots create at import, relative to a scratch
+# directory made per run, so loading a bot never writes into the tree.
+BENCH_PATHS = {
+    "APPS_DB_PATH": "applications.sqlite3",
+    "INVOICES_DB_PATH": "invoices.sqlite3",
+    "SANCTIONS_DB_PATH": "sanctions.sqlite3",
+    "BULK_JOBS_DIR": "bulk_jobs",
+    "TICKETS_LOG_DIR": "tickets_logs",
+    "TICKETS_HTML_CACHE_DIR": "tickets_html",
+    "TICKETS_ARCHIVE_DIR": "tickets_archive",
+    "TICKETS_ROLLUP_PATH": "ticket_rollups.bin",
+    "BACKUP_LIVE_DIR": os.path.join("backups", "live"),
+    "NUVIX_BUS_SOCKET": "nuvix_bus.sock",
+}
+
+
+def prepare_environment():
+    """Must run before ``config`` is imported (it reads NUVIX_ENV_FILE at import time).
+    Also moves into a scratch directory: utils creates ./data and log_to_json writes ./logs."""
+    os.environ.update(BENCH_ENV)
+    scratch = tempfile.mkdtemp(prefix="nuvix_bench_")
+    atexit.register(shutil.rmtree, scratch, ignore_errors=True)
+    os.environ.update({name: os.path.join(scratch, path) for name, path in BENCH_PATHS.items()})
+    os.chdir(scratch)
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+
+# ==============================
+# ⏱ Benchmark fixture
+# ==============================
+class Benchmark:
+    """Call it like pytest-benchmark's fixture: ``benchmark(fn, *args, **kwargs)``.
+
+    The call count per round is calibrated so one round lasts at least
+    ``min_time`` seconds; the reported figures are per call."""
+
+    def __init__(self, name: str, rounds: int = 20, min_time: float = 0.01, timer=time.perf_counter):
+        self.name = name
+        self.rounds = rounds
+        self.min_time = min_time
+        self.timer = timer
+        self.stats = None
+        self.extra_info = {}
+
+    def _calibrate(self, fn, args, kwargs) -> int:
+        iterations = 1
+        while True:
+            start = self.timer()
+            for _ in range(iterations):
+                fn(*args, **kwargs)
+            if self.timer() - start >= self.min_time or iterations >= 1 << 20:
+                return iterations
+            iterations *= 2
+
+    def __call__(self, fn, *args, **kwargs):
+        result = fn(*args, **kwargs)  # warm-up, and the value handed back to the case
+        iterations = self._calibrate(fn, args, kwargs)
+        samples = []
+        for _ in range(self.rounds):
+            start = self.timer()
+            for _ in range(iterations):
+                fn(*args, **kwargs)
+            samples.append((self.timer() - start) / iterations)
+        self.stats = {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "mean": statistics.fmean(samples),
+            "stddev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "rounds": self.rounds,
+            "iterations": iterations,
+        }
+        if self.extra_info:
+            self.stats["extra_info"] = dict(self.extra_info)
+        return result
+
+
+class Skip(Exception):
+    """Raise from a case that can't run here (e.g. an optional package is missing)."""
+
+
+_loops = {}
+
+
+def aio(coro_fn, loop_factory=asyncio.new_event_loop):
+    """Turn ``async def`` into a plain callable for :class:`Benchmark`.
+
+    Every call drives one coroutine to completion on a loop shared by all cases
+    using the same ``loop_factory``, so the figures include a small constant
+    event-loop overhead."""
+    def run(*args, **kwargs):
+        loop = _loops.get(loop_factory)
+        if loop is None:
+            loop = _loops[loop_factory] = loop_factory()
+        return loop.run_until_complete(coro_fn(*args, **kwargs))
+    return run
+
+
+@contextlib.contextmanager
+def working_dir(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+
+
+_bots = {}
+
+
+def load_bot(name: str) -> dict:
+    """Execute ``<name>/bot.py`` without starting it and return its globals (cached)."""
+    if name not in _bots:
+        _bots[name] = runpy.run_path(os.path.join(ROOT_DIR, name, "bot.py"), run_name=f"bench_{name}")
+    return _bots[name]
+
+# ==============================
+# 🗂 Discovery + running
+# ==============================
+def collect(pattern: str | None = None) -> list[tuple[str, object]]:
+    """``bench_*`` functions of every ``benchmarks/bench_*.py`` module, optionally filtered by substring."""
+    cases = []
+    for info in sorted(pkgutil.iter_modules([BENCH_DIR]), key=lambda i: i.name):
+        if not info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{info.name}")
+        for attr, fn in vars(module).items():
+            if attr.startswith("bench_") and callable(fn):
+                name = f"{info.name[6:]}::{attr[6:]}"
+                if pattern is None or pattern in name:
+                    cases.append((name, fn))
+    return cases
+
+
+def run(cases, rounds: int = 20, min_time: float = 0.01, out=print, skipped: list | None = None) -> dict:
+    """Results by case name. Cases that raise :class:`Skip` are reported and, when given,
+    appended to ``skipped``; failing cases are reported and left out."""
+    results = {}
+    for name, fn in cases:
+        bench = Benchmark(name, rounds, min_time)
+        try:
+            fn(bench)
+        except Skip as e:
+            out(f"⏭ {name} skipped: {e}")
+            if skipped is not None:
+                skipped.append(name)
+            continue
+        except Exception as e:
+            out(f"⚠️ {name} failed: {type(e).__name__}: {e}")
+            continue
+        if bench.stats is None:
+            out(f"⚠️ {name} did not call benchmark()")
+            continue
+        results[name] = bench.stats
+    return results
+
+
+def machine_info() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def save(results: dict, path: str = BASELINE):
+    payload = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "machine": machine_info(), "results": results}
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def load(path: str = BASELINE) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.25) -> list[tuple[str, float]]:
+    """Cases whose median got slower than the baseline by more than ``tolerance`` (0.25 = +25 %)."""
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base and base["median"] > 0:
+            ratio = stats["median"] / base["median"]
+            if ratio > 1 + tolerance:
+                regressions.append((name, ratio))
+    return regressions
+
+# ==============================
+# 📋 Report
+# ==============================
+def _fmt(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def report(results: dict, baseline: dict | None = None) -> str:
+    base = (baseline or {}).get("results", {})
+    width = max((len(n) for n in results), default=10)
+    lines = [f"{'case':<{width}}  {'median':>10}  {'min':>10}  {'ops/s':>12}  {'vs baseline':>11}"]
+    for name, s in results.items():
+        ops = 1 / s["median"] if s["median"] else float("inf")
+        delta = ""
+        if name in base and base[name]["median"]:
+            delta = f"{(s['median'] / base[name]['median'] - 1) * 100:+.1f} %"
+        lines.append(f"{name:<{width}}  {_fmt(s['median']):>10}  {_fmt(s['min']):>10}  {ops:>12,.0f}  {delta:>11}")
+    return "\n".join(lines)
@@ -0,0 +1,182 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: load test
+#   python -m benchmarks.loadtest run nuvix_tickets --rate 1000 --duration 30
+#       start the mock, launch the bot against it, drive traffic, print the report
+#   python -m benchmarks.loadtest run nuvix_tickets --runtime both
+#       same traffic against the stdlib runtime, then the fast one (uvloop + orjson)
+#   python -m benchmarks.loadtest serve --port 8765
+#       only the mock (point a bot at it with the "bot" command)
+#   python -m benchmarks.loadtest bot nuvix_tickets --api http://127.0.0.1:8765
+#       run one bot against a mock instead of Discord
+# ==================================================
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import runpy
+import signal
+import sys
+import tempfile
+
+from benchmarks import harness
+from benchmarks.mock_discord import MockDiscord, RateLimiter, TrafficModel, format_summary, load_command_log
+
+DEFAULT_LOG = os.path.join(harness.ROOT_DIR, "logs", "cmd_use.json.json")
+FAKE_TOKEN = "MTAwMDAwMDAwMDAwMDAwMDAw.GLoadT.mockmockmockmockmockmockmockmockmockmo"
+
+
+def run_bot(name: str, api: str, web_port: int, session_dir: str | None = None):
+    """Point discord.py at the mock and run ``<name>/bot.py`` as if started normally."""
+    os.environ.update(harness.BENCH_ENV)
+    os.environ["GATEWAY_SESSION_DIR"] = session_dir or os.path.join(tempfile.gettempdir(), "nuvix_loadtest_sessions")
+    os.environ[f"{name.upper()}_TOKEN"] = FAKE_TOKEN
+    os.environ["PORT"] = str(web_port)
+    # keep off the event bus of a suite that may be running on this machine
+    os.environ["NUVIX_BUS_SOCKET"] = os.path.join(tempfile.gettempdir(), f"nuvix_loadtest_{os.getpid()}.sock")
+    import yarl
+    from discord.gateway import DiscordWebSocket
+    from discord.http import Route
+    base = api.rstrip("/")
+    Route.BASE = base + "/api/v10"
+    DiscordWebSocket.DEFAULT_GATEWAY = yarl.URL(base.replace("http", "ws", 1) + "/gateway")
+    sys.argv = [os.path.join(harness.ROOT_DIR, name, "bot.py")]
+    runpy.run_path(sys.argv[0], run_name="__main__")
+
+
+def build_traffic(args) -> TrafficModel:
+    entries = load_command_log(args.log) if os.path.exists(args.log) else []
+    if args.amplify_only:
+        entries = [e for e in entries if any(e[1].startswith(p) for p in args.amplify_only)]
+    return TrafficModel(entries, seed=args.seed)
+
+
+async def run(args, fast: bool = False) -> dict:
+    limiter = RateLimiter(args.bucket_limit, args.bucket_window, args.global_rate, args.inject_429,
+                          random.Random(args.seed))
+    mock = MockDiscord(port=args.port, members=args.members, rate_limiter=limiter,
+                       owner_role_id=harness.OWNER_ROLE_ID)
+    await mock.start()
+    child = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "benchmarks.loadtest", "bot", args.bot, "--api", f"http://127.0.0.1:{mock.port}",
+        "--web-port", str(args.web_port), "--session-dir", tempfile.mkdtemp(prefix="nuvix_sessions_"),
+        cwd=harness.ROOT_DIR, env={**os.environ, "NUVIX_FAST_RUNTIME": "1" if fast else "0"},
+        stdout=None if args.verbose else asyncio.subprocess.DEVNULL, stderr=None if args.verbose else asyncio.subprocess.DEVNULL,
+    )
+    try:
+        await asyncio.wait_for(mock.ready.wait(), args.startup_timeout)
+        try:
+            await asyncio.wait_for(mock.commands_synced.wait(), args.startup_timeout)
+        except asyncio.TimeoutError:
+            pass  # bots that don't sync commands still get component traffic
+
+        traffic = build_traffic(args)
+        if not args.include_unregistered:
+            dropped = traffic.restrict(set(mock.commands))
+            if dropped:
+                print(f"ℹ️ {args.bot} does not handle {', '.join(sorted(dropped))} — left out "
+                      f"(--include-unregistered sends them anyway)")
+        stream = traffic.replay(args.speedup) if args.mode == "replay" else traffic.synth(args.rate)
+        print(f"🚀 {args.mode} traffic → {args.bot} for {args.duration}s "
+              f"({', '.join(f'{k}×{v}' for k, v in traffic.weights.most_common(6))})")
+        return await mock.drive(stream, args.duration, args.privileged, random.Random(args.seed))
+    finally:
+        if child.returncode is None:
+            child.send_signal(signal.SIGINT)
+            try:
+                await asyncio.wait_for(child.wait(), 10)
+            except asyncio.TimeoutError:
+                child.kill()
+        await mock.stop()
+
+
+async def serve(args):
+    mock = MockDiscord(port=args.port, members=args.members,
+                       rate_limiter=RateLimiter(args.bucket_limit, args.bucket_window, args.global_rate, args.inject_429),
+                       owner_role_id=harness.OWNER_ROLE_ID)
+    await mock.start()
+    print(f"🛰 Mock Discord on {mock.api_base} (gateway {mock.gateway_url})")
+    await mock.ready.wait()
+    traffic = build_traffic(args)
+    stream = traffic.replay(args.speedup) if args.mode == "replay" else traffic.synth(args.rate)
+    summary = await mock.drive(stream, args.duration, args.privileged)
+    print(format_summary(summary))
+    await mock.stop()
+
+
+def format_comparison(summaries: dict) -> str:
+    rows = [("throughput/s", "throughput_per_s"), ("p50 ms", "p50_ms"), ("p95 ms", "p95_ms"),
+            ("p99 ms", "p99_ms"), ("error rate", "error_rate")]
+    lines = [f"{'':<14}" + "".join(f"{name:>12}" for name in summaries)]
+    for label, key in rows:
+        lines.append(f"{label:<14}" + "".join(f"{str(s.get(key)):>12}" for s in summaries.values()))
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadtest")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    bot = sub.add_parser("bot", help="run a bot against a mock")
+    bot.add_argument("name")
+    bot.add_argument("--api", required=True)
+    bot.add_argument("--web-port", type=int, default=18080)
+    bot.add_argument("--session-dir", help="where the bot saves its gateway session (RESUME)")
+
+    for p in (sub.add_parser("run", help="mock + bot + traffic + report"), sub.add_parser("serve", help="mock only")):
+        if p.prog.endswith("run"):
+            p.add_argument("bot")
+            p.add_argument("--web-port", type=int, default=18080, help="port for the bot's own health server")
+            p.add_argument("--startup-timeout", type=float, default=30.0)
+            p.add_argument("--include-unregistered", action="store_true",
+                           help="also send commands / buttons the bot did not register")
+            p.add_argument("--runtime", choices=("stdlib", "fast", "both"), default="stdlib",
+                           help="bot runtime profile: asyncio + json, uvloop + orjson, or one run of each")
+            p.add_argument("--json", dest="json_out", help="also write the report as JSON here")
+            p.add_argument("-v", "--verbose", action="store_true", help="show the bot's output")
+        p.add_argument("--port", type=int, default=0, help="mock port (0 = any free port)")
+        p.add_argument("--mode", choices=("synth", "replay"), default="synth")
+        p.add_argument("--rate", type=float, default=200.0, help="synth: interactions per second")
+        p.add_argument("--speedup", type=float, default=1000.0, help="replay: time compression factor")
+        p.add_argument("--duration", type=float, default=20.0)
+        p.add_argument("--log", default=DEFAULT_LOG, help="command log the traffic mix is learnt from")
+        p.add_argument("--amplify-only", nargs="*", help="only replay commands starting with these, e.g. panel open_ticket:")
+        p.add_argument("--members", type=int, default=50)
+        p.add_argument("--privileged", type=float, default=1.0, help="share of interactions sent by the guild owner")
+        p.add_argument("--bucket-limit", type=int, default=5)
+        p.add_argument("--bucket-window", type=float, default=5.0)
+        p.add_argument("--global-rate", type=int, default=50)
+        p.add_argument("--inject-429", type=float, default=0.0, help="extra random 429 probability per REST call")
+        p.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == "bot":
+        run_bot(args.name, args.api, args.web_port, args.session_dir)
+        return 0
+    if args.command == "serve":
+        if args.port == 0:
+            args.port = 8765
+        try:
+            asyncio.run(serve(args))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    profiles = ("stdlib", "fast") if args.runtime == "both" else (args.runtime,)
+    summaries = {}
+    for profile in profiles:
+        if len(profiles) > 1:
+            print(f"\n===== runtime: {profile} =====")
+        summaries[profile] = asyncio.run(run(args, fast=profile == "fast"))
+        print(format_summary(summaries[profile]))
+    if len(profiles) > 1:
+        print("\n" + format_comparison(summaries))
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(summaries if len(profiles) > 1 else summaries[profiles[0]], f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
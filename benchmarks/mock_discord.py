@@ -0,0 +1,565 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: mock Discord
+# Local gateway + REST stand-in a discord.py bot can connect to. It pushes
+# synthetic INTERACTION_CREATE traffic, answers REST calls (with Discord-style
+# rate-limit headers and injected 429s) and measures how the bot responds.
+# ==================================================
+
+import asyncio
+import bisect
+import collections
+import hashlib
+import itertools
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+
+from aiohttp import WSMsgType, web
+
+API_PREFIX = "/api/v10"
+INTERACTION_WINDOW = 3.0  # Discord drops interactions that are not answered within 3 s
+
+# Gateway opcodes
+DISPATCH, HEARTBEAT, IDENTIFY, RESUME, REQUEST_MEMBERS, HELLO, HEARTBEAT_ACK = 0, 1, 2, 6, 8, 10, 11
+
+_ids = itertools.count((int(time.time() * 1000) - 1420070400000) << 22)
+
+
+def snowflake() -> str:
+    return str(next(_ids))
+
+
+def _iso(ts: float | None = None) -> str:
+    return datetime.fromtimestamp(ts or time.time(), timezone.utc).isoformat()
+
+
+def _json_response(data, status: int = 200, headers: dict | None = None) -> web.Response:
+    # discord.py only decodes JSON when Content-Type is exactly "application/json" (no charset)
+    body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return web.Response(body=body, status=status, headers={**(headers or {}), "Content-Type": "application/json"})
+
+
+def _percentile(sorted_values: list, q: float) -> float | None:
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+# ==============================
+# 🧪 Traffic model
+# ==============================
+def load_command_log(path: str) -> list[tuple[float, str]]:
+    """``(timestamp, cmd)`` pairs from a utils.log_to_json command log."""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+                ts = datetime.fromisoformat(entry["timestamp"]).timestamp()
+                entries.append((ts, entry["data"]["cmd"]))
+            except (ValueError, KeyError, TypeError):
+                continue
+    entries.sort()
+    return entries
+
+
+def is_component(cmd: str) -> bool:
+    """``open_ticket:Purchases`` style names are button/select custom IDs, the rest slash commands."""
+    return ":" in cmd
+
+
+class TrafficModel:
+    """Command mix and inter-arrival pattern learnt from a command log.
+
+    ``synth`` draws a Poisson stream at any rate with the recorded mix;
+    ``replay`` walks the recorded sequence with its gaps divided by ``speedup``."""
+
+    def __init__(self, entries: list[tuple[float, str]], seed: int | None = None):
+        self.entries = entries
+        self.rng = random.Random(seed)
+        self.weights = collections.Counter(cmd for _, cmd in entries)
+        self._rebuild()
+
+    def _rebuild(self):
+        self._names = list(self.weights)
+        self._cumulative = list(itertools.accumulate(self.weights[n] for n in self._names))
+
+    def restrict(self, allowed) -> list[str]:
+        """Keep only commands in ``allowed``; returns the ones that were dropped."""
+        dropped = [n for n in self.weights if n not in allowed]
+        for n in dropped:
+            del self.weights[n]
+        self.entries = [(ts, cmd) for ts, cmd in self.entries if cmd in self.weights]
+        if not self.weights:
+            self.weights.update({n: 1 for n in allowed})
+        self._rebuild()
+        return dropped
+
+    def pick(self) -> str:
+        x = self.rng.random() * self._cumulative[-1]
+        return self._names[bisect.bisect_right(self._cumulative, x)]
+
+    def synth(self, rate: float):
+        """Endless ``(delay, cmd)`` stream with exponential inter-arrival times."""
+        while True:
+            yield self.rng.expovariate(rate), self.pick()
+
+    def replay(self, speedup: float, max_gap: float = 5.0):
+        """Endless replay of the recorded sequence; idle gaps longer than ``max_gap`` are cut."""
+        if len(self.entries) < 2:
+            yield from self.synth(speedup)
+            return
+        while True:
+            previous = self.entries[0][0]
+            for ts, cmd in self.entries:
+                yield min(ts - previous, max_gap) / speedup, cmd
+                previous = ts
+
+# ==============================
+# 🚦 Rate limits
+# ==============================
+_MAJOR = {"channels", "guilds", "webhooks"}
+
+
+def bucket_key(method: str, path: str) -> str:
+    """Discord buckets by route with only the major parameter kept (channel / guild / webhook)."""
+    parts = path.strip("/").split("/")
+    out = []
+    for i, part in enumerate(parts):
+        if part.isdigit() and not (i and parts[i - 1] in _MAJOR):
+            out.append("{id}")
+        elif i >= 2 and parts[i - 1].isdigit() and parts[i - 2] in ("interactions", "webhooks"):
+            out.append("{token}")
+        else:
+            out.append(part)
+    return f"{method} /{'/'.join(out)}"
+
+
+class RateLimiter:
+    """Per-route fixed-window buckets plus a global per-second cap, answering with
+    the same headers and 429 bodies as Discord. ``inject`` adds random 429s on
+    top (e.g. 0.01 = 1 % of otherwise allowed requests)."""
+
+    def __init__(self, limit: int = 5, window: float = 5.0, global_rate: int = 50,
+                 inject: float = 0.0, rng: random.Random | None = None):
+        self.limit = limit
+        self.window = window
+        self.global_rate = global_rate
+        self.inject = inject
+        self.rng = rng or random.Random()
+        self._buckets: dict[str, list] = {}  # key -> [window_start, used]
+        self._global = [0.0, 0]
+        self.stats = collections.Counter()
+
+    @staticmethod
+    def _limited(retry_after: float, scope: str) -> tuple[int, dict, dict]:
+        headers = {"Retry-After": str(max(1, round(retry_after))), "X-RateLimit-Scope": scope}
+        if scope == "global":
+            headers["X-RateLimit-Global"] = "true"
+        body = {"message": "You are being rate limited.", "retry_after": round(retry_after, 3),
+                "global": scope == "global", "code": 0}
+        return 429, headers, body
+
+    def check(self, method: str, path: str, now: float | None = None, inject: bool = True):
+        """``None`` when the request may go through, else ``(status, headers, body)``;
+        headers for allowed requests are available from :meth:`headers`."""
+        now = time.monotonic() if now is None else now
+        g = self._global
+        if now - g[0] >= 1.0:
+            g[0], g[1] = now, 0
+        if self.global_rate and g[1] >= self.global_rate:
+            self.stats["global"] += 1
+            return self._limited(1.0 - (now - g[0]), "global")
+        key = bucket_key(method, path)
+        b = self._buckets.setdefault(key, [now, 0])
+        if now - b[0] >= self.window:
+            b[0], b[1] = now, 0
+        if b[1] >= self.limit:
+            self.stats["bucket"] += 1
+            return self._limited(self.window - (now - b[0]), "user")
+        if inject and self.inject and self.rng.random() < self.inject:
+            self.stats["injected"] += 1
+            return self._limited(self.rng.uniform(0.2, 2.0), "shared")
+        g[1] += 1
+        b[1] += 1
+        return None
+
+    def headers(self, method: str, path: str, now: float | None = None) -> dict:
+        now = time.monotonic() if now is None else now
+        key = bucket_key(method, path)
+        start, used = self._buckets.get(key, (now, 0))
+        reset_after = max(0.0, self.window - (now - start))
+        return {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(max(0, self.limit - used)),
+            "X-RateLimit-Reset": f"{time.time() + reset_after:.3f}",
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            "X-RateLimit-Bucket": hashlib.md5(key.encode()).hexdigest()[:16],
+        }
+
+# ==============================
+# 📊 Results
+# ==============================
+class LoadStats:
+    def __init__(self):
+        self.sent = collections.Counter()
+        self.answered = collections.Counter()
+        self.error_replies = collections.Counter()
+        self.timeouts = collections.Counter()
+        self.latency: dict[str, list] = collections.defaultdict(list)
+        self.rest = collections.Counter()
+        self.rest_errors = collections.Counter()
+        self.started = self.finished = None
+
+    def summary(self, rate_stats: collections.Counter | None = None) -> dict:
+        elapsed = (self.finished or time.monotonic()) - (self.started or time.monotonic())
+        commands = {}
+        everything = []
+        for name in sorted(self.sent):
+            values = sorted(self.latency[name])
+            everything.extend(values)
+            commands[name] = {
+                "sent": self.sent[name],
+                "answered": self.answered[name],
+                "error_replies": self.error_replies[name],
+                "timeouts": self.timeouts[name],
+                "p50_ms": _ms(_percentile(values, 0.50)),
+                "p95_ms": _ms(_percentile(values, 0.95)),
+                "p99_ms": _ms(_percentile(values, 0.99)),
+            }
+        everything.sort()
+        sent = sum(self.sent.values())
+        failed = sum(self.timeouts.values()) + sum(self.error_replies.values())
+        return {
+            "duration_s": round(elapsed, 2),
+            "sent": sent,
+            "answered": sum(self.answered.values()),
+            "throughput_per_s": round(sum(self.answered.values()) / elapsed, 1) if elapsed > 0 else None,
+            "error_rate": round(failed / sent, 4) if sent else 0.0,
+            "p50_ms": _ms(_percentile(everything, 0.50)),
+            "p95_ms": _ms(_percentile(everything, 0.95)),
+            "p99_ms": _ms(_percentile(everything, 0.99)),
+            "commands": commands,
+            "rest": dict(self.rest.most_common()),
+            "rest_errors": dict(self.rest_errors),
+            "rate_limited": dict(rate_stats or {}),
+        }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def format_summary(s: dict) -> str:
+    lines = [
+        f"⏱ {s['duration_s']} s • sent {s['sent']} • answered {s['answered']} "
+        f"• {s['throughput_per_s']}/s • error rate {s['error_rate'] * 100:.2f} %",
+        f"   latency p50 {s['p50_ms']} ms • p95 {s['p95_ms']} ms • p99 {s['p99_ms']} ms",
+        "",
+        f"{'command':<28} {'sent':>7} {'ok':>7} {'err':>5} {'t/o':>5} {'p50 ms':>8} {'p99 ms':>8}",
+    ]
+    for name, c in s["commands"].items():
+        lines.append(f"{name[:28]:<28} {c['sent']:>7} {c['answered']:>7} {c['error_replies']:>5} "
+                     f"{c['timeouts']:>5} {c['p50_ms'] or '—':>8} {c['p99_ms'] or '—':>8}")
+    if s["rate_limited"]:
+        lines.append("")
+        lines.append("🚦 429s returned: " + ", ".join(f"{k} {v}" for k, v in s["rate_limited"].items()))
+    if s["rest"]:
+        lines.append("🌐 REST calls: " + ", ".join(f"{k} ×{v}" for k, v in list(s["rest"].items())[:8]))
+    return "\n".join(lines)
+
+# ==============================
+# 🛰 Server
+# ==============================
+class MockDiscord:
+    """One guild, one text channel, ``members`` synthetic members (member 0 owns the guild)."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, members: int = 50,
+                 rate_limiter: RateLimiter | None = None, owner_role_id: int | None = None):
+        self.host = host
+        self.port = port
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.stats = LoadStats()
+        self.application_id = snowflake()
+        self.bot_user = {"id": self.application_id, "username": "nuvix-bot", "discriminator": "0",
+                         "global_name": None, "avatar": None, "bot": True, "flags": 0}
+        self.guild_id = snowflake()
+        self.channel_id = snowflake()
+        self.owner_role_id = str(owner_role_id) if owner_role_id else snowflake()
+        self.users = [{"id": snowflake(), "username": f"user{i}", "discriminator": "0", "global_name": None,
+                       "avatar": None, "bot": False, "flags": 0} for i in range(max(1, members))]
+        self.commands: dict[str, dict] = {}
+        self.ready = asyncio.Event()
+        self.commands_synced = asyncio.Event()
+        self._ws = None
+        self._seq = 0
+        self.session_id = None
+        self.resumes = 0
+        self.identifies = 0
+        self._pending: dict[str, tuple[float, str]] = {}
+        self._waiters: dict[str, asyncio.Future] = {}
+        self._runner = None
+
+    @property
+    def api_base(self) -> str:
+        return f"http://{self.host}:{self.port}{API_PREFIX}"
+
+    @property
+    def gateway_url(self) -> str:
+        return f"ws://{self.host}:{self.port}/gateway"
+
+    async def start(self):
+        app = web.Application(client_max_size=32 * 1024 * 1024)
+        app.router.add_get("/gateway", self._gateway)
+        app.router.add_route("*", API_PREFIX + "/{tail:.*}", self._rest)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if not self.port:
+            self.port = self._runner.addresses[0][1]
+
+    async def stop(self):
+        if self._ws is not None:
+            await self._ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    # ---- payloads ----
+    def _member(self, user: dict, roles=()) -> dict:
+        return {"user": user, "roles": list(roles), "joined_at": _iso(), "deaf": False, "mute": False,
+                "flags": 0, "nick": None, "avatar": None, "pending": False}
+
+    def _guild(self) -> dict:
+        role = {"id": self.owner_role_id, "name": "Owner", "permissions": "8", "position": 1, "color": 0,
+                "hoist": False, "managed": False, "mentionable": False, "flags": 0}
+        everyone = dict(role, id=self.guild_id, name="@everyone", permissions="0", position=0)
+        channel = {"id": self.channel_id, "type": 0, "name": "general", "position": 0, "guild_id": self.guild_id,
+                   "permission_overwrites": [], "parent_id": None, "nsfw": False, "topic": None}
+        members = [self._member(u, [self.owner_role_id] if i == 0 else []) for i, u in enumerate(self.users)]
+        members.append(self._member(self.bot_user))
+        return {
+            "id": self.guild_id, "name": "Nuvix Load Test", "icon": None, "owner_id": self.users[0]["id"],
+            "roles": [everyone, role], "channels": [channel], "members": members, "member_count": len(members),
+            "large": False, "unavailable": False, "features": [], "emojis": [], "stickers": [], "threads": [],
+            "stage_instances": [], "guild_scheduled_events": [], "voice_states": [], "presences": [],
+            "premium_tier": 0, "preferred_locale": "en-US", "nsfw_level": 0, "mfa_level": 0,
+            "verification_level": 0, "explicit_content_filter": 0, "default_message_notifications": 0,
+            "system_channel_flags": 0, "afk_timeout": 300, "joined_at": _iso(),
+        }
+
+    def _application(self) -> dict:
+        return {"id": self.application_id, "name": "nuvix-bot", "icon": None, "description": "", "summary": "",
+                "bot_public": True, "bot_require_code_grant": False, "verify_key": "0" * 64, "flags": 0,
+                "owner": self.users[0], "team": None, "rpc_origins": [], "tags": []}
+
+    def _message(self, content: str = "", **extra) -> dict:
+        return {
+            "id": snowflake(), "channel_id": self.channel_id, "guild_id": self.guild_id, "author": self.bot_user,
+            "content": content, "timestamp": _iso(), "edited_timestamp": None, "tts": False,
+            "mention_everyone": False, "mentions": [], "mention_roles": [], "attachments": [], "embeds": [],
+            "pinned": False, "type": 0, "flags": 0, "components": [], **extra,
+        }
+
+    def _interaction(self, cmd: str, user_index: int) -> dict:
+        user = self.users[user_index % len(self.users)]
+        payload = {
+            "id": snowflake(), "application_id": self.application_id, "token": uuid.uuid4().hex,
+            "guild_id": self.guild_id, "channel_id": self.channel_id,
+            "channel": {"id": self.channel_id, "type": 0, "name": "general", "guild_id": self.guild_id},
+            "member": dict(self._member(user, [self.owner_role_id] if user_index == 0 else []), permissions="8"),
+            "version": 1, "locale": "en-US", "guild_locale": "en-US", "app_permissions": "8",
+            "entitlements": [], "authorizing_integration_owners": {}, "context": 0,
+        }
+        if is_component(cmd):
+            payload["type"] = 3
+            payload["data"] = {"custom_id": cmd, "component_type": 2}
+            payload["message"] = self._message("panel")
+        else:
+            payload["type"] = 2
+            command = self.commands.get(cmd, {"id": snowflake()})
+            payload["data"] = {"id": command["id"], "name": cmd, "type": 1, "options": []}
+        return payload
+
+    # ---- gateway ----
+    async def _send(self, op: int, d=None, t: str | None = None):
+        frame = {"op": op, "d": d, "s": None, "t": t}
+        if op == DISPATCH:
+            self._seq += 1
+            frame["s"] = self._seq
+        await self._ws.send_str(json.dumps(frame, separators=(",", ":")))
+
+    async def _gateway(self, request):
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        self._ws = ws
+        await self._send(HELLO, {"heartbeat_interval": 41250})
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            frame = json.loads(msg.data)
+            op = frame.get("op")
+            if op == HEARTBEAT:
+                await self._send(HEARTBEAT_ACK)
+            elif op == IDENTIFY:
+                await self._identify()
+            elif op == RESUME:
+                await self._resume(frame["d"])
+            elif op == REQUEST_MEMBERS:
+                members = [self._member(u) for u in self.users]
+                await self._send(DISPATCH, {"guild_id": self.guild_id, "members": members, "chunk_index": 0,
+                                            "chunk_count": 1, "nonce": frame["d"].get("nonce")},
+                                 "GUILD_MEMBERS_CHUNK")
+        if self._ws is ws:
+            self._ws = None
+            self.ready.clear()
+        return ws
+
+    async def _identify(self):
+        self.identifies += 1
+        self.session_id = uuid.uuid4().hex
+        self._seq = 0
+        await self._send(DISPATCH, {
+            "v": 10, "user": self.bot_user, "guilds": [{"id": self.guild_id, "unavailable": True}],
+            "session_id": self.session_id, "resume_gateway_url": self.gateway_url, "shard": [0, 1],
+            "application": {"id": self.application_id, "flags": 0},
+        }, "READY")
+        await self._send(DISPATCH, self._guild(), "GUILD_CREATE")
+        self.ready.set()
+
+    async def _resume(self, d: dict):
+        if d.get("session_id") != self.session_id:
+            await self._ws.send_str(json.dumps({"op": 9, "d": False, "s": None, "t": None}))  # INVALID_SESSION
+            return
+        self.resumes += 1
+        await self._send(DISPATCH, {}, "RESUMED")
+        self.ready.set()
+
+    # ---- REST ----
+    async def _rest(self, request):
+        method, path = request.method, "/" + request.match_info["tail"]
+        key = bucket_key(method, path)
+        self.stats.rest[key] += 1
+        callback = path.startswith("/interactions/") and path.endswith("/callback")
+        if not callback:  # interaction callbacks are not rate limited by Discord
+            # random 429s only once traffic runs, so login and command sync stay reliable
+            limited = self.rate_limiter.check(method, path, inject=self.stats.started is not None)
+            if limited is not None:
+                status, headers, body = limited
+                self.stats.rest_errors[status] += 1
+                return _json_response(body, status=status, headers=headers)
+        headers = self.rate_limiter.headers(method, path)
+        payload = await self._json(request)
+
+        if callback:
+            self._answered(path.split("/")[2], payload)
+            return web.Response(status=204, headers=headers)
+        if path == "/users/@me":
+            return _json_response(self.bot_user, headers=headers)
+        if path in ("/oauth2/applications/@me", "/applications/@me"):
+            return _json_response(self._application(), headers=headers)
+        if path.endswith("/commands") and method == "PUT":
+            synced = []
+            for cmd in payload or []:
+                cmd = dict(cmd, id=snowflake(), application_id=self.application_id, version=snowflake())
+                self.commands[cmd["name"]] = cmd
+                synced.append(cmd)
+            self.commands_synced.set()
+            return _json_response(synced, headers=headers)
+        if path.endswith("/commands") and method == "GET":
+            return _json_response(list(self.commands.values()), headers=headers)
+        if method == "DELETE":
+            return web.Response(status=204, headers=headers)
+        if path.startswith(("/webhooks/", "/channels/")) and method in ("POST", "PATCH"):
+            content = (payload or {}).get("content") or ""
+            return _json_response(self._message(content, embeds=(payload or {}).get("embeds") or []),
+                                     headers=headers)
+        return _json_response({}, headers=headers)
+
+    @staticmethod
+    async def _json(request):
+        if not request.can_read_body:
+            return None
+        try:
+            if request.content_type == "multipart/form-data":
+                reader = await request.multipart()
+                async for part in reader:
+                    if part.name == "payload_json":
+                        return json.loads(await part.text())
+                return None
+            return await request.json()
+        except ValueError:
+            return None
+        except ConnectionResetError:
+            return None  # bot shut down mid-request
+
+    def _answered(self, interaction_id: str, payload: dict | None):
+        waiter = self._waiters.pop(interaction_id, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(time.monotonic())
+        pending = self._pending.pop(interaction_id, None)
+        if pending is None:
+            return  # late answer after the window, already counted as a timeout
+        sent_at, name = pending
+        latency = time.monotonic() - sent_at
+        if latency > INTERACTION_WINDOW:
+            self.stats.timeouts[name] += 1  # Discord would already have failed this one
+            return
+        self.stats.answered[name] += 1
+        self.stats.latency[name].append(latency)
+        data = (payload or {}).get("data") or {}
+        text = (data.get("content") or "") + " ".join(e.get("description") or "" for e in data.get("embeds") or [])
+        if "error" in text.lower():
+            self.stats.error_replies[name] += 1
+
+    # ---- traffic ----
+    async def dispatch_interaction(self, cmd: str, user_index: int = 0):
+        payload = self._interaction(cmd, user_index)
+        self._pending[payload["id"]] = (time.monotonic(), cmd)
+        self.stats.sent[cmd] += 1
+        await self._send(DISPATCH, payload, "INTERACTION_CREATE")
+
+    async def roundtrip(self, cmd: str = "status", timeout: float = INTERACTION_WINDOW) -> float | None:
+        """Send one interaction and wait for its answer; seconds taken, or None on timeout."""
+        payload = self._interaction(cmd, 0)
+        waiter = self._waiters[payload["id"]] = asyncio.get_running_loop().create_future()
+        sent_at = time.monotonic()
+        await self._send(DISPATCH, payload, "INTERACTION_CREATE")
+        try:
+            return await asyncio.wait_for(waiter, timeout) - sent_at
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._waiters.pop(payload["id"], None)
+
+    async def drive(self, stream, duration: float, privileged_ratio: float = 1.0, rng=None):
+        """Send interactions from a ``(delay, cmd)`` stream for ``duration`` seconds,
+        then wait out the answer window. Timing is open loop: slow answers don't slow the sender."""
+        rng = rng or random.Random()
+        await self.ready.wait()
+        self.stats.started = time.monotonic()
+        end = self.stats.started + duration
+        next_at = self.stats.started
+        for delay, cmd in stream:
+            next_at += delay
+            if next_at >= end:
+                break
+            wait = next_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if self._ws is None:
+                await self.ready.wait()
+            user = 0 if rng.random() < privileged_ratio else rng.randrange(1, max(2, len(self.users)))
+            await self.dispatch_interaction(cmd, user)
+        self.stats.finished = time.monotonic()
+        deadline = time.monotonic() + INTERACTION_WINDOW
+        while self._pending and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        for _, name in self._pending.values():
+            self.stats.timeouts[name] += 1
+        self._pending.clear()
+        return self.stats.summary(self.rate_limiter.stats)
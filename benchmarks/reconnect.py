@@ -0,0 +1,103 @@
+# ==================================================
+# Nuvix Suite — Benchmarks: reconnect time
+#   python -m benchmarks.reconnect nuvix_tickets --members 20000 --restarts 3
+# Restarts a bot against the mock Discord and measures how long it takes from
+# process start until it answers an interaction again: the first start always
+# IDENTIFYs, the following ones RESUME from the session saved on shutdown.
+# --no-resume deletes the saved session before every start (the old behaviour).
+# ==================================================
+
+import argparse
+import asyncio
+import shutil
+import signal
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks import harness
+from benchmarks.mock_discord import MockDiscord
+
+
+def _ms(seconds: float | None) -> str:
+    return "timeout" if seconds is None else f"{seconds * 1000:.0f} ms"
+
+
+async def start_bot(mock: MockDiscord, name: str, session_dir: str, web_port: int, verbose: bool):
+    return await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "benchmarks.loadtest", "bot", name, "--api", f"http://127.0.0.1:{mock.port}",
+        "--web-port", str(web_port), "--session-dir", session_dir, cwd=harness.ROOT_DIR,
+        stdout=None if verbose else asyncio.subprocess.DEVNULL, stderr=None if verbose else asyncio.subprocess.DEVNULL,
+    )
+
+
+async def first_answer(mock: MockDiscord, started: float, timeout: float) -> float | None:
+    """Seconds from ``started`` until the bot answers /status."""
+    deadline = started + timeout
+    while time.monotonic() < deadline:
+        if not mock.ready.is_set():
+            await asyncio.sleep(0.01)
+            continue
+        if await mock.roundtrip("status", timeout=0.5) is not None:
+            return time.monotonic() - started
+    return None
+
+
+async def measure(args) -> list[dict]:
+    mock = MockDiscord(port=0, members=args.members, owner_role_id=harness.OWNER_ROLE_ID)
+    await mock.start()
+    session_dir = tempfile.mkdtemp(prefix="nuvix_reconnect_")
+    runs = []
+    try:
+        for i in range(args.restarts + 1):
+            if args.no_resume:
+                shutil.rmtree(session_dir, ignore_errors=True)
+            identifies, resumes = mock.identifies, mock.resumes
+            started = time.monotonic()
+            child = await start_bot(mock, args.bot, session_dir, args.web_port, args.verbose)
+            answer = await first_answer(mock, started, args.timeout)
+            # on_ready syncs the command tree, so the PUT marks the moment the bot considers itself ready
+            try:
+                await asyncio.wait_for(mock.commands_synced.wait(), args.timeout)
+                ready = time.monotonic() - started
+            except asyncio.TimeoutError:
+                ready = None
+            kind = "resume" if mock.resumes > resumes else "identify" if mock.identifies > identifies else "?"
+            runs.append({"run": i, "kind": kind, "answer": answer, "ready": ready})
+            print(f"  run {i}: {kind:<8} first answer {_ms(answer)} • on_ready {_ms(ready)}")
+            child.send_signal(signal.SIGTERM)
+            await child.wait()
+            mock.ready.clear()
+            mock.commands_synced.clear()
+    finally:
+        await mock.stop()
+        shutil.rmtree(session_dir, ignore_errors=True)
+    return runs
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.reconnect")
+    parser.add_argument("bot")
+    parser.add_argument("--members", type=int, default=5000, help="guild size the mock sends on IDENTIFY")
+    parser.add_argument("--restarts", type=int, default=3)
+    parser.add_argument("--no-resume", action="store_true", help="discard the saved session before every start")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--web-port", type=int, default=18080)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    print(f"🔁 {args.bot}: {args.restarts} restarts, {args.members} members")
+    runs = asyncio.run(measure(args))
+    for kind in ("identify", "resume"):
+        mine = [r for r in runs if r["kind"] == kind]
+        if mine:
+            answer = [r["answer"] for r in mine if r["answer"] is not None]
+            ready = [r["ready"] for r in mine if r["ready"] is not None]
+            print(f"{kind:<8} median first answer {_ms(statistics.median(answer) if answer else None)} "
+                  f"• on_ready {_ms(statistics.median(ready) if ready else None)} over {len(mine)} start(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+# ==================================================
+# Nuvix Suite — Configuration
+# .env + environment parsed once into an immutable, validated Settings object.
+# Hot reload on SIGHUP or when .env changes; readers always see a complete snapshot.
+# ==================================================
+
+import asyncio
+import os
+import signal
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+ENV_FILE = os.getenv("NUVIX_ENV_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+
+BOT_TOKENS = {
+    "nuvix_ai": "NUVIX_AI_TOKEN",
+    "nuvix_apps": "NUVIX_APPS_TOKEN",
+    "nuvix_backup": "NUVIX_BACKUP_TOKEN",
+    "nuvix_information": "NUVIX_INFORMATION_TOKEN",
+    "nuvix_invoices": "NUVIX_INVOICES_TOKEN",
+    "nuvix_machine": "NUVIX_MACHINE_TOKEN",
+    "nuvix_management": "NUVIX_MANAGEMENT_TOKEN",
+    "nuvix_sanctions": "NUVIX_SANCTIONS_TOKEN",
+    "nuvix_system": "NUVIX_SYSTEM_TOKEN",
+    "nuvix_tickets": "NUVIX_TICKETS_TOKEN",
+}
+
+
+class ConfigError(Exception):
+    """Raised with every problem found while validating the configuration."""
+
+    def __init__(self, problems: list[str]):
+        super().__init__("Invalid configuration:\n  - " + "\n  - ".join(problems))
+        self.problems = problems
+
+# ==============================
+# 📄 .env parsing
+# ==============================
+def parse_env_file(path: str) -> dict[str, str]:
+    """KEY=VALUE lines; ignores blanks/comments, strips quotes and a leading ``export``."""
+    values = {}
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return values
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[7:].strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        elif " #" in value:
+            value = value.split(" #", 1)[0].rstrip()
+        values[key] = value
+    return values
+
+# ==============================
+# 🧾 Settings
+# ==============================
+def _parse_ids(value: str) -> frozenset[int]:
+    return frozenset(int(x) for x in value.replace(" ", "").split(",") if x)
+
+
+def _parse_color(value: str) -> int:
+    value = value.strip().lower().removeprefix("#")
+    return int(value, 16)
+
+
+_TRUE = {"1", "true", "yes", "on"}
+
+_PARSERS = {
+    "int": lambda v: int(v, 0),
+    "float": float,
+    "bool": lambda v: v.strip().lower() in _TRUE,
+    "ids": _parse_ids,
+}
+_KIND_NAMES = {"int": "integer", "float": "number", "bool": "boolean", "ids": "comma-separated ID list"}
+
+# Bot-specific knobs read through Settings.get_int/get_float/get_bool/get_ids. They are
+# parsed when a snapshot is built, so a bad value fails validation instead of raising
+# wherever a bot first reads it. Add new knobs here.
+TYPED_KEYS = {
+    "AI_CACHE_SIZE": "int",
+    "AI_CACHE_TTL": "float",
+    "AI_CONCURRENCY": "int",
+    "AI_QUEUE_PER_USER": "int",
+    "AI_QUEUE_SIZE": "int",
+    "AI_STREAM_EDIT_INTERVAL": "float",
+    "APPS_PAGE_SIZE": "int",
+    "BULK_CHECKPOINT_EVERY": "int",
+    "GATEWAY_RESUME_WINDOW": "float",
+    "INFORMATION_PRESENCES": "bool",
+    "INVOICES_RENDER_WORKERS": "int",
+    "MUTED_ROLE_ID": "int",
+    "NUVIX_FAST_RUNTIME": "bool",
+    "NUVIX_LAG_INTERVAL": "float",
+    "SANCTIONS_BATCH_SIZE": "int",
+    "SANCTIONS_CONCURRENCY": "int",
+    "SANCTIONS_RATE": "float",
+    "STATS_RECONCILE_INTERVAL": "float",
+    "TELEMETRY_INTERVAL": "float",
+    "TICKET_CATEGORY_IDS": "ids",
+    "TICKETS_ARCHIVE_AFTER_DAYS": "float",
+    "TICKETS_COMPACT_EVERY_HOURS": "float",
+    "TICKETS_RENDER_WORKERS": "int",
+    "TICKETS_ROLLUP_FLUSH_SECONDS": "float",
+    "TICKETS_SEGMENT_MB": "int",
+}
+
+
+@dataclass(frozen=True)
+class Settings:
+    tokens: MappingProxyType
+    owner_role_id: int
+    owner_role_ids: frozenset
+    coowner_role_ids: frozenset
+    highstaff_role_ids: frozenset
+    staff_role_ids: frozenset
+    embed_color: int
+    banner_url: str
+    footer_text: str
+    logs_cmd_use_channel_id: int | None
+    port: int
+    raw: MappingProxyType
+    loaded_at: float
+    version: int = 0
+    _memo: dict = field(default_factory=dict, repr=False, compare=False)
+
+    def token(self, bot: str) -> str | None:
+        return self.tokens.get(bot)
+
+    # Typed lookups for bot-specific knobs. Each (name, type) is parsed once per snapshot.
+    def get(self, name: str, default: str | None = None) -> str | None:
+        return self.raw.get(name, default)
+
+    def _typed(self, name: str, default, kind, parse):
+        key = (name, kind)
+        if key not in self._memo:
+            value = self.raw.get(name)
+            self._memo[key] = default if value is None or value.strip() == "" else parse(value)
+        return self._memo[key]
+
+    def get_int(self, name: str, default: int = 0) -> int:
+        return self._typed(name, default, "int", _PARSERS["int"])
+
+    def get_float(self, name: str, default: float = 0.0) -> float:
+        return self._typed(name, default, "float", _PARSERS["float"])
+
+    def get_bool(self, name: str, default: bool = False) -> bool:
+        return self._typed(name, default, "bool", _PARSERS["bool"])
+
+    def get_ids(self, name: str) -> frozenset:
+        return self._typed(name, frozenset(), "ids", _PARSERS["ids"])
+
+
+def build_settings(raw: dict[str, str], version: int = 0, declared=()) -> Settings:
+    """Validate ``raw`` and build a Settings snapshot; raises ConfigError listing every problem.
+
+    Checked: the fields below, every :data:`TYPED_KEYS` knob, and ``*_ROLE_ID(S)``,
+    ``*_CHANNEL_ID`` and ``*_CATEGORY_IDS`` names listed in ``declared`` (the .env keys).
+    Anything else the process environment happens to contain is left alone."""
+    problems = []
+
+    def typed(name, default, parse, what):
+        value = raw.get(name)
+        if value is None or value.strip() == "":
+            return default
+        try:
+            return parse(value)
+        except ValueError:
+            problems.append(f"{name}={value!r} is not a valid {what}")
+            return default
+
+    for name in BOT_TOKENS.values():
+        value = raw.get(name)
+        if value and len(value) < 50:
+            problems.append(f"{name} does not look like a Discord bot token")
+    memo = {}
+    for name, kind in TYPED_KEYS.items():
+        value = typed(name, None, _PARSERS[kind], _KIND_NAMES[kind])
+        if value is not None:
+            memo[(name, kind)] = value
+    for name in declared:
+        if name in TYPED_KEYS:
+            continue
+        if name.endswith(("_ROLE_IDS", "_CATEGORY_IDS")):
+            typed(name, None, _parse_ids, "comma-separated ID list")
+        elif name.endswith(("_ROLE_ID", "_CHANNEL_ID")):
+            typed(name, None, int, "Discord ID")
+
+    settings = Settings(
+        tokens=MappingProxyType({bot: raw[var] for bot, var in BOT_TOKENS.items() if raw.get(var)}),
+        owner_role_id=typed("OWNER_ROLE_ID", 0, int, "Discord ID"),
+        owner_role_ids=typed("OWNER_ROLE_IDS", frozenset(), _parse_ids, "comma-separated ID list"),
+        coowner_role_ids=typed("COOWNER_ROLE_IDS", frozenset(), _parse_ids, "comma-separated ID list"),
+        highstaff_role_ids=typed("HIGHSTAFF_ROLE_IDS", frozenset(), _parse_ids, "comma-separated ID list"),
+        staff_role_ids=typed("STAFF_ROLE_IDS", frozenset(), _parse_ids, "comma-separated ID list"),
+        embed_color=typed("EMBED_COLOR_HEX", 0xE91E63, _parse_color, "hex colour"),  # default Nuvix pink
+        banner_url=raw.get("BANNER_URL", ""),
+        footer_text=raw.get("FOOTER_TEXT", "Nuvix Market • Your wishes, more cheap!"),
+        logs_cmd_use_channel_id=typed("LOGS_CMD_USE_CHANNEL_ID", None, int, "Discord ID"),
+        port=typed("PORT", 10000, int, "port number"),
+        raw=MappingProxyType(dict(raw)),
+        loaded_at=time.time(),
+        version=version,
+        _memo=memo,
+    )
+    if not 0 < settings.port < 65536:
+        problems.append(f"PORT={settings.port} is out of range")
+    if not 0 <= settings.embed_color <= 0xFFFFFF:
+        problems.append(f"EMBED_COLOR_HEX={raw.get('EMBED_COLOR_HEX')!r} is out of range")
+    if problems:
+        raise ConfigError(list(dict.fromkeys(problems)))
+    return settings
+
+
+def load_raw(env_file: str = ENV_FILE, environ=None) -> tuple[dict[str, str], frozenset]:
+    """.env values overlaid by the process environment (the environment wins), and the
+    names the .env file declares."""
+    raw = parse_env_file(env_file)
+    declared = frozenset(raw)
+    raw.update(os.environ if environ is None else environ)
+    return raw, declared
+
+# ==============================
+# 🔁 Current snapshot + hot reload
+# ==============================
+_current: Settings | None = None
+_listeners = []
+_env_mtime: float | None = None
+
+
+def _mtime(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def settings() -> Settings:
+    """The current snapshot. Cheap: a global read, no parsing."""
+    global _current, _env_mtime
+    if _current is None:
+        _env_mtime = _mtime(ENV_FILE)
+        raw, declared = load_raw(ENV_FILE)
+        _current = build_settings(raw, declared=declared)
+    return _current
+
+
+def on_reload(callback):
+    """Register ``callback(old, new)``; called after every successful reload."""
+    _listeners.append(callback)
+    return callback
+
+
+def reload() -> Settings:
+    """Re-read .env + environment and swap the snapshot. On validation errors the old
+    snapshot stays in place and the ConfigError propagates."""
+    global _current, _env_mtime
+    old = settings()
+    _env_mtime = _mtime(ENV_FILE)
+    raw, declared = load_raw(ENV_FILE)
+    new = build_settings(raw, version=old.version + 1, declared=declared)
+    _current = new
+    for callback in list(_listeners):
+        try:
+            callback(old, new)
+        except Exception as e:
+            print(f"⚠️ config reload listener failed: {e}")
+    return new
+
+
+def _safe_reload(reason: str):
+    try:
+        new = reload()
+        print(f"🔁 Configuration reloaded ({reason}) → v{new.version}")
+    except ConfigError as e:
+        print(f"⚠️ Configuration reload rejected ({reason}): {e}")
+
+
+async def watch(interval: float = 2.0):
+    """Reload on SIGHUP (POSIX) and whenever .env's mtime changes. Run as a background task."""
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGHUP, _safe_reload, "SIGHUP")
+    except (AttributeError, NotImplementedError, RuntimeError):
+        pass  # Windows / non-main thread: file watching still works
+    settings()
+    while True:
+        await asyncio.sleep(interval)
+        if _mtime(ENV_FILE) != _env_mtime:
+            _safe_reload(".env changed")
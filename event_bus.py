@@ -0,0 +1,392 @@
+# ==================================================
+# Nuvix Suite — Event bus
+# Typed publish/subscribe between bots: in-process dispatch always, and
+# cross-process over a Unix domain socket when the bots run as separate processes.
+# ==================================================
+
+import asyncio
+import os
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock / AF_UNIX asyncio support → in-process only
+    fcntl = None
+
+import serialization
+
+DEFAULT_SOCKET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "nuvix_bus.sock")
+
+# ==============================
+# 🏷 Typed events
+# ==============================
+TICKET_OPENED = "ticket.opened"
+TICKET_CLOSED = "ticket.closed"
+INVOICE_CREATED = "invoice.created"
+INVOICE_STATUS = "invoice.status"
+SANCTION_APPLIED = "sanction.applied"
+SANCTION_LIFTED = "sanction.lifted"
+ARCHIVE_COMPACTED = "archive.compacted"  # {"archived", "bytes", "sealed"}: old transcripts packed into segments
+COMMAND_USED = "log.cmd_use"  # every utils.log_to_json(name, ...) publishes "log.<name>"
+LOOP_LAG = "telemetry.loop_lag"  # {"pid", "lag_ms"}: every bot's event-loop lag, sampled by the bus (nuvix_machine)
+
+
+@dataclass
+class Event:
+    type: str
+    payload: dict
+    source: str = ""
+    ts: float = field(default_factory=time.time)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def encode(self) -> bytes:
+        return serialization.dumpb(asdict(self)) + b"\n"
+
+    @classmethod
+    def from_dict(cls, data) -> "Event":
+        """Rebuild an event received from another process; ValueError if it isn't one."""
+        try:
+            event = cls(**data)
+        except TypeError as e:
+            raise ValueError(f"not an event: {e}") from None
+        if not isinstance(event.type, str) or not isinstance(event.payload, dict):
+            raise ValueError("not an event: bad type or payload")
+        return event
+
+    @classmethod
+    def decode(cls, line: bytes) -> "Event":
+        return cls.from_dict(serialization.loads(line))
+
+
+@dataclass
+class TicketOpened:
+    type = TICKET_OPENED
+    guild_id: int
+    channel_id: int
+    user_id: int
+    category: str = ""
+
+
+@dataclass
+class TicketClosed:
+    type = TICKET_CLOSED
+    guild_id: int
+    channel_id: int
+    closed_by: int | None = None
+    transcript_path: str | None = None
+
+
+@dataclass
+class InvoiceCreated:
+    type = INVOICE_CREATED
+    invoice_id: int
+    customer_id: int
+    amount_cents: int
+    currency: str
+
+
+@dataclass
+class SanctionApplied:
+    type = SANCTION_APPLIED
+    guild_id: int
+    user_id: int
+    kind: str
+    expires_at: float | None = None
+    reason: str = ""
+
+
+def matches(pattern: str, event_type: str) -> bool:
+    """'*' matches everything, 'ticket.*' a whole family, anything else an exact type."""
+    if pattern == "*" or pattern == event_type:
+        return True
+    return pattern.endswith(".*") and event_type.startswith(pattern[:-1])
+
+# ==============================
+# 🚌 Bus
+# ==============================
+@dataclass
+class _Peer:
+    """Broker side of a connected bot: its subscriptions and a bounded outgoing queue."""
+    queue: deque
+    wakeup: asyncio.Event
+    patterns: set = field(default_factory=set)
+    sender: asyncio.Task | None = None
+
+
+class EventBus:
+    """Publish is synchronous and never blocks: local handlers are scheduled on the
+    running loop and remote delivery goes through an outgoing queue.
+
+    Cross-process: the first bot to grab ``<socket>.lock`` becomes the broker and
+    listens on the socket; the others connect to it. If the broker goes away the
+    survivors re-elect one among themselves."""
+
+    def __init__(self, socket_path: str | None = None, max_backlog: int = 1000, lag_interval: float = 0.0):
+        self.socket_path = socket_path or DEFAULT_SOCKET
+        self.source = ""
+        self.max_backlog = max_backlog
+        self.lag_interval = lag_interval  # seconds between LOOP_LAG events; 0 = off
+        self._loop = None
+        self._handlers: list[tuple[str, object]] = []
+        self._outbox = deque(maxlen=max_backlog)
+        self._wakeup = None
+        self._task = None
+        self._lag_task = None
+        self._lock_fd = None
+        self._server = None
+        self._peers: dict[asyncio.StreamWriter, _Peer] = {}
+        self._writer = None
+        self.role = "local"
+        self.stats = {"published": 0, "delivered": 0, "received": 0, "dropped": 0, "malformed": 0,
+                      "handler_errors": 0}
+
+    # ---- local API ----
+    def subscribe(self, pattern: str, handler=None):
+        """``bus.subscribe("ticket.*", fn)`` or as a decorator ``@bus.subscribe("ticket.closed")``."""
+        if handler is None:
+            return lambda fn: self.subscribe(pattern, fn)
+        self._handlers.append((pattern, handler))
+        self._send_subscriptions()
+        return handler
+
+    @property
+    def patterns(self) -> set:
+        return {p for p, _ in self._handlers}
+
+    def publish(self, event_type, payload: dict | None = None) -> Event:
+        """Publish ``(type, payload)`` or one of the typed event dataclasses.
+        Safe from any thread: calls from outside the bus's loop are handed over to it."""
+        if not isinstance(event_type, str):
+            payload, event_type = asdict(event_type), event_type.type
+        event = Event(event_type, payload or {}, self.source)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        loop = self._loop
+        if loop is not None and running is not loop and not loop.is_closed():
+            loop.call_soon_threadsafe(self._publish, event)
+        else:
+            self._publish(event)
+        return event
+
+    def _publish(self, event: Event):
+        self.stats["published"] += 1
+        self._dispatch(event)
+        if self._task is not None:
+            if len(self._outbox) == self._outbox.maxlen:
+                self.stats["dropped"] += 1
+            self._outbox.append(event)
+            self._wakeup.set()
+
+    def _dispatch(self, event: Event):
+        for pattern, handler in list(self._handlers):
+            if not matches(pattern, event.type):
+                continue
+            self.stats["delivered"] += 1
+            try:
+                result = handler(event)
+                if asyncio.iscoroutine(result):
+                    task = asyncio.get_running_loop().create_task(result)
+                    task.add_done_callback(self._handler_done)
+            except Exception as e:
+                self.stats["handler_errors"] += 1
+                print(f"⚠️ event handler for {event.type} failed: {e}")
+
+    def _handler_done(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["handler_errors"] += 1
+            print(f"⚠️ event handler failed: {task.exception()}")
+
+    # ---- lifecycle ----
+    async def start(self, source: str):
+        """Join the cross-process bus (no-op where Unix sockets are unavailable)."""
+        self.source = source
+        self._loop = asyncio.get_running_loop()
+        if self.lag_interval > 0 and self._lag_task is None:
+            self._lag_task = asyncio.create_task(self._report_lag(self.lag_interval))
+        if fcntl is None or not hasattr(asyncio, "start_unix_server") or self._task is not None:
+            return
+        os.makedirs(os.path.dirname(self.socket_path) or ".", exist_ok=True)
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            self._lag_task = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._teardown()
+
+    async def _teardown(self):
+        for w, peer in list(self._peers.items()):
+            peer.sender.cancel()
+            w.close()
+        self._peers.clear()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        self.role = "local"
+
+    async def _report_lag(self, interval: float):
+        """Publish how late this loop wakes up from a sleep, so one bot can chart them all."""
+        loop = asyncio.get_running_loop()
+        pid = os.getpid()
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            self.publish(LOOP_LAG, {"pid": pid, "lag_ms": round(max(0.0, (loop.time() - expected) * 1000), 2)})
+
+    def _try_lock(self) -> bool:
+        fd = os.open(self.socket_path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._lock_fd = fd
+        return True
+
+    async def _run(self):
+        while True:
+            try:
+                if self._try_lock():
+                    await self._serve()
+                else:
+                    await self._connect()
+            except asyncio.CancelledError:
+                raise
+            except OSError:
+                pass
+            await self._teardown()
+            await asyncio.sleep(0.5)
+
+    # ---- broker ----
+    async def _serve(self):
+        try:
+            os.unlink(self.socket_path)  # stale socket from a crashed broker
+        except FileNotFoundError:
+            pass
+        self._server = await asyncio.start_unix_server(self._on_peer, path=self.socket_path)
+        self.role = "broker"
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._outbox:
+                self._fanout(self._outbox.popleft(), sender=None)
+
+    def _fanout(self, event: Event, sender):
+        data = None
+        for writer, peer in list(self._peers.items()):
+            if writer is sender or not any(matches(p, event.type) for p in peer.patterns):
+                continue
+            if data is None:
+                data = event.encode()
+            if len(peer.queue) == peer.queue.maxlen:
+                self.stats["dropped"] += 1  # slow subscriber: its oldest event goes
+            peer.queue.append(data)
+            peer.wakeup.set()
+
+    async def _send_to_peer(self, writer: asyncio.StreamWriter, peer: "_Peer"):
+        """One writer per subscriber, draining after each batch so a slow one only fills its own queue."""
+        try:
+            while True:
+                await peer.wakeup.wait()
+                peer.wakeup.clear()
+                while peer.queue:
+                    writer.write(peer.queue.popleft())
+                await writer.drain()
+        except (ConnectionError, RuntimeError):
+            writer.close()
+
+    async def _on_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = self._peers[writer] = _Peer(deque(maxlen=self.max_backlog), asyncio.Event())
+        peer.sender = asyncio.create_task(self._send_to_peer(writer, peer))
+        try:
+            while line := await reader.readline():
+                try:
+                    msg = serialization.loads(line)
+                    op = msg.get("op")
+                    if op == "sub":
+                        patterns = {p for p in msg["patterns"] if isinstance(p, str)}
+                    elif op == "pub":
+                        event = Event.from_dict(msg["event"])
+                except (ValueError, TypeError, KeyError, AttributeError):
+                    self.stats["malformed"] += 1  # one bad line: skip it, keep the peer
+                    continue
+                if op == "sub":
+                    peer.patterns = patterns
+                elif op == "pub":
+                    self.stats["received"] += 1
+                    self._dispatch(event)
+                    self._fanout(event, sender=writer)
+        except (ConnectionError, ValueError, asyncio.CancelledError):
+            pass  # peer went away or we are shutting down
+        finally:
+            self._peers.pop(writer, None)
+            peer.sender.cancel()
+            writer.close()
+
+    # ---- client ----
+    def _send_subscriptions(self):
+        if self._writer is not None:
+            self._writer.write(serialization.dumpb({"op": "sub", "patterns": sorted(self.patterns)}) + b"\n")
+
+    async def _connect(self):
+        reader, self._writer = await asyncio.open_unix_connection(self.socket_path)
+        self.role = "client"
+        self._send_subscriptions()
+        sender = asyncio.create_task(self._pump())
+        try:
+            while line := await reader.readline():
+                try:
+                    event = Event.decode(line)
+                except ValueError:
+                    self.stats["malformed"] += 1
+                    continue
+                self.stats["received"] += 1
+                self._dispatch(event)
+        finally:
+            sender.cancel()
+
+    async def _pump(self):
+        while True:
+            while self._outbox:
+                event = self._outbox[0]
+                self._writer.write(serialization.dumpb({"op": "pub", "event": asdict(event)}) + b"\n")
+                self._outbox.popleft()
+            await self._writer.drain()
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+
+_bus: EventBus | None = None
+
+
+def bus() -> EventBus:
+    """Process-wide bus (bots sharing one interpreter share it)."""
+    global _bus
+    if _bus is None:
+        import config
+        _bus = EventBus(config.settings().get("NUVIX_BUS_SOCKET"),
+                        lag_interval=config.settings().get_float("NUVIX_LAG_INTERVAL", 5.0))
+    return _bus
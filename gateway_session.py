@@ -0,0 +1,248 @@
+# ==================================================
+# Nuvix Suite — Gateway sessions
+# Graceful shutdown that keeps the gateway session resumable, and RESUME instead
+# of a fresh IDENTIFY on the next start while Discord still holds the session.
+# ==================================================
+
+import asyncio
+import os
+import signal
+import sys
+import time
+
+import discord
+import yarl
+from discord.gateway import DiscordWebSocket
+
+import config
+import serialization
+
+SESSION_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "gateway")
+# Discord doesn't document how long a closed session stays resumable; a couple of minutes is safe.
+DEFAULT_WINDOW = 90.0
+
+# Tasks discord.py creates per interaction (slash commands / component callbacks / modals).
+_HANDLER_TASKS = ("CommandTree-invoker", "discord-ui-view-dispatch", "discord-ui-modal-dispatch")
+
+_pending: dict[int, dict] = {}  # id(client) -> saved session waiting for the first connect
+stats = {"resumed": 0, "identified": 0, "rejected": 0, "last_ready_seconds": None}
+
+# ==============================
+# 📸 Cache snapshot
+# ==============================
+# Only the parts of the cache the bots use (guild, roles, channels, members), in
+# GUILD_CREATE shape so discord.py can rebuild its objects from it.
+def _role_payload(role: discord.Role) -> dict:
+    return {
+        "id": str(role.id), "name": role.name, "permissions": str(role.permissions.value),
+        "position": role.position, "color": role.colour.value, "hoist": role.hoist,
+        "managed": role.managed, "mentionable": role.mentionable, "flags": 0,
+    }
+
+
+def _overwrite_payload(target, overwrite: discord.PermissionOverwrite) -> dict:
+    allow, deny = overwrite.pair()
+    is_role = isinstance(target, discord.Role) or getattr(target, "type", None) is discord.Role
+    return {"id": str(target.id), "type": 0 if is_role else 1, "allow": str(allow.value), "deny": str(deny.value)}
+
+
+def _channel_payload(channel) -> dict:
+    data = {
+        "id": str(channel.id), "type": channel.type.value, "name": channel.name, "position": channel.position,
+        "parent_id": str(channel.category_id) if channel.category_id else None,
+        "permission_overwrites": [_overwrite_payload(t, o) for t, o in channel.overwrites.items()],
+        "nsfw": getattr(channel, "nsfw", False), "topic": getattr(channel, "topic", None),
+        "rate_limit_per_user": getattr(channel, "slowmode_delay", 0), "flags": 0,
+    }
+    if hasattr(channel, "bitrate"):
+        data.update(bitrate=channel.bitrate, user_limit=channel.user_limit)
+    return data
+
+
+def _member_payload(member: discord.Member) -> dict:
+    return {
+        "user": {
+            "id": str(member.id), "username": member.name, "global_name": member.global_name,
+            "discriminator": member.discriminator, "avatar": member.avatar.key if member.avatar else None,
+            "bot": member.bot,
+        },
+        "roles": [str(r.id) for r in member.roles if not r.is_default()],
+        "joined_at": member.joined_at.isoformat() if member.joined_at else None,
+        "nick": member.nick, "deaf": False, "mute": False, "flags": 0, "pending": member.pending,
+    }
+
+
+def guild_payload(guild: discord.Guild) -> dict:
+    return {
+        "id": str(guild.id), "name": guild.name, "icon": guild.icon.key if guild.icon else None,
+        "owner_id": str(guild.owner_id), "member_count": guild.member_count, "large": guild.large,
+        "features": list(guild.features), "preferred_locale": str(guild.preferred_locale),
+        "roles": [_role_payload(r) for r in guild.roles],
+        "channels": [_channel_payload(c) for c in guild.channels],
+        "members": [_member_payload(m) for m in guild.members],
+    }
+
+
+def client_snapshot(client: discord.Client) -> dict:
+    user = client.user
+    return {
+        "user": {"id": str(user.id), "username": user.name, "global_name": user.global_name,
+                 "discriminator": user.discriminator, "avatar": user.avatar.key if user.avatar else None,
+                 "bot": True, "flags": 0},
+        "guilds": [guild_payload(g) for g in client.guilds],
+    }
+
+# ==============================
+# 💾 Session file
+# ==============================
+def session_path(name: str) -> str:
+    return os.path.join(config.settings().get("GATEWAY_SESSION_DIR", SESSION_DIR), f"{name}.json")
+
+
+def save(name: str, data: dict):
+    path = session_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)  # session IDs are sensitive
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        serialization.dump(data, f)
+    os.replace(tmp, path)
+
+
+def take(name: str, window: float) -> dict | None:
+    """Load and delete the saved session (a session can only be resumed once).
+    ``None`` when there is none or it is older than ``window`` seconds."""
+    path = session_path(name)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = serialization.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    finally:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+    if time.time() - data.get("saved_at", 0) > window:
+        return None
+    return data
+
+# ==============================
+# 🔌 RESUME on the first connect
+# ==============================
+_original_from_client = DiscordWebSocket.from_client.__func__
+
+
+def _restore(client: discord.Client, saved: dict) -> bool:
+    """Rebuild the cache a READY would have filled. Relies on discord.py 2.4 internals."""
+    state = client._connection
+    if client.user is None or str(client.user.id) != saved["user"]["id"]:
+        return False  # different token since the session was saved
+    try:
+        state.user = discord.ClientUser(state=state, data=saved["user"])
+        for payload in saved["guilds"]:
+            state._add_guild_from_data(payload)
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"⚠️ Could not restore the cached guild state ({e}); identifying instead")
+        state.clear(views=False)
+        return False
+    return True
+
+
+async def _from_client(cls, client, **kwargs):
+    saved = _pending.pop(id(client), None)
+    if saved is not None and kwargs.get("initial") and _restore(client, saved):
+        kwargs.update(resume=True, session=saved["session_id"], sequence=saved["sequence"],
+                      gateway=yarl.URL(saved["gateway"]))
+        client._nuvix_resuming = True
+    return await _original_from_client(cls, client, **kwargs)
+
+
+DiscordWebSocket.from_client = classmethod(_from_client)
+
+# ==============================
+# 🛑 Graceful shutdown
+# ==============================
+def _handler_tasks() -> list[asyncio.Task]:
+    current = asyncio.current_task()
+    return [t for t in asyncio.all_tasks()
+            if t is not current and not t.done() and t.get_name().startswith(_HANDLER_TASKS)]
+
+
+async def shutdown(client: discord.Client, name: str, on_shutdown=(), drain_timeout: float = 10.0):
+    """Stop taking events, let running handlers finish, run ``on_shutdown`` hooks,
+    save the session and close without invalidating it."""
+    if client.is_closed() or getattr(client, "_nuvix_stopping", False):
+        return
+    client._nuvix_stopping = True
+    ws = client.ws
+    session = None
+    if ws is not None and ws.session_id and ws.sequence is not None:
+        # Events after this sequence number are not handled here: Discord replays them after RESUME.
+        session = {"session_id": ws.session_id, "sequence": ws.sequence, "gateway": str(ws.gateway)}
+        ws._discord_parsers = {}
+
+    tasks = _handler_tasks()
+    if tasks:
+        print(f"⏳ {name}: waiting for {len(tasks)} interaction(s) to finish")
+        _, still_running = await asyncio.wait(tasks, timeout=drain_timeout)
+        if still_running:
+            print(f"⚠️ {name}: {len(still_running)} interaction(s) still running after {drain_timeout}s")
+
+    for hook in on_shutdown:
+        try:
+            result = hook()
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            print(f"⚠️ {name}: shutdown hook failed: {e}")
+
+    if session is not None and client.user is not None:
+        session.update(client_snapshot(client), saved_at=time.time())
+        save(name, session)
+        # Close codes 1000/1001 make Discord drop the session; discord.py's own close uses 1000.
+        ws.close = lambda code=4000: DiscordWebSocket.close(ws, code=4000)
+    print(f"🛑 {name} stopping" + (" (session saved for RESUME)" if session else ""))
+    sys.stdout.flush()
+    sys.stderr.flush()
+    await client.close()
+
+
+def install(client: discord.Client, name: str, on_shutdown=()):
+    """Call from ``main()`` before starting the bot: queues a saved session for RESUME
+    and turns SIGTERM / SIGINT into a graceful :func:`shutdown`."""
+    window = config.settings().get_float("GATEWAY_RESUME_WINDOW", DEFAULT_WINDOW)
+    saved = take(name, window) if window > 0 else None
+    if saved is not None:
+        _pending[id(client)] = saved
+    started = time.monotonic()
+
+    async def mark_ready(resumed: bool):
+        stats["last_ready_seconds"] = round(time.monotonic() - started, 3)
+        stats["resumed" if resumed else "identified"] += 1
+        print(f"⚡ {name} {'resumed' if resumed else 'identified'} in {stats['last_ready_seconds']}s")
+
+    async def on_ready():
+        if stats["last_ready_seconds"] is None:
+            if getattr(client, "_nuvix_resuming", False):
+                stats["rejected"] += 1  # Discord refused the RESUME; this READY came from IDENTIFY
+            client._nuvix_resuming = False
+            await mark_ready(False)
+
+    async def on_resumed():
+        if getattr(client, "_nuvix_resuming", False):
+            client._nuvix_resuming = False
+            await mark_ready(True)
+            # No READY comes after a RESUME: mark the restored cache ready and run on_ready handlers.
+            client._handle_ready()
+            client.dispatch("ready")
+
+    client.add_listener(on_ready, "on_ready")
+    client.add_listener(on_resumed, "on_resumed")
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, lambda: asyncio.ensure_future(shutdown(client, name, on_shutdown)))
+        except (AttributeError, NotImplementedError, RuntimeError):
+            pass  # Windows: Ctrl+C still stops the bot, just without saving the session
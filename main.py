@@ -3,28 +3,26 @@
 # Compatible con Python 3.13 y Render
 # ==================================================
 
-import os, subprocess, time
+import os, signal, subprocess, sys, time
+
+import config
 
 print("🚀 Starting Nuvix Suite Render Edition (patched launcher)")
 
+# Valida .env + entorno una sola vez antes de lanzar nada
+try:
+    settings = config.settings()
+except config.ConfigError as e:
+    print(f"❌ {e}")
+    sys.exit(1)
+
 # Lista de bots y sus variables de entorno
-BOTS = [
-    ("nuvix_ai", "NUVIX_AI_TOKEN"),
-    ("nuvix_apps", "NUVIX_APPS_TOKEN"),
-    ("nuvix_backup", "NUVIX_BACKUP_TOKEN"),
-    ("nuvix_information", "NUVIX_INFORMATION_TOKEN"),
-    ("nuvix_invoices", "NUVIX_INVOICES_TOKEN"),
-    ("nuvix_machine", "NUVIX_MACHINE_TOKEN"),
-    ("nuvix_management", "NUVIX_MANAGEMENT_TOKEN"),
-    ("nuvix_sanctions", "NUVIX_SANCTIONS_TOKEN"),
-    ("nuvix_system", "NUVIX_SYSTEM_TOKEN"),
-    ("nuvix_tickets", "NUVIX_TICKETS_TOKEN"),
-]
+BOTS = list(config.BOT_TOKENS.items())
 
 processes = []
 
 for folder, token_env in BOTS:
-    token = os.environ.get(token_env)
+    token = settings.token(folder)
     if not token:
         print(f"⚠️ Skipping {folder} — missing token variable ({token_env})")
         continue
@@ -47,6 +45,31 @@ for folder, token_env in BOTS:
     processes.append(p)
     time.sleep(2)
 
+# SIGHUP → cada bot recarga su configuración sin reiniciar el proceso
+if hasattr(signal, "SIGHUP"):
+    def forward_sighup(signum, frame):
+        print("🔁 Reloading configuration in all bots...")
+        for p in processes:
+            if p.poll() is None:
+                p.send_signal(signal.SIGHUP)
+
+    signal.signal(signal.SIGHUP, forward_sighup)
+
+# SIGTERM (redeploy) / CTRL + C → cada bot drena interacciones y guarda su sesión para RESUME
+def stop_all(signum=None, frame=None):
+    print("🛑 Stopping all bots...")
+    for p in processes:
+        if p.poll() is None:
+            p.terminate()
+    for p in processes:
+        try:
+            p.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            p.kill()
+    sys.exit(0)
+
+signal.signal(signal.SIGTERM, stop_all)
+
 print("✨ All available bots launched successfully.")
 print("💡 Press CTRL + C to stop all bots.")
 
@@ -54,6 +77,4 @@ try:
     while True:
         time.sleep(60)
 except KeyboardInterrupt:
-    print("🛑 Stopping all bots...")
-    for p in processes:
-        p.terminate()
+    stop_all()
@@ -1,13 +1,27 @@
-import os, time, asyncio
+import os, sys, time, asyncio, traceback
 from aiohttp import web
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+# Sibling modules live next to bot.py, shared ones (config, utils) in the repo root.
+# main.py exec()s this file from the repo root (no __file__).
+BOT_DIR = os.path.dirname(os.path.abspath(globals().get("__file__") or os.path.join("nuvix_ai", "bot.py")))
+ROOT_DIR = os.path.dirname(BOT_DIR)
+for _path in (ROOT_DIR, BOT_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import config
+import event_bus
+import gateway_session
+import runtime
+
+from completion import CompletionPipeline, TTLCache, backend_from_env, load_faq
+from inference_queue import InferenceQueue, QueueClosedError, QueueFullError, ThrottledEditor, render_prometheus
+
 BOT_NAME = "Nuvix Ai"
-TOKEN = os.getenv("NUVIX_AI_TOKEN")
-OWNER_ROLE_ID = int(os.getenv("OWNER_ROLE_ID", "0"))
-EMBED_COLOR = int(os.getenv("EMBED_COLOR_HEX", "0xE91E63"), 16)  # default Nuvix pink
+TOKEN = config.settings().token("nuvix_ai")
 
 UPTIME = time.time()
 
@@ -18,15 +32,35 @@ intents.members = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 tree = bot.tree
 
+pipeline = CompletionPipeline(
+    backend_from_env(config.settings().raw),
+    TTLCache(
+        max_entries=config.settings().get_int("AI_CACHE_SIZE", 1024),
+        ttl=config.settings().get_float("AI_CACHE_TTL", 3600),
+    ),
+)
+pipeline.seed_faq(load_faq(config.settings().get("AI_FAQ_PATH", os.path.join(ROOT_DIR, "data", "ai_faq.json"))))
+queue = InferenceQueue(
+    pipeline.backend,
+    concurrency=config.settings().get_int("AI_CONCURRENCY", 2),
+    max_size=config.settings().get_int("AI_QUEUE_SIZE", 200),
+    max_per_user=config.settings().get_int("AI_QUEUE_PER_USER", 3),
+)
+STREAM_EDIT_INTERVAL = config.settings().get_float("AI_STREAM_EDIT_INTERVAL", 1.5)
+
 async def health_handler(request):
     alive = int(time.time() - UPTIME)
     return web.Response(text=f"Nuvix Ai connected | alive {alive}s")
 
+async def metrics_handler(request):
+    return web.Response(text=render_prometheus(queue.snapshot()))
+
 async def run_web():
     app = web.Application()
     app.router.add_get("/", health_handler)
     app.router.add_get("/health", health_handler)
-    port = int(os.getenv("PORT", "10000"))
+    app.router.add_get("/metrics", metrics_handler)
+    port = config.settings().port
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
@@ -37,7 +71,8 @@ async def run_web():
 def owner_only(interaction: discord.Interaction) -> bool:
     if interaction.user is None or not interaction.guild:
         return False
-    if OWNER_ROLE_ID and any(r.id == OWNER_ROLE_ID for r in interaction.user.roles):
+    owner_role_id = config.settings().owner_role_id
+    if owner_role_id and any(r.id == owner_role_id for r in interaction.user.roles):
         return True
     # also allow guild owner and admins
     if interaction.user.id == interaction.guild.owner_id:
@@ -53,7 +88,7 @@ async def status(interaction: discord.Interaction):
     hours, mins = divmod(mins, 60)
     days, hours = divmod(hours, 24)
     human = (f"{days}d " if days else "") + (f"{hours}h " if hours else "") + (f"{mins}m {secs}s")
-    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=EMBED_COLOR)
+    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=config.settings().embed_color)
     embed.set_footer(text="Nuvix System • Connected")
     try:
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -67,6 +102,62 @@ async def status_error(interaction: discord.Interaction, error):
     else:
         await interaction.response.send_message("Unexpected error.", ephemeral=True)
 
+def answer_embed(text: str, footer: str = "Nuvix Ai • typing…") -> discord.Embed:
+    embed = discord.Embed(title="🤖 Nuvix Ai", description=text[:4096] or "…", color=config.settings().embed_color)
+    embed.set_footer(text=footer)
+    return embed
+
+@tree.command(name="ask", description="Ask the Nuvix support assistant a question.")
+@app_commands.describe(question="What do you need help with?")
+async def ask(interaction: discord.Interaction, question: str):
+    await interaction.response.defer(thinking=True)
+    started = time.perf_counter()
+    editor = ThrottledEditor(
+        lambda text: interaction.edit_original_response(embed=answer_embed(text + " ▌")),
+        interval=STREAM_EDIT_INTERVAL,
+    )
+
+    async def run_queued():
+        job = await queue.submit(interaction.user.id, interaction.guild_id, question,
+                                 {"guild": interaction.guild_id}, on_chunk=editor.append)
+        return await job.wait()
+
+    try:
+        answer = await pipeline.complete(question, {"guild": interaction.guild_id}, call=run_queued)
+    except (QueueFullError, QueueClosedError) as e:
+        await editor.stop()
+        await interaction.edit_original_response(content=str(e))
+        return
+    except Exception as e:
+        print(f"⚠️ /ask failed for {interaction.user.id} ({pipeline.backend.name} backend): {e!r}")
+        traceback.print_exc()
+        await editor.stop()
+        await interaction.edit_original_response(content="The assistant is unavailable right now, please try again later.")
+        return
+    await editor.stop()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    await interaction.edit_original_response(embed=answer_embed(answer, f"Nuvix Ai • {elapsed_ms:.0f} ms"))
+
+@tree.command(name="ai_cache", description="Show assistant cache and queue statistics (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def ai_cache(interaction: discord.Interaction):
+    stats = pipeline.stats
+    lines = [f"**{k}:** {v}" for k, v in stats.items()]
+    lines.append(f"**cached answers:** {len(pipeline.cache)} | **faq entries:** {len(pipeline.faq)}")
+    lines.append(f"**backend:** {pipeline.backend.name}")
+    q = queue.snapshot()
+    lines.append(f"**queue:** depth {q['depth']} | running {q['running']}/{q['concurrency']} | rejected {q['rejected']}")
+    lines.append(f"**wait:** p50 {q['wait_p50']:.2f}s · p95 {q['wait_p95']:.2f}s | **tok/s p50:** {q['tokens_per_sec_p50']:.1f}")
+    embed = discord.Embed(title="🗃 Assistant cache", description="\n".join(lines), color=config.settings().embed_color)
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+@ai_cache.error
+async def ai_cache_error(interaction: discord.Interaction, error):
+    if isinstance(error, app_commands.CheckFailure):
+        await interaction.response.send_message("You don't have permission to use this command.", ephemeral=True)
+    else:
+        await interaction.response.send_message("Unexpected error.", ephemeral=True)
+
 @bot.event
 async def on_ready():
     try:
@@ -78,12 +169,21 @@ async def on_ready():
 async def main():
     if not TOKEN:
         raise RuntimeError(f"Missing token env: NUVIX_AI_TOKEN")
+    queue.start()
+    config_task = asyncio.create_task(config.watch())
+    await event_bus.bus().start("nuvix_ai")
+    gateway_session.install(bot, "nuvix_ai", on_shutdown=[queue.stop, pipeline.backend.close, event_bus.bus().stop])
     web_task = asyncio.create_task(run_web())
     bot_task = asyncio.create_task(bot.start(TOKEN))
-    await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    try:
+        await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        config_task.cancel()
+        await queue.stop()
+        await pipeline.backend.close()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        runtime.run(main())
     except KeyboardInterrupt:
         pass
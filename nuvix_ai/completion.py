@@ -0,0 +1,258 @@
+# ==================================================
+# Nuvix Ai — Completion pipeline
+# Pluggable backends + LRU/TTL response cache + in-flight request coalescing
+# ==================================================
+
+import asyncio
+import hashlib
+import os
+import re
+import time
+from collections import OrderedDict
+
+import serialization
+
+# ==============================
+# 🔌 Backends
+# ==============================
+class CompletionBackend:
+    """Base interface: turn a prompt (+ optional context) into an answer."""
+
+    name = "base"
+
+    async def complete(self, prompt: str, context: dict | None = None) -> str:
+        raise NotImplementedError
+
+    async def stream(self, prompt: str, context: dict | None = None):
+        """Yield the answer in chunks. Backends without native streaming yield it whole."""
+        yield await self.complete(prompt, context)
+
+    async def close(self):
+        """Release connections; nothing to do for local backends."""
+
+
+class StubBackend(CompletionBackend):
+    """Local deterministic backend (no network, no quota). Used for tests and dev."""
+
+    name = "stub"
+
+    def __init__(self, answers: dict | None = None, delay: float = 0.0):
+        self.answers = {normalize_prompt(k): v for k, v in (answers or {}).items()}
+        self.delay = delay
+        self.calls = 0
+
+    def _answer(self, prompt: str) -> str:
+        answer = self.answers.get(normalize_prompt(prompt))
+        if answer is not None:
+            return answer
+        return f"[stub] I received your question: {prompt.strip()}"
+
+    async def complete(self, prompt: str, context: dict | None = None) -> str:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self._answer(prompt)
+
+    async def stream(self, prompt: str, context: dict | None = None):
+        self.calls += 1
+        words = self._answer(prompt).split(" ")
+        for i, word in enumerate(words):
+            if self.delay:
+                await asyncio.sleep(self.delay / len(words))
+            yield word if i == 0 else " " + word
+
+
+class HTTPBackend(CompletionBackend):
+    """OpenAI-compatible chat completions endpoint (AI_API_URL / AI_API_KEY / AI_MODEL)."""
+
+    name = "http"
+
+    def __init__(self, url: str, api_key: str = "", model: str = "gpt-4o-mini",
+                 system_prompt: str = "You are the Nuvix Market support assistant.", timeout: float = 60.0):
+        self.url = url
+        self.api_key = api_key
+        self.model = model
+        self.system_prompt = system_prompt
+        self.timeout = timeout
+        self._session = None
+
+    async def _get_session(self):
+        import aiohttp
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    def _request(self, prompt: str, context: dict | None, stream: bool):
+        messages = [{"role": "system", "content": self.system_prompt}]
+        if context:
+            messages.append({"role": "system", "content": f"Context: {serialization.dumps(context, sort_keys=True, default=str)}"})
+        messages.append({"role": "user", "content": prompt})
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        return {"model": self.model, "messages": messages, "stream": stream}, headers
+
+    async def complete(self, prompt: str, context: dict | None = None) -> str:
+        session = await self._get_session()
+        body, headers = self._request(prompt, context, stream=False)
+        async with session.post(self.url, json=body, headers=headers) as resp:
+            resp.raise_for_status()
+            payload = await resp.json()
+        return payload["choices"][0]["message"]["content"]
+
+    async def stream(self, prompt: str, context: dict | None = None):
+        session = await self._get_session()
+        body, headers = self._request(prompt, context, stream=True)
+        async with session.post(self.url, json=body, headers=headers) as resp:
+            resp.raise_for_status()
+            async for raw in resp.content:
+                line = raw.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                delta = serialization.loads(data)["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def backend_from_env(env=None) -> CompletionBackend:
+    """Pick the backend from AI_BACKEND (stub | http) in ``env`` (default: os.environ). Defaults to stub."""
+    env = os.environ if env is None else env
+    kind = env.get("AI_BACKEND", "stub").strip().lower()
+    if kind == "http":
+        url = env.get("AI_API_URL")
+        if not url:
+            raise RuntimeError("AI_BACKEND=http requires AI_API_URL")
+        return HTTPBackend(url, env.get("AI_API_KEY", ""), env.get("AI_MODEL", "gpt-4o-mini"))
+    return StubBackend()
+
+# ==============================
+# 🧮 Cache keys
+# ==============================
+_WS = re.compile(r"\s+")
+_TRAILING = re.compile(r"[\s?!.¿¡,;:]+$")
+_LEADING = re.compile(r"^[\s¿¡]+")
+
+def normalize_prompt(prompt: str) -> str:
+    """Lowercase, collapse whitespace and drop leading/trailing punctuation."""
+    text = _WS.sub(" ", prompt.strip().lower())
+    text = _LEADING.sub("", text)
+    return _TRAILING.sub("", text)
+
+def cache_key(prompt: str, context: dict | None = None) -> str:
+    ctx = serialization.dumps(context or {}, sort_keys=True, default=str)
+    raw = normalize_prompt(prompt) + "\x00" + ctx
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+# ==============================
+# 🗃 LRU + TTL cache
+# ==============================
+class TTLCache:
+    """OrderedDict-based LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600.0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._data: OrderedDict[str, tuple[float | None, str]] = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: str):
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires is not None and expires <= self.clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: float | None = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = self.clock() + ttl if ttl > 0 else None
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+# ==============================
+# 🚀 Pipeline
+# ==============================
+class CompletionPipeline:
+    """Cache lookup → coalesce identical in-flight requests → backend call."""
+
+    def __init__(self, backend: CompletionBackend, cache: TTLCache | None = None):
+        self.backend = backend
+        self.cache = cache or TTLCache()
+        self.faq: dict[str, str] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.stats = {"faq": 0, "hits": 0, "misses": 0, "coalesced": 0, "backend_calls": 0, "errors": 0}
+
+    def seed_faq(self, faq: dict):
+        """Register FAQ answers; they are served from memory (any context) without touching the backend."""
+        for question, answer in faq.items():
+            self.faq[normalize_prompt(question)] = answer
+
+    async def complete(self, prompt: str, context: dict | None = None, *, call=None) -> str:
+        """Answer a prompt. ``call`` (a zero-arg coroutine factory) replaces the plain
+        backend call for the leader of a cache miss, e.g. to route it through a queue."""
+        faq_answer = self.faq.get(normalize_prompt(prompt))
+        if faq_answer is not None:
+            self.stats["faq"] += 1
+            return faq_answer
+
+        key = cache_key(prompt, context)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached
+        self.stats["misses"] += 1
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                return await self.complete(prompt, context, call=call)  # leader was cancelled, retry
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            self.stats["backend_calls"] += 1
+            answer = await (call() if call is not None else self.backend.complete(prompt, context))
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            self.stats["errors"] += 1
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved when nobody else was waiting
+            raise
+        else:
+            self.cache.set(key, answer)
+            fut.set_result(answer)
+            return answer
+        finally:
+            self._inflight.pop(key, None)
+
+def load_faq(path) -> dict:
+    """Read a {question: answer} JSON file; missing file → empty FAQ."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return serialization.load(f)
+    except FileNotFoundError:
+        return {}
@@ -0,0 +1,332 @@
+# ==================================================
+# Nuvix Ai — Fair-share inference queue
+# Hierarchical deficit round-robin (guild → user), global concurrency cap,
+# throttled streaming edits and tuning metrics.
+# ==================================================
+
+import asyncio
+import time
+from collections import deque
+
+
+class QueueFullError(Exception):
+    """Raised when the queue (or the caller's share of it) is at capacity."""
+
+
+class QueueClosedError(Exception):
+    """Set on jobs still queued or running when the queue stops, and raised by submit() after."""
+
+
+# ==============================
+# ⚖️ Deficit round-robin
+# ==============================
+class _Leaf:
+    """FIFO of (cost, item) for a single flow."""
+
+    def __init__(self):
+        self.items = deque()
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, path, cost, item):
+        self.items.append((cost, item))
+
+    def peek_cost(self):
+        return self.items[0][0]
+
+    def pop(self):
+        return self.items.popleft()[1]
+
+
+class DeficitRoundRobin:
+    """DRR scheduler over flows. A flow is either a FIFO or another DRR, so
+    ``push(("guild", "user"), ...)`` gives guild-level fairness first and
+    user-level fairness inside each guild."""
+
+    def __init__(self, quantum: float = 1.0, depth: int = 1):
+        self.quantum = quantum
+        self.depth = depth
+        self._flows = {}
+        self._deficit = {}
+        self._active = deque()
+        self._credited = False
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, path, cost, item):
+        key = path[0]
+        flow = self._flows.get(key)
+        if flow is None:
+            flow = _Leaf() if self.depth == 1 else DeficitRoundRobin(self.quantum, self.depth - 1)
+            self._flows[key] = flow
+            self._deficit[key] = 0.0
+        if not len(flow):
+            self._active.append(key)
+        flow.push(path[1:], cost, item)
+        self._size += 1
+
+    def _select(self):
+        """Rotate until the head flow can afford its next item; return its key."""
+        while True:
+            key = self._active[0]
+            if not self._credited:
+                self._deficit[key] += self.quantum
+                self._credited = True
+            if self._flows[key].peek_cost() <= self._deficit[key]:
+                return key
+            self._credited = False
+            self._active.rotate(-1)
+
+    def peek_cost(self):
+        return self._flows[self._select()].peek_cost()
+
+    def pop(self):
+        if not self._size:
+            raise IndexError("pop from empty DeficitRoundRobin")
+        key = self._select()
+        flow = self._flows[key]
+        self._deficit[key] -= flow.peek_cost()
+        item = flow.pop()
+        self._size -= 1
+        if not len(flow):
+            # idle flows don't bank credit
+            self._active.popleft()
+            del self._flows[key], self._deficit[key]
+            self._credited = False
+        return item
+
+    def pending_for(self, *path) -> int:
+        flow = self._flows.get(path[0])
+        if flow is None:
+            return 0
+        return len(flow) if len(path) == 1 else flow.pending_for(*path[1:])
+
+
+# ==============================
+# ✏️ Throttled streaming edits
+# ==============================
+class ThrottledEditor:
+    """Coalesce rapid text updates into at most one ``edit(text)`` call per ``interval``.
+    Streamed chunks are only joined when an edit actually goes out."""
+
+    def __init__(self, edit, interval: float = 1.5):
+        self.edit = edit
+        self.interval = interval
+        self.edits = 0
+        self._parts: list[str] = []
+        self._version = 0
+        self._sent = 0
+        self._task = None
+
+    @property
+    def text(self) -> str:
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def update(self, text: str):
+        """Replace the whole text."""
+        self._parts = [text]
+        self._changed()
+
+    def append(self, chunk: str):
+        """Add a streamed chunk (an ``on_chunk`` callback for :meth:`InferenceQueue.submit`)."""
+        self._parts.append(chunk)
+        self._changed()
+
+    def _changed(self):
+        self._version += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self._version != self._sent:
+            self._sent = self._version
+            await self._send(self.text)
+            await asyncio.sleep(self.interval)
+
+    async def _send(self, text: str):
+        self.edits += 1
+        try:
+            await self.edit(text)
+        except Exception:
+            pass  # intermediate edits are best effort; the caller sends the final one
+
+    async def stop(self):
+        """Cancel any pending intermediate edit (call before sending the final message)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# ==============================
+# 📊 Metrics
+# ==============================
+def _percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+class QueueMetrics:
+    def __init__(self, window: int = 512):
+        self.wait_times = deque(maxlen=window)
+        self.tokens_per_sec = deque(maxlen=window)
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.tokens = 0
+
+    def snapshot(self, depth: int, running: int, concurrency: int) -> dict:
+        return {
+            "depth": depth,
+            "running": running,
+            "concurrency": concurrency,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "tokens": self.tokens,
+            "wait_p50": _percentile(self.wait_times, 50),
+            "wait_p95": _percentile(self.wait_times, 95),
+            "tokens_per_sec_p50": _percentile(self.tokens_per_sec, 50),
+        }
+
+
+def render_prometheus(snapshot: dict, prefix: str = "nuvix_ai_queue") -> str:
+    """Plain-text exposition format for the /metrics endpoint."""
+    return "".join(f"{prefix}_{k} {float(v)}\n" for k, v in snapshot.items())
+
+
+# ==============================
+# 🧵 Queue
+# ==============================
+class InferenceJob:
+    def __init__(self, user_id, guild_id, prompt: str, context, on_chunk, cost: float):
+        self.user_id = user_id
+        self.guild_id = guild_id
+        self.prompt = prompt
+        self.context = context
+        self.on_chunk = on_chunk
+        self.cost = cost
+        self.enqueued_at = time.monotonic()
+        self.future = asyncio.get_running_loop().create_future()
+
+    async def wait(self) -> str:
+        return await self.future
+
+
+class InferenceQueue:
+    """Bounded queue with hierarchical fair scheduling in front of a streaming backend."""
+
+    def __init__(self, backend, concurrency: int = 2, max_size: int = 200,
+                 max_per_user: int = 3, quantum: float = 1.0):
+        self.backend = backend
+        self.concurrency = concurrency
+        self.max_size = max_size
+        self.max_per_user = max_per_user
+        self.metrics = QueueMetrics()
+        self._drr = DeficitRoundRobin(quantum, depth=2)
+        self._user_pending = {}
+        self._ready = asyncio.Condition()
+        self._workers = []
+        self._running = 0
+        self._closed = False
+
+    @property
+    def depth(self) -> int:
+        return len(self._drr)
+
+    def snapshot(self) -> dict:
+        return self.metrics.snapshot(self.depth, self._running, self.concurrency)
+
+    def start(self):
+        self._closed = False
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def stop(self):
+        """Stop the workers and fail every queued or running job with :class:`QueueClosedError`
+        so nobody awaiting ``job.wait()`` hangs."""
+        self._closed = True
+        for w in self._workers:
+            w.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while len(self._drr):
+            self._fail(self._drr.pop())
+        self._user_pending.clear()
+
+    @staticmethod
+    def _fail(job: InferenceJob):
+        if not job.future.done():
+            job.future.set_exception(QueueClosedError("The assistant is restarting, please try again shortly."))
+            job.future.exception()  # mark retrieved when nobody was waiting
+
+    async def submit(self, user_id, guild_id, prompt: str, context=None, on_chunk=None, cost: float = 1.0) -> InferenceJob:
+        """Enqueue a prompt. ``on_chunk(chunk)`` is called with each new piece as tokens
+        stream in (see :meth:`ThrottledEditor.append`)."""
+        if self._closed:
+            raise QueueClosedError("The assistant is restarting, please try again shortly.")
+        pending = self._user_pending.get(user_id, 0)
+        if self.depth >= self.max_size or pending >= self.max_per_user:
+            self.metrics.rejected += 1
+            raise QueueFullError("The assistant queue is full, please try again shortly.")
+        job = InferenceJob(user_id, guild_id, prompt, context, on_chunk, cost)
+        self._user_pending[user_id] = pending + 1
+        self.metrics.submitted += 1
+        async with self._ready:
+            self._drr.push((guild_id, user_id), cost, job)
+            self._ready.notify()
+        return job
+
+    async def _worker(self):
+        while True:
+            async with self._ready:
+                await self._ready.wait_for(lambda: len(self._drr) > 0)
+                job = self._drr.pop()
+            self._running += 1
+            try:
+                await self._run(job)
+            finally:
+                self._running -= 1
+                left = self._user_pending.get(job.user_id, 1) - 1
+                if left:
+                    self._user_pending[job.user_id] = left
+                else:
+                    self._user_pending.pop(job.user_id, None)
+
+    async def _run(self, job: InferenceJob):
+        started = time.monotonic()
+        self.metrics.wait_times.append(started - job.enqueued_at)
+        parts, tokens = [], 0
+        try:
+            async for chunk in self.backend.stream(job.prompt, job.context):
+                parts.append(chunk)
+                tokens += 1
+                if job.on_chunk is not None:
+                    job.on_chunk(chunk)
+        except asyncio.CancelledError:
+            self._fail(job)
+            raise
+        except Exception as e:
+            self.metrics.failed += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+            return
+        elapsed = max(time.monotonic() - started, 1e-6)
+        self.metrics.completed += 1
+        self.metrics.tokens += tokens
+        self.metrics.tokens_per_sec.append(tokens / elapsed)
+        if not job.future.done():
+            job.future.set_result("".join(parts))
@@ -0,0 +1,172 @@
+# ==================================================
+# Nuvix Apps — Applications
+# Indexed SQLite store, keyset pagination and a per-reviewer page cache
+# ==================================================
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import serialization
+
+STATUSES = ("pending", "accepted", "rejected")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id     INTEGER NOT NULL,
+    user_id      INTEGER NOT NULL,
+    user_name    TEXT    NOT NULL,
+    position     TEXT    NOT NULL,
+    answers      TEXT    NOT NULL,
+    status       TEXT    NOT NULL DEFAULT 'pending',
+    submitted_at REAL    NOT NULL,
+    reviewed_by  INTEGER,
+    reviewed_at  REAL,
+    note         TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_apps_queue ON applications(guild_id, status, id);
+CREATE INDEX IF NOT EXISTS idx_apps_user ON applications(guild_id, user_id, id);
+"""
+
+_COLUMNS = "id, guild_id, user_id, user_name, position, answers, status, submitted_at, reviewed_by, reviewed_at, note"
+# Listing a page only needs the summary columns; answers are loaded when one application is opened.
+_SUMMARY = "id, user_id, user_name, position, status, submitted_at"
+
+
+@dataclass
+class Page:
+    rows: list  # [(id, user_id, user_name, position, status, submitted_at)]
+    has_prev: bool
+    has_next: bool
+
+    @property
+    def first_id(self):
+        return self.rows[0][0] if self.rows else None
+
+    @property
+    def last_id(self):
+        return self.rows[-1][0] if self.rows else None
+
+
+class ApplicationStore:
+    def __init__(self, path):
+        self.path = str(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def submit(self, guild_id: int, user_id: int, user_name: str, position: str, answers: dict) -> int:
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO applications (guild_id, user_id, user_name, position, answers, submitted_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (guild_id, user_id, user_name, position, serialization.dumps(answers), time.time()),
+            )
+        return cur.lastrowid
+
+    def get(self, app_id: int) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM applications WHERE id = ?", (app_id,)).fetchone()
+        if row is None:
+            return None
+        data = dict(zip(_COLUMNS.split(", "), row))
+        data["answers"] = serialization.loads(data["answers"])
+        return data
+
+    def has_pending(self, guild_id: int, user_id: int) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM applications WHERE guild_id = ? AND user_id = ? AND status = 'pending' LIMIT 1",
+                (guild_id, user_id),
+            ).fetchone() is not None
+
+    def decide(self, app_id: int, status: str, reviewer_id: int, note: str = "") -> int | None:
+        """Set the review outcome; returns the guild id (for cache invalidation) or None if not pending."""
+        if status not in STATUSES[1:]:
+            raise ValueError(f"Unknown decision: {status}")
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT guild_id FROM applications WHERE id = ? AND status = 'pending'",
+                                     (app_id,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE applications SET status = ?, reviewed_by = ?, reviewed_at = ?, note = ? WHERE id = ?",
+                (status, reviewer_id, time.time(), note, app_id),
+            )
+        return row[0]
+
+    def count(self, guild_id: int, status: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM applications WHERE guild_id = ? AND status = ?", (guild_id, status)
+            ).fetchone()[0]
+
+    def page(self, guild_id: int, status: str, size: int = 5, after: int | None = None,
+             before: int | None = None) -> Page:
+        """Keyset page in id order: ``after`` = next page, ``before`` = previous page.
+
+        Each call is one index range scan of ``size + 1`` rows, whatever the page number."""
+        base = f"SELECT {_SUMMARY} FROM applications WHERE guild_id = ? AND status = ?"
+        with self._lock:
+            if before is not None:
+                rows = self._conn.execute(base + " AND id < ? ORDER BY id DESC LIMIT ?",
+                                          (guild_id, status, before, size + 1)).fetchall()
+                has_prev = len(rows) > size
+                rows = rows[:size][::-1]
+                return Page(rows, has_prev, True)
+            if after is not None:
+                rows = self._conn.execute(base + " AND id > ? ORDER BY id LIMIT ?",
+                                          (guild_id, status, after, size + 1)).fetchall()
+                return Page(rows[:size], True, len(rows) > size)
+            rows = self._conn.execute(base + " ORDER BY id LIMIT ?", (guild_id, status, size + 1)).fetchall()
+            return Page(rows[:size], False, len(rows) > size)
+
+# ==============================
+# 🗃 Page cache
+# ==============================
+class PageCache:
+    """LRU of rendered pages keyed by (reviewer, guild, status, cursor).
+
+    Each guild has a generation number that is bumped on every write, so a
+    decision or a new submission invalidates that guild's pages in O(1)."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._data: OrderedDict = OrderedDict()
+        self._generation: dict[int, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, guild_id: int):
+        self._generation[guild_id] = self._generation.get(guild_id, 0) + 1
+
+    def _key(self, reviewer_id, guild_id, status, cursor):
+        return (reviewer_id, guild_id, status, cursor, self._generation.get(guild_id, 0))
+
+    def get(self, reviewer_id, guild_id, status, cursor):
+        key = self._key(reviewer_id, guild_id, status, cursor)
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, reviewer_id, guild_id, status, cursor, value):
+        key = self._key(reviewer_id, guild_id, status, cursor)
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
@@ -1,13 +1,26 @@
-import os, time, asyncio
+import os, sys, time, asyncio
 from aiohttp import web
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+# Sibling modules live next to bot.py, shared ones (config, utils) in the repo root.
+# main.py exec()s this file from the repo root (no __file__).
+BOT_DIR = os.path.dirname(os.path.abspath(globals().get("__file__") or os.path.join("nuvix_apps", "bot.py")))
+ROOT_DIR = os.path.dirname(BOT_DIR)
+for _path in (ROOT_DIR, BOT_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import config
+import event_bus
+import gateway_session
+import runtime
+
+from applications import STATUSES, ApplicationStore, PageCache
+
 BOT_NAME = "Nuvix Apps"
-TOKEN = os.getenv("NUVIX_APPS_TOKEN")
-OWNER_ROLE_ID = int(os.getenv("OWNER_ROLE_ID", "0"))
-EMBED_COLOR = int(os.getenv("EMBED_COLOR_HEX", "0xE91E63"), 16)  # default Nuvix pink
+TOKEN = config.settings().token("nuvix_apps")
 
 UPTIME = time.time()
 
@@ -18,6 +31,10 @@ intents.members = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 tree = bot.tree
 
+store = ApplicationStore(config.settings().get("APPS_DB_PATH", os.path.join(ROOT_DIR, "data", "applications.sqlite3")))
+page_cache = PageCache()
+PAGE_SIZE = config.settings().get_int("APPS_PAGE_SIZE", 5)
+
 async def health_handler(request):
     alive = int(time.time() - UPTIME)
     return web.Response(text=f"Nuvix Apps connected | alive {alive}s")
@@ -26,7 +43,7 @@ async def run_web():
     app = web.Application()
     app.router.add_get("/", health_handler)
     app.router.add_get("/health", health_handler)
-    port = int(os.getenv("PORT", "10000"))
+    port = config.settings().port
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
@@ -37,7 +54,8 @@ async def run_web():
 def owner_only(interaction: discord.Interaction) -> bool:
     if interaction.user is None or not interaction.guild:
         return False
-    if OWNER_ROLE_ID and any(r.id == OWNER_ROLE_ID for r in interaction.user.roles):
+    owner_role_id = config.settings().owner_role_id
+    if owner_role_id and any(r.id == owner_role_id for r in interaction.user.roles):
         return True
     # also allow guild owner and admins
     if interaction.user.id == interaction.guild.owner_id:
@@ -53,7 +71,7 @@ async def status(interaction: discord.Interaction):
     hours, mins = divmod(mins, 60)
     days, hours = divmod(hours, 24)
     human = (f"{days}d " if days else "") + (f"{hours}h " if hours else "") + (f"{mins}m {secs}s")
-    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=EMBED_COLOR)
+    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=config.settings().embed_color)
     embed.set_footer(text="Nuvix System • Connected")
     try:
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -67,6 +85,142 @@ async def status_error(interaction: discord.Interaction, error):
     else:
         await interaction.response.send_message("Unexpected error.", ephemeral=True)
 
+async def owner_check_error(interaction: discord.Interaction, error):
+    if isinstance(error, app_commands.CheckFailure):
+        msg = "You don't have permission to use this command."
+    else:
+        msg = "Unexpected error."
+    if interaction.response.is_done():
+        await interaction.followup.send(msg, ephemeral=True)
+    else:
+        await interaction.response.send_message(msg, ephemeral=True)
+
+# ==============================
+# 📝 Submitting
+# ==============================
+class ApplicationModal(discord.ui.Modal, title="Staff application"):
+    age = discord.ui.TextInput(label="Age", max_length=3)
+    experience = discord.ui.TextInput(label="Previous staff experience", style=discord.TextStyle.paragraph, max_length=1000)
+    motivation = discord.ui.TextInput(label="Why do you want to join?", style=discord.TextStyle.paragraph, max_length=1000)
+
+    def __init__(self, position: str):
+        super().__init__()
+        self.position = position
+
+    async def on_submit(self, interaction: discord.Interaction):
+        answers = {"age": self.age.value, "experience": self.experience.value, "motivation": self.motivation.value}
+        app_id = await asyncio.to_thread(store.submit, interaction.guild_id, interaction.user.id,
+                                         str(interaction.user), self.position, answers)
+        page_cache.invalidate(interaction.guild_id)
+        await interaction.response.send_message(f"✅ Application `#{app_id}` received. Good luck!", ephemeral=True)
+
+@tree.command(name="apply", description="Apply for a staff position.")
+async def apply(interaction: discord.Interaction, position: str = "Staff"):
+    if interaction.guild is None:
+        await interaction.response.send_message("Applications can only be sent from the server.", ephemeral=True)
+        return
+    if await asyncio.to_thread(store.has_pending, interaction.guild_id, interaction.user.id):
+        await interaction.response.send_message("You already have an application under review.", ephemeral=True)
+        return
+    await interaction.response.send_modal(ApplicationModal(position[:50]))
+
+# ==============================
+# 🔎 Reviewing
+# ==============================
+async def load_page(reviewer_id: int, guild_id: int, status: str, cursor: tuple):
+    """Return (page, embed) for a cursor, from the reviewer's cache when possible."""
+    cached = page_cache.get(reviewer_id, guild_id, status, cursor)
+    if cached is not None:
+        return cached
+    kind, ref = cursor
+    page = await asyncio.to_thread(store.page, guild_id, status, PAGE_SIZE,
+                                   ref if kind == "after" else None, ref if kind == "before" else None)
+    lines = [f"`#{app_id}` **{name}** (<@{user_id}>) — {position} · <t:{int(ts)}:R>"
+             for app_id, user_id, name, position, _, ts in page.rows]
+    embed = discord.Embed(title=f"📋 Applications — {status}", description="\n".join(lines) or "Nothing here.",
+                          color=config.settings().embed_color)
+    embed.set_footer(text="Nuvix Apps • /app_view <id> to open one")
+    page_cache.put(reviewer_id, guild_id, status, cursor, (page, embed))
+    return page, embed
+
+class ReviewView(discord.ui.View):
+    def __init__(self, reviewer_id: int, guild_id: int, status: str, page):
+        super().__init__(timeout=600)
+        self.reviewer_id, self.guild_id, self.status = reviewer_id, guild_id, status
+        self.show(page)
+
+    def show(self, page):
+        self.page = page
+        self.prev_button.disabled = not page.has_prev
+        self.next_button.disabled = not page.has_next
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.reviewer_id
+
+    async def turn(self, interaction: discord.Interaction, cursor: tuple):
+        page, embed = await load_page(self.reviewer_id, self.guild_id, self.status, cursor)
+        self.show(page)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def prev_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.turn(interaction, ("before", self.page.first_id))
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.turn(interaction, ("after", self.page.last_id))
+
+@tree.command(name="apps_review", description="Page through staff applications (owner only).")
+@app_commands.choices(status=[app_commands.Choice(name=s, value=s) for s in STATUSES])
+@app_commands.check(lambda i: owner_only(i))
+async def apps_review(interaction: discord.Interaction, status: app_commands.Choice[str] | None = None):
+    status_value = status.value if status else "pending"
+    page, embed = await load_page(interaction.user.id, interaction.guild_id, status_value, ("first", None))
+    await interaction.response.send_message(embed=embed, view=ReviewView(interaction.user.id, interaction.guild_id,
+                                                                         status_value, page), ephemeral=True)
+
+class DecisionView(discord.ui.View):
+    def __init__(self, app_id: int, reviewer_id: int):
+        super().__init__(timeout=600)
+        self.app_id, self.reviewer_id = app_id, reviewer_id
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.reviewer_id
+
+    async def decide(self, interaction: discord.Interaction, status: str):
+        guild_id = await asyncio.to_thread(store.decide, self.app_id, status, interaction.user.id)
+        if guild_id is None:
+            await interaction.response.edit_message(content="This application was already reviewed.", view=None)
+            return
+        page_cache.invalidate(guild_id)
+        await interaction.response.edit_message(content=f"Application `#{self.app_id}` {status}.", view=None)
+
+    @discord.ui.button(label="Accept", style=discord.ButtonStyle.success)
+    async def accept(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.decide(interaction, "accepted")
+
+    @discord.ui.button(label="Reject", style=discord.ButtonStyle.danger)
+    async def reject(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.decide(interaction, "rejected")
+
+@tree.command(name="app_view", description="Open one application (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def app_view(interaction: discord.Interaction, app_id: int):
+    app = await asyncio.to_thread(store.get, app_id)
+    if app is None or app["guild_id"] != interaction.guild_id:
+        await interaction.response.send_message("Application not found.", ephemeral=True)
+        return
+    embed = discord.Embed(title=f"📄 Application #{app_id} — {app['position']}",
+                          description=f"**Applicant:** <@{app['user_id']}> ({app['user_name']})\n**Status:** {app['status']}",
+                          color=config.settings().embed_color)
+    for question, answer in app["answers"].items():
+        embed.add_field(name=question.capitalize(), value=answer[:1024] or "—", inline=False)
+    view = DecisionView(app_id, interaction.user.id) if app["status"] == "pending" else discord.utils.MISSING
+    await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+
+for _cmd in (apps_review, app_view):
+    _cmd.error(owner_check_error)
+
 @bot.event
 async def on_ready():
     try:
@@ -78,12 +232,18 @@ async def on_ready():
 async def main():
     if not TOKEN:
         raise RuntimeError(f"Missing token env: NUVIX_APPS_TOKEN")
+    config_task = asyncio.create_task(config.watch())
+    await event_bus.bus().start("nuvix_apps")
+    gateway_session.install(bot, "nuvix_apps", on_shutdown=[event_bus.bus().stop])
     web_task = asyncio.create_task(run_web())
     bot_task = asyncio.create_task(bot.start(TOKEN))
-    await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    try:
+        await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        config_task.cancel()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        runtime.run(main())
     except KeyboardInterrupt:
         pass
@@ -1,13 +1,25 @@
-import os, time, asyncio
+import os, sys, time, shutil, asyncio
 from aiohttp import web
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+# Sibling modules live next to bot.py, shared ones (config, utils) in the repo root.
+# main.py exec()s this file from the repo root (no __file__).
+BOT_DIR = os.path.dirname(os.path.abspath(globals().get("__file__") or os.path.join("nuvix_backup", "bot.py")))
+ROOT_DIR = os.path.dirname(BOT_DIR)
+for _path in (ROOT_DIR, BOT_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import config
+import event_bus
+import gateway_session
+import runtime
+import transcript_archive
+
 BOT_NAME = "Nuvix Backup"
-TOKEN = os.getenv("NUVIX_BACKUP_TOKEN")
-OWNER_ROLE_ID = int(os.getenv("OWNER_ROLE_ID", "0"))
-EMBED_COLOR = int(os.getenv("EMBED_COLOR_HEX", "0xE91E63"), 16)  # default Nuvix pink
+TOKEN = config.settings().token("nuvix_backup")
 
 UPTIME = time.time()
 
@@ -26,7 +38,7 @@ async def run_web():
     app = web.Application()
     app.router.add_get("/", health_handler)
     app.router.add_get("/health", health_handler)
-    port = int(os.getenv("PORT", "10000"))
+    port = config.settings().port
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
@@ -34,10 +46,79 @@ async def run_web():
     while True:
         await asyncio.sleep(3600)
 
+# ==============================
+# 🔁 Incremental backups (event bus)
+# ==============================
+# Closed tickets are copied as they happen instead of waiting for the next full snapshot.
+LIVE_BACKUP_DIR = config.settings().get("BACKUP_LIVE_DIR", os.path.join(ROOT_DIR, "data", "backups", "live"))
+TRANSCRIPTS_DIR = config.settings().get("TICKETS_LOG_DIR", os.path.join(ROOT_DIR, "data", "tickets_logs"))
+backup_stats = {"copied": 0, "missing": 0, "rejected": 0, "last": None}
+
+def transcript_path(path: str) -> str | None:
+    """``path`` resolved (symlinks included) if it is a file directly inside TRANSCRIPTS_DIR,
+    else None: whatever arrives on the bus is never copied from anywhere else."""
+    if not os.path.isabs(path):
+        path = os.path.join(ROOT_DIR, path)
+    path = os.path.realpath(path)
+    if os.path.dirname(path) != os.path.realpath(TRANSCRIPTS_DIR):
+        return None
+    return path
+
+def copy_transcript(path: str) -> str:
+    dest_dir = os.path.join(LIVE_BACKUP_DIR, "tickets_logs")
+    os.makedirs(dest_dir, exist_ok=True)
+    dest = os.path.join(dest_dir, os.path.basename(path))
+    shutil.copy2(path, dest)
+    return dest
+
+@event_bus.bus().subscribe(event_bus.TICKET_CLOSED)
+async def on_ticket_closed(event):
+    path = event.payload.get("transcript_path")
+    if not path:
+        return
+    path = transcript_path(str(path))
+    if path is None:
+        backup_stats["rejected"] += 1
+        print(f"⚠️ Ignored a transcript path outside {TRANSCRIPTS_DIR}: {event.payload.get('transcript_path')!r}")
+        return
+    try:
+        await asyncio.to_thread(copy_transcript, path)
+    except FileNotFoundError:
+        backup_stats["missing"] += 1
+        return
+    backup_stats["copied"] += 1
+    backup_stats["last"] = os.path.basename(path)
+
+# Old transcripts get packed into a few append-only segments by nuvix_tickets; mirroring
+# them copies only new bytes, and the per-ticket copies they replace can go.
+archive = transcript_archive.TranscriptArchive(
+    config.settings().get("TICKETS_ARCHIVE_DIR", os.path.join(ROOT_DIR, "data", "tickets_archive")))
+archive_stats = {"mirrored_bytes": 0, "pruned": 0}
+
+def mirror_archive() -> dict:
+    summary = archive.mirror(os.path.join(LIVE_BACKUP_DIR, "tickets_archive"))
+    pruned = 0
+    copies = os.path.join(LIVE_BACKUP_DIR, "tickets_logs")
+    if os.path.isdir(copies):
+        for entry in os.scandir(copies):
+            m = transcript_archive.TRANSCRIPT_FILE.match(entry.name)
+            if m and archive.contains(m.group(1), int(m.group(2))):
+                os.unlink(entry.path)
+                pruned += 1
+    summary["pruned"] = pruned
+    return summary
+
+@event_bus.bus().subscribe(event_bus.ARCHIVE_COMPACTED)
+async def on_archive_compacted(event):
+    summary = await asyncio.to_thread(mirror_archive)
+    archive_stats["mirrored_bytes"] += summary["bytes"]
+    archive_stats["pruned"] += summary["pruned"]
+
 def owner_only(interaction: discord.Interaction) -> bool:
     if interaction.user is None or not interaction.guild:
         return False
-    if OWNER_ROLE_ID and any(r.id == OWNER_ROLE_ID for r in interaction.user.roles):
+    owner_role_id = config.settings().owner_role_id
+    if owner_role_id and any(r.id == owner_role_id for r in interaction.user.roles):
         return True
     # also allow guild owner and admins
     if interaction.user.id == interaction.guild.owner_id:
@@ -53,7 +134,13 @@ async def status(interaction: discord.Interaction):
     hours, mins = divmod(mins, 60)
     days, hours = divmod(hours, 24)
     human = (f"{days}d " if days else "") + (f"{hours}h " if hours else "") + (f"{mins}m {secs}s")
-    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=EMBED_COLOR)
+    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=config.settings().embed_color)
+    embed.add_field(name="Incremental backups",
+                    value=f"{backup_stats['copied']} transcripts copied • last: {backup_stats['last'] or '—'}", inline=False)
+    segments, size = archive.disk_usage()
+    embed.add_field(name="Transcript archive",
+                    value=f"{segments} segments ({size / 1048576:.1f} MiB) • mirrored {archive_stats['mirrored_bytes'] / 1048576:.1f} MiB "
+                          f"• {archive_stats['pruned']} loose copies pruned", inline=False)
     embed.set_footer(text="Nuvix System • Connected")
     try:
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -78,12 +165,18 @@ async def on_ready():
 async def main():
     if not TOKEN:
         raise RuntimeError(f"Missing token env: NUVIX_BACKUP_TOKEN")
+    config_task = asyncio.create_task(config.watch())
+    await event_bus.bus().start("nuvix_backup")
+    gateway_session.install(bot, "nuvix_backup", on_shutdown=[event_bus.bus().stop])
     web_task = asyncio.create_task(run_web())
     bot_task = asyncio.create_task(bot.start(TOKEN))
-    await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    try:
+        await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        config_task.cancel()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        runtime.run(main())
     except KeyboardInterrupt:
         pass
@@ -1,23 +1,56 @@
-import os, time, asyncio
+import os, sys, time, asyncio
 from aiohttp import web
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+# Sibling modules live next to bot.py, shared ones (config, utils) in the repo root.
+# main.py exec()s this file from the repo root (no __file__).
+BOT_DIR = os.path.dirname(os.path.abspath(globals().get("__file__") or os.path.join("nuvix_information", "bot.py")))
+ROOT_DIR = os.path.dirname(BOT_DIR)
+for _path in (ROOT_DIR, BOT_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import config
+import event_bus
+import gateway_session
+import runtime
+
+from guild_stats import StatsTracker
+
 BOT_NAME = "Nuvix Information"
-TOKEN = os.getenv("NUVIX_INFORMATION_TOKEN")
-OWNER_ROLE_ID = int(os.getenv("OWNER_ROLE_ID", "0"))
-EMBED_COLOR = int(os.getenv("EMBED_COLOR_HEX", "0xE91E63"), 16)  # default Nuvix pink
+TOKEN = config.settings().token("nuvix_information")
 
 UPTIME = time.time()
 
 intents = discord.Intents.none()
 intents.guilds = True
 intents.members = True
+# Online-staff counts need the privileged presence intent (enable it in the developer portal first).
+TRACK_PRESENCE = config.settings().get_bool("INFORMATION_PRESENCES")
+intents.presences = TRACK_PRESENCE
 
 bot = commands.Bot(command_prefix="!", intents=intents)
 tree = bot.tree
 
+def _staff_roles(cfg: config.Settings) -> frozenset:
+    return cfg.staff_role_ids | cfg.highstaff_role_ids | cfg.coowner_role_ids | cfg.owner_role_ids
+
+stats = StatsTracker(
+    _staff_roles(config.settings()),
+    config.settings().get_ids("TICKET_CATEGORY_IDS"),
+    track_presence=TRACK_PRESENCE,
+)
+
+@config.on_reload
+def _reload_stats_roles(old, new):
+    # takes effect for new events right away and for existing members on the next recount
+    stats.staff_role_ids = set(_staff_roles(new))
+    stats.ticket_category_ids = set(new.get_ids("TICKET_CATEGORY_IDS"))
+
+RECONCILE_INTERVAL = config.settings().get_float("STATS_RECONCILE_INTERVAL", 900)
+
 async def health_handler(request):
     alive = int(time.time() - UPTIME)
     return web.Response(text=f"Nuvix Information connected | alive {alive}s")
@@ -26,7 +59,7 @@ async def run_web():
     app = web.Application()
     app.router.add_get("/", health_handler)
     app.router.add_get("/health", health_handler)
-    port = int(os.getenv("PORT", "10000"))
+    port = config.settings().port
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
@@ -37,7 +70,8 @@ async def run_web():
 def owner_only(interaction: discord.Interaction) -> bool:
     if interaction.user is None or not interaction.guild:
         return False
-    if OWNER_ROLE_ID and any(r.id == OWNER_ROLE_ID for r in interaction.user.roles):
+    owner_role_id = config.settings().owner_role_id
+    if owner_role_id and any(r.id == owner_role_id for r in interaction.user.roles):
         return True
     # also allow guild owner and admins
     if interaction.user.id == interaction.guild.owner_id:
@@ -53,7 +87,7 @@ async def status(interaction: discord.Interaction):
     hours, mins = divmod(mins, 60)
     days, hours = divmod(hours, 24)
     human = (f"{days}d " if days else "") + (f"{hours}h " if hours else "") + (f"{mins}m {secs}s")
-    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=EMBED_COLOR)
+    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=config.settings().embed_color)
     embed.set_footer(text="Nuvix System • Connected")
     try:
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -67,6 +101,70 @@ async def status_error(interaction: discord.Interaction, error):
     else:
         await interaction.response.send_message("Unexpected error.", ephemeral=True)
 
+def _ago(seconds) -> str:
+    if seconds is None:
+        return "never"
+    seconds = int(seconds)
+    return f"{seconds // 60}m {seconds % 60}s ago" if seconds >= 60 else f"{seconds}s ago"
+
+@tree.command(name="serverstats", description="Members, staff and open tickets of this server.")
+async def serverstats(interaction: discord.Interaction):
+    if interaction.guild is None:
+        await interaction.response.send_message("This command only works in a server.", ephemeral=True)
+        return
+    s = stats.read(interaction.guild.id)
+    online = "n/a" if s["staff_online"] is None else s["staff_online"]
+    embed = discord.Embed(title=f"📊 {interaction.guild.name}", color=config.settings().embed_color)
+    embed.add_field(name="👥 Members", value=f"{s['members']} ({s['humans']} humans · {s['bots']} bots)", inline=False)
+    embed.add_field(name="🛡 Staff", value=f"{s['staff']} total · {online} online", inline=True)
+    embed.add_field(name="🎫 Open tickets", value=str(s["open_tickets"]), inline=True)
+    drift = ", ".join(f"{k} {v:+d}" for k, v in s["drift"].items()) or "none"
+    embed.set_footer(text=f"Nuvix Information • recounted {_ago(s['reconciled_ago'])} • last drift: {drift}")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+@bot.event
+async def on_member_join(member: discord.Member):
+    stats.member_join(member)
+
+@bot.event
+async def on_member_remove(member: discord.Member):
+    stats.member_remove(member)
+
+@bot.event
+async def on_member_update(before: discord.Member, after: discord.Member):
+    if before.roles != after.roles:
+        stats.member_update(before, after)
+
+@bot.event
+async def on_presence_update(before: discord.Member, after: discord.Member):
+    if before.status != after.status:
+        stats.presence_update(before, after)
+
+@bot.event
+async def on_guild_channel_create(channel):
+    stats.channel_create(channel)
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    stats.channel_delete(channel)
+
+async def reconcile_loop():
+    await bot.wait_until_ready()
+    while True:
+        for guild in bot.guilds:
+            drift = await stats.reconcile(guild)
+            if drift:
+                print(f"📊 {BOT_NAME} corrected stats for {guild.id}: {drift}")
+        await asyncio.sleep(RECONCILE_INTERVAL)
+
+@event_bus.bus().subscribe("ticket.*")
+def on_ticket_event(event):
+    p = event.payload
+    if event.type == event_bus.TICKET_OPENED:
+        stats.ticket_opened(p["guild_id"], p["channel_id"])
+    elif event.type == event_bus.TICKET_CLOSED:
+        stats.ticket_closed(p["guild_id"], p["channel_id"])
+
 @bot.event
 async def on_ready():
     try:
@@ -78,12 +176,19 @@ async def on_ready():
 async def main():
     if not TOKEN:
         raise RuntimeError(f"Missing token env: NUVIX_INFORMATION_TOKEN")
+    config_task = asyncio.create_task(config.watch())
+    await event_bus.bus().start("nuvix_information")
+    gateway_session.install(bot, "nuvix_information", on_shutdown=[event_bus.bus().stop])
     web_task = asyncio.create_task(run_web())
     bot_task = asyncio.create_task(bot.start(TOKEN))
-    await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    stats_task = asyncio.create_task(reconcile_loop())
+    try:
+        await asyncio.wait([web_task, bot_task, stats_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        config_task.cancel()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        runtime.run(main())
     except KeyboardInterrupt:
         pass
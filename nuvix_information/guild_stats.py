@@ -0,0 +1,180 @@
+# ==================================================
+# Nuvix Information — Guild statistics
+# Counters maintained from gateway events, reconciled by a periodic recount
+# ==================================================
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass, field
+
+# Ticket channels are named "<user>-<HHMMSS>" by nuvix_tickets (see data/tickets_logs)
+TICKET_NAME = re.compile(r"^[\w.]+-\d{6}$")
+
+
+@dataclass
+class GuildCounters:
+    members: int = 0
+    bots: int = 0
+    staff: set = field(default_factory=set)
+    staff_online: set = field(default_factory=set)
+    tickets: set = field(default_factory=set)
+    events: int = 0
+    last_event: float = 0.0
+    reconciled_at: float = 0.0
+    drift: dict = field(default_factory=dict)
+
+
+class StatsTracker:
+    """O(1) reads of member / staff / ticket counts per guild.
+
+    Event hooks adjust the counters; :meth:`reconcile` recounts from the cache
+    and records how far the incremental counters had drifted."""
+
+    def __init__(self, staff_role_ids, ticket_category_ids=(), track_presence: bool = False):
+        self.staff_role_ids = {int(r) for r in staff_role_ids}
+        self.ticket_category_ids = {int(c) for c in ticket_category_ids}
+        self.track_presence = track_presence
+        self._guilds: dict[int, GuildCounters] = {}
+
+    def counters(self, guild_id: int) -> GuildCounters:
+        c = self._guilds.get(guild_id)
+        if c is None:
+            c = self._guilds[guild_id] = GuildCounters()
+        return c
+
+    # ---- classification ----
+    def is_staff(self, member) -> bool:
+        return any(r.id in self.staff_role_ids for r in member.roles)
+
+    def is_ticket(self, channel) -> bool:
+        if self.ticket_category_ids:
+            return getattr(channel, "category_id", None) in self.ticket_category_ids
+        return bool(TICKET_NAME.match(getattr(channel, "name", "") or ""))
+
+    @staticmethod
+    def _online(member) -> bool:
+        return str(getattr(member, "status", "offline")) != "offline"
+
+    def _touch(self, c: GuildCounters):
+        c.events += 1
+        c.last_event = time.time()
+
+    # ---- event hooks ----
+    def member_join(self, member):
+        c = self.counters(member.guild.id)
+        c.members += 1
+        if member.bot:
+            c.bots += 1
+        self._set_staff(c, member)
+        self._touch(c)
+
+    def member_remove(self, member):
+        c = self.counters(member.guild.id)
+        c.members = max(0, c.members - 1)
+        if member.bot:
+            c.bots = max(0, c.bots - 1)
+        c.staff.discard(member.id)
+        c.staff_online.discard(member.id)
+        self._touch(c)
+
+    def member_update(self, before, after):
+        c = self.counters(after.guild.id)
+        self._set_staff(c, after)
+        self._touch(c)
+
+    def presence_update(self, before, after):
+        c = self.counters(after.guild.id)
+        if after.id in c.staff:
+            if self._online(after):
+                c.staff_online.add(after.id)
+            else:
+                c.staff_online.discard(after.id)
+            self._touch(c)
+
+    def channel_create(self, channel):
+        if self.is_ticket(channel):
+            c = self.counters(channel.guild.id)
+            c.tickets.add(channel.id)
+            self._touch(c)
+
+    def channel_delete(self, channel):
+        c = self.counters(channel.guild.id)
+        if channel.id in c.tickets:
+            c.tickets.discard(channel.id)
+            self._touch(c)
+
+    # Published by nuvix_tickets over the event bus; idempotent with the channel hooks above.
+    def ticket_opened(self, guild_id: int, channel_id: int):
+        c = self.counters(guild_id)
+        if channel_id not in c.tickets:
+            c.tickets.add(channel_id)
+            self._touch(c)
+
+    def ticket_closed(self, guild_id: int, channel_id: int):
+        c = self.counters(guild_id)
+        if channel_id in c.tickets:
+            c.tickets.discard(channel_id)
+            self._touch(c)
+
+    def _set_staff(self, c: GuildCounters, member):
+        if self.is_staff(member):
+            c.staff.add(member.id)
+            if self.track_presence and self._online(member):
+                c.staff_online.add(member.id)
+            else:
+                c.staff_online.discard(member.id)
+        else:
+            c.staff.discard(member.id)
+            c.staff_online.discard(member.id)
+
+    # ---- correction ----
+    async def reconcile(self, guild, chunk: int = 5000) -> dict:
+        """Full recount from the member/channel cache, yielding to the loop every ``chunk`` members."""
+        members = bots = 0
+        staff, online = set(), set()
+        for i, member in enumerate(guild.members):
+            members += 1
+            if member.bot:
+                bots += 1
+            if self.is_staff(member):
+                staff.add(member.id)
+                if self.track_presence and self._online(member):
+                    online.add(member.id)
+            if i % chunk == chunk - 1:
+                await asyncio.sleep(0)
+        tickets = {ch.id for ch in guild.channels if self.is_ticket(ch)}
+        # guild.member_count comes from Discord and stays right even if the cache is partial
+        members = max(members, guild.member_count or 0)
+
+        c = self.counters(guild.id)
+        drift = {
+            "members": members - c.members,
+            "bots": bots - c.bots,
+            "staff": len(staff) - len(c.staff),
+            "staff_online": len(online) - len(c.staff_online),
+            "tickets": len(tickets) - len(c.tickets),
+        }
+        c.members, c.bots, c.staff, c.staff_online, c.tickets = members, bots, staff, online, tickets
+        first = not c.reconciled_at  # the initial build is not drift
+        c.reconciled_at = time.time()
+        c.drift = {} if first else {k: v for k, v in drift.items() if v}
+        return c.drift
+
+    # ---- reads ----
+    def read(self, guild_id: int) -> dict:
+        """Constant-time snapshot plus how stale it is."""
+        c = self.counters(guild_id)
+        now = time.time()
+        return {
+            "members": c.members,
+            "humans": c.members - c.bots,
+            "bots": c.bots,
+            "staff": len(c.staff),
+            "staff_online": len(c.staff_online) if self.track_presence else None,
+            "open_tickets": len(c.tickets),
+            "events_since_start": c.events,
+            "reconciled_ago": now - c.reconciled_at if c.reconciled_at else None,
+            "last_event_ago": now - c.last_event if c.last_event else None,
+            "drift": dict(c.drift),
+        }
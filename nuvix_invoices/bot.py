@@ -1,13 +1,26 @@
-import os, time, asyncio
+import io, os, sys, time, asyncio, tempfile
 from aiohttp import web
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+# Sibling modules live next to bot.py, shared ones (config, utils) in the repo root.
+# main.py exec()s this file from the repo root (no __file__).
+BOT_DIR = os.path.dirname(os.path.abspath(globals().get("__file__") or os.path.join("nuvix_invoices", "bot.py")))
+ROOT_DIR = os.path.dirname(BOT_DIR)
+for _path in (ROOT_DIR, BOT_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import config
+import event_bus
+import gateway_session
+import runtime
+
+from ledger import IMPORT_FIELDS, STATUSES, InvoiceLedger, InvoiceRenderer, month_range, read_import, to_cents, write_pages_zip
+
 BOT_NAME = "Nuvix Invoices"
-TOKEN = os.getenv("NUVIX_INVOICES_TOKEN")
-OWNER_ROLE_ID = int(os.getenv("OWNER_ROLE_ID", "0"))
-EMBED_COLOR = int(os.getenv("EMBED_COLOR_HEX", "0xE91E63"), 16)  # default Nuvix pink
+TOKEN = config.settings().token("nuvix_invoices")
 
 UPTIME = time.time()
 
@@ -18,6 +31,13 @@ intents.members = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 tree = bot.tree
 
+ledger = InvoiceLedger(config.settings().get("INVOICES_DB_PATH", os.path.join(ROOT_DIR, "data", "invoices.sqlite3")))
+renderer = InvoiceRenderer(config.settings().get_int("INVOICES_RENDER_WORKERS", 2), footer=config.settings().footer_text)
+
+@config.on_reload
+def _reload_footer(old, new):
+    renderer.footer = new.footer_text
+
 async def health_handler(request):
     alive = int(time.time() - UPTIME)
     return web.Response(text=f"Nuvix Invoices connected | alive {alive}s")
@@ -26,7 +46,7 @@ async def run_web():
     app = web.Application()
     app.router.add_get("/", health_handler)
     app.router.add_get("/health", health_handler)
-    port = int(os.getenv("PORT", "10000"))
+    port = config.settings().port
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
@@ -37,7 +57,8 @@ async def run_web():
 def owner_only(interaction: discord.Interaction) -> bool:
     if interaction.user is None or not interaction.guild:
         return False
-    if OWNER_ROLE_ID and any(r.id == OWNER_ROLE_ID for r in interaction.user.roles):
+    owner_role_id = config.settings().owner_role_id
+    if owner_role_id and any(r.id == owner_role_id for r in interaction.user.roles):
         return True
     # also allow guild owner and admins
     if interaction.user.id == interaction.guild.owner_id:
@@ -53,7 +74,7 @@ async def status(interaction: discord.Interaction):
     hours, mins = divmod(mins, 60)
     days, hours = divmod(hours, 24)
     human = (f"{days}d " if days else "") + (f"{hours}h " if hours else "") + (f"{mins}m {secs}s")
-    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=EMBED_COLOR)
+    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=config.settings().embed_color)
     embed.set_footer(text="Nuvix System • Connected")
     try:
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -67,6 +88,128 @@ async def status_error(interaction: discord.Interaction, error):
     else:
         await interaction.response.send_message("Unexpected error.", ephemeral=True)
 
+async def owner_check_error(interaction: discord.Interaction, error):
+    if isinstance(error, app_commands.CheckFailure):
+        msg = "You don't have permission to use this command."
+    else:
+        msg = "Unexpected error."
+    if interaction.response.is_done():
+        await interaction.followup.send(msg, ephemeral=True)
+    else:
+        await interaction.response.send_message(msg, ephemeral=True)
+
+def invoice_embed(inv: dict) -> discord.Embed:
+    embed = discord.Embed(
+        title=f"🧾 Invoice #{inv['id']:06d}",
+        description=f"**Customer:** <@{inv['customer_id']}>\n**Total:** {inv['amount_cents'] / 100:.2f} {inv['currency']}\n**Status:** {inv['status']}",
+        color=config.settings().embed_color,
+    )
+    embed.set_footer(text=config.settings().footer_text)
+    return embed
+
+async def invoice_file(inv: dict) -> discord.File:
+    page = await renderer.render(inv)
+    return discord.File(io.BytesIO(page.encode("utf-8")), filename=f"invoice_{inv['id']:06d}.html")
+
+@tree.command(name="invoice_create", description="Create an invoice for a customer (owner only).")
+@app_commands.describe(customer="Customer", description="What was sold", unit_price="Unit price (e.g. 4.99)",
+                       quantity="Quantity", currency="Currency code")
+@app_commands.check(lambda i: owner_only(i))
+async def invoice_create(interaction: discord.Interaction, customer: discord.Member, description: str,
+                         unit_price: float, quantity: int = 1, currency: str = "EUR"):
+    await interaction.response.defer(ephemeral=True)
+    try:
+        items = [{"description": description, "quantity": quantity, "unit_cents": to_cents(unit_price)}]
+        invoice_id = await ledger.acreate(customer.id, customer.display_name, items, currency.strip().upper(),
+                                          interaction.user.id)
+    except ValueError as e:
+        await interaction.followup.send(f"❌ {e}", ephemeral=True)
+        return
+    inv = await ledger.aget(invoice_id)
+    event_bus.bus().publish(event_bus.InvoiceCreated(inv["id"], inv["customer_id"], inv["amount_cents"], inv["currency"]))
+    await interaction.followup.send(embed=invoice_embed(inv), file=await invoice_file(inv), ephemeral=True)
+
+@tree.command(name="invoice_status", description="Record a status change for an invoice (owner only).")
+@app_commands.choices(status=[app_commands.Choice(name=s, value=s) for s in STATUSES])
+@app_commands.check(lambda i: owner_only(i))
+async def invoice_status(interaction: discord.Interaction, invoice_id: int, status: app_commands.Choice[str]):
+    try:
+        await ledger.aset_status(invoice_id, status.value, interaction.user.id)
+    except KeyError:
+        await interaction.response.send_message(f"Invoice #{invoice_id} not found.", ephemeral=True)
+        return
+    except ValueError as e:
+        await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+        return
+    event_bus.bus().publish(event_bus.INVOICE_STATUS, {"invoice_id": invoice_id, "status": status.value,
+                                                       "by": interaction.user.id})
+    inv = await ledger.aget(invoice_id)
+    await interaction.response.send_message(embed=invoice_embed(inv), ephemeral=True)
+
+@tree.command(name="invoice_view", description="Show an invoice and its rendered document (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def invoice_view(interaction: discord.Interaction, invoice_id: int):
+    inv = await ledger.aget(invoice_id)
+    if inv is None:
+        await interaction.response.send_message(f"Invoice #{invoice_id} not found.", ephemeral=True)
+        return
+    await interaction.response.defer(ephemeral=True)
+    await interaction.followup.send(embed=invoice_embed(inv), file=await invoice_file(inv), ephemeral=True)
+
+@tree.command(name="invoices_of", description="List the latest invoices of a customer (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def invoices_of(interaction: discord.Interaction, customer: discord.Member):
+    invoices = await ledger.aby_customer(customer.id, 15)
+    lines = [f"`#{inv['id']:06d}` {inv['amount_cents'] / 100:.2f} {inv['currency']} — {inv['status']}" for inv in invoices]
+    embed = discord.Embed(title=f"🧾 Invoices of {customer.display_name}",
+                          description="\n".join(lines) or "No invoices yet.", color=config.settings().embed_color)
+    embed.set_footer(text=config.settings().footer_text)
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+@tree.command(name="invoices_export", description="Export a month of invoices as CSV, JSONL or HTML pages (owner only).")
+@app_commands.choices(fmt=[app_commands.Choice(name="CSV", value="csv"), app_commands.Choice(name="JSONL", value="jsonl"),
+                           app_commands.Choice(name="HTML (zip)", value="zip")],
+                      status=[app_commands.Choice(name=s, value=s) for s in STATUSES])
+@app_commands.check(lambda i: owner_only(i))
+async def invoices_export(interaction: discord.Interaction, year: app_commands.Range[int, 1970, 9999],
+                          month: app_commands.Range[int, 1, 12],
+                          fmt: app_commands.Choice[str], status: app_commands.Choice[str] | None = None):
+    await interaction.response.defer(ephemeral=True)
+    start, end = month_range(year, month)
+    status_value = status.value if status else None
+    name = f"invoices_{year}-{month:02d}.{fmt.value}"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, name)
+        if fmt.value == "zip":
+            invoices = await ledger.arange(start, end, status_value)
+            pages = await renderer.render_many(invoices)
+            count = await asyncio.to_thread(write_pages_zip, path, invoices, pages)
+        else:
+            count = await ledger.aexport(path, start, end, fmt.value, status_value)
+        await interaction.followup.send(f"📦 Exported **{count}** invoices.", file=discord.File(path, filename=name), ephemeral=True)
+
+@tree.command(name="invoices_import", description="Create many invoices at once from a CSV file (owner only).")
+@app_commands.describe(file=f"CSV with the columns {', '.join(IMPORT_FIELDS)} (currency optional)")
+@app_commands.check(lambda i: owner_only(i))
+async def invoices_import(interaction: discord.Interaction, file: discord.Attachment):
+    await interaction.response.defer(ephemeral=True)
+    try:
+        rows = read_import((await file.read()).decode("utf-8-sig"))
+        for row in rows:
+            row["created_by"] = interaction.user.id
+        ids = await ledger.acreate_many(rows)  # one transaction: all rows or none
+    except ValueError as e:  # includes UnicodeDecodeError
+        await interaction.followup.send(f"❌ Nothing imported. {e}", ephemeral=True)
+        return
+    for invoice_id, row in zip(ids, rows):
+        amount = sum(it["quantity"] * it["unit_cents"] for it in row["items"])
+        event_bus.bus().publish(event_bus.InvoiceCreated(invoice_id, row["customer_id"], amount, row["currency"]))
+    await interaction.followup.send(f"🧾 Created **{len(ids)}** invoices (#{ids[0]:06d}–#{ids[-1]:06d})." if ids
+                                    else "The file has no invoices.", ephemeral=True)
+
+for _cmd in (invoice_create, invoice_status, invoice_view, invoices_of, invoices_export, invoices_import):
+    _cmd.error(owner_check_error)
+
 @bot.event
 async def on_ready():
     try:
@@ -78,12 +221,20 @@ async def on_ready():
 async def main():
     if not TOKEN:
         raise RuntimeError(f"Missing token env: NUVIX_INVOICES_TOKEN")
+    config_task = asyncio.create_task(config.watch())
+    await event_bus.bus().start("nuvix_invoices")
+    gateway_session.install(bot, "nuvix_invoices", on_shutdown=[event_bus.bus().stop])
     web_task = asyncio.create_task(run_web())
     bot_task = asyncio.create_task(bot.start(TOKEN))
-    await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    try:
+        await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        config_task.cancel()
+        renderer.shutdown()
+        ledger.close()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        runtime.run(main())
     except KeyboardInterrupt:
         pass
@@ -0,0 +1,403 @@
+# ==================================================
+# Nuvix Invoices — Ledger
+# Append-only SQLite ledger, process-pool rendering and streamed bulk export
+# ==================================================
+
+import asyncio
+import calendar
+import csv
+import html
+import io
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import serialization
+
+STATUSES = ("open", "paid", "void", "refunded")
+# Status changes the ledger accepts; void and refunded are final.
+TRANSITIONS = {"open": ("paid", "void"), "paid": ("refunded",), "void": (), "refunded": ()}
+IMPORT_FIELDS = ("customer_id", "customer_name", "description", "quantity", "unit_price", "currency")
+_CURRENCY = re.compile(r"^[A-Z]{3}$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS invoices (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    customer_id   INTEGER NOT NULL,
+    customer_name TEXT    NOT NULL,
+    currency      TEXT    NOT NULL,
+    amount_cents  INTEGER NOT NULL,
+    items         TEXT    NOT NULL,
+    created_by    INTEGER,
+    created_at    REAL    NOT NULL
+);
+CREATE TABLE IF NOT EXISTS invoice_events (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    invoice_id INTEGER NOT NULL REFERENCES invoices(id),
+    status     TEXT    NOT NULL,
+    actor_id   INTEGER,
+    at         REAL    NOT NULL
+);
+-- Current status projection (kept in the same transaction as the event).
+CREATE TABLE IF NOT EXISTS invoice_state (
+    invoice_id INTEGER PRIMARY KEY REFERENCES invoices(id),
+    status     TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_invoices_customer ON invoices(customer_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_invoices_created ON invoices(created_at);
+CREATE INDEX IF NOT EXISTS idx_events_invoice ON invoice_events(invoice_id, at);
+CREATE INDEX IF NOT EXISTS idx_state_status ON invoice_state(status, updated_at);
+CREATE TRIGGER IF NOT EXISTS invoices_no_update BEFORE UPDATE ON invoices
+    BEGIN SELECT RAISE(ABORT, 'invoice ledger is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS invoices_no_delete BEFORE DELETE ON invoices
+    BEGIN SELECT RAISE(ABORT, 'invoice ledger is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS events_no_update BEFORE UPDATE ON invoice_events
+    BEGIN SELECT RAISE(ABORT, 'invoice ledger is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS events_no_delete BEFORE DELETE ON invoice_events
+    BEGIN SELECT RAISE(ABORT, 'invoice ledger is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS state_transitions BEFORE UPDATE OF status ON invoice_state
+    WHEN NOT (%s)
+    BEGIN SELECT RAISE(ABORT, 'invalid invoice status transition'); END;
+""" % " OR ".join(f"(OLD.status = '{a}' AND NEW.status = '{b}')" for a, bs in TRANSITIONS.items() for b in bs)
+
+_SELECT = """
+SELECT i.id, i.customer_id, i.customer_name, i.currency, i.amount_cents, i.items,
+       i.created_by, i.created_at, s.status, s.updated_at
+FROM invoices i JOIN invoice_state s ON s.invoice_id = i.id
+"""
+
+EXPORT_FIELDS = ("id", "customer_id", "customer_name", "currency", "amount", "status", "created_at", "updated_at", "items")
+
+
+def _row_to_dict(row) -> dict:
+    return {
+        "id": row[0],
+        "customer_id": row[1],
+        "customer_name": row[2],
+        "currency": row[3],
+        "amount_cents": row[4],
+        "items": serialization.loads(row[5]),
+        "created_by": row[6],
+        "created_at": row[7],
+        "status": row[8],
+        "updated_at": row[9],
+    }
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def to_cents(price: float) -> int:
+    """4.99 → 499. Rejects NaN, infinities and anything that isn't at least one cent."""
+    if not math.isfinite(price) or round(price * 100) < 1:
+        raise ValueError(f"Invalid unit price: {price}")
+    return round(price * 100)
+
+
+def validate_invoice(items: list[dict], currency: str):
+    """Raise ValueError unless ``currency`` is a 3-letter code and every item has a whole
+    quantity ≥ 1 and a whole unit price ≥ 1 cent."""
+    if not isinstance(currency, str) or not _CURRENCY.match(currency):
+        raise ValueError(f"Invalid currency: {currency!r} (expected a 3-letter code like EUR)")
+    if not items:
+        raise ValueError("An invoice needs at least one item")
+    for it in items:
+        quantity, unit = it.get("quantity", 1), it.get("unit_cents")
+        if isinstance(quantity, bool) or not isinstance(quantity, int) or quantity < 1:
+            raise ValueError(f"Invalid quantity: {quantity!r}")
+        if isinstance(unit, bool) or not isinstance(unit, int) or unit < 1:
+            raise ValueError(f"Invalid unit price: {unit!r} cents")
+
+
+def check_status(status: str | None):
+    if status is not None and status not in STATUSES:
+        raise ValueError(f"Unknown status: {status}")
+
+
+def read_import(text: str) -> list[dict]:
+    """CSV with a header row of :data:`IMPORT_FIELDS` (currency optional, EUR by default)
+    → rows for :meth:`InvoiceLedger.create_many`. Raises ValueError naming the bad line."""
+    reader = csv.DictReader(io.StringIO(text))
+    missing = [f for f in IMPORT_FIELDS[:-1] if f not in (reader.fieldnames or ())]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    rows = []
+    for line, rec in enumerate(reader, start=2):
+        try:
+            items = [{"description": rec["description"].strip(), "quantity": int(rec["quantity"]),
+                      "unit_cents": to_cents(float(rec["unit_price"]))}]
+            currency = (rec.get("currency") or "EUR").strip().upper()
+            validate_invoice(items, currency)
+            rows.append({"customer_id": int(rec["customer_id"]), "customer_name": rec["customer_name"].strip(),
+                         "items": items, "currency": currency})
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Line {line}: {e}") from None
+    return rows
+
+
+def month_range(year: int, month: int) -> tuple[float, float]:
+    start = datetime(year, month, 1, tzinfo=timezone.utc).timestamp()
+    return start, start + calendar.monthrange(year, month)[1] * 86400  # no datetime for 10000-01
+
+# ==============================
+# 🗄 Ledger
+# ==============================
+class InvoiceLedger:
+    """SQLite-backed ledger. Sync methods do the work; ``a*`` wrappers run them off the event loop."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ---- writes ----
+    @staticmethod
+    def _insert(cur, customer_id, customer_name, items, currency, created_by, now) -> int:
+        validate_invoice(items, currency)
+        amount = sum(int(it.get("quantity", 1)) * int(it["unit_cents"]) for it in items)
+        cur.execute(
+            "INSERT INTO invoices (customer_id, customer_name, currency, amount_cents, items, created_by, created_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (customer_id, customer_name, currency, amount, serialization.dumps(items), created_by, now),
+        )
+        invoice_id = cur.lastrowid
+        cur.execute("INSERT INTO invoice_events (invoice_id, status, actor_id, at) VALUES (?, 'open', ?, ?)",
+                    (invoice_id, created_by, now))
+        cur.execute("INSERT INTO invoice_state (invoice_id, status, updated_at) VALUES (?, 'open', ?)",
+                    (invoice_id, now))
+        return invoice_id
+
+    def _transaction(self, fn):
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(cur)
+                cur.execute("COMMIT")
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+        return result
+
+    def create(self, customer_id: int, customer_name: str, items: list[dict],
+               currency: str = "EUR", created_by: int | None = None, now: float | None = None) -> int:
+        """Append a new invoice. ``items`` = [{"description": str, "quantity": int, "unit_cents": int}]."""
+        now = time.time() if now is None else now
+        return self._transaction(lambda cur: self._insert(cur, customer_id, customer_name, items, currency, created_by, now))
+
+    def create_many(self, rows: list[dict]) -> list[int]:
+        """Bulk append in one transaction (rows take the same keys as :meth:`create`); all or
+        nothing. Returns the new invoice ids."""
+        now = time.time()
+
+        def insert_all(cur):
+            return [self._insert(cur, r["customer_id"], r["customer_name"], r["items"], r.get("currency", "EUR"),
+                                 r.get("created_by"), r.get("now", now))
+                    for r in rows]
+
+        return self._transaction(insert_all)
+
+    def set_status(self, invoice_id: int, status: str, actor_id: int | None = None, now: float | None = None):
+        """Record a status change allowed by :data:`TRANSITIONS`. KeyError for an unknown
+        invoice, ValueError for any other change (e.g. void → paid)."""
+        check_status(status)
+        now = time.time() if now is None else now
+
+        def append(cur):
+            row = cur.execute("SELECT status FROM invoice_state WHERE invoice_id = ?", (invoice_id,)).fetchone()
+            if row is None:
+                raise KeyError(invoice_id)
+            if status not in TRANSITIONS[row[0]]:
+                raise ValueError(f"Invoice #{invoice_id} is {row[0]}: it can't become {status}")
+            cur.execute("INSERT INTO invoice_events (invoice_id, status, actor_id, at) VALUES (?, ?, ?, ?)",
+                        (invoice_id, status, actor_id, now))
+            cur.execute("UPDATE invoice_state SET status = ?, updated_at = ? WHERE invoice_id = ?",
+                        (status, now, invoice_id))
+
+        self._transaction(append)
+
+    # ---- reads ----
+    def get(self, invoice_id: int) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(_SELECT + " WHERE i.id = ?", (invoice_id,)).fetchone()
+        return _row_to_dict(row) if row else None
+
+    def by_customer(self, customer_id: int, limit: int = 25) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                _SELECT + " WHERE i.customer_id = ? ORDER BY i.created_at DESC LIMIT ?", (customer_id, limit)
+            ).fetchall()
+        return [_row_to_dict(r) for r in rows]
+
+    def by_status(self, status: str, limit: int = 25) -> list[dict]:
+        check_status(status)
+        with self._lock:
+            rows = self._conn.execute(
+                _SELECT + " WHERE s.status = ? ORDER BY s.updated_at DESC LIMIT ?", (status, limit)
+            ).fetchall()
+        return [_row_to_dict(r) for r in rows]
+
+    def history(self, invoice_id: int) -> list[tuple[str, int | None, float]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT status, actor_id, at FROM invoice_events WHERE invoice_id = ? ORDER BY at, id", (invoice_id,)
+            ).fetchall()
+
+    def iter_range(self, start: float, end: float, status: str | None = None, batch: int = 500):
+        """Yield invoices created in [start, end) in id order, ``batch`` rows per query (keyset pagination)."""
+        check_status(status)
+        last_id = 0
+        while True:
+            sql = _SELECT + " WHERE i.created_at >= ? AND i.created_at < ? AND i.id > ?"
+            args = [start, end, last_id]
+            if status:
+                sql += " AND s.status = ?"
+                args.append(status)
+            sql += " ORDER BY i.id LIMIT ?"
+            args.append(batch)
+            with self._lock:
+                rows = self._conn.execute(sql, args).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield _row_to_dict(row)
+            last_id = rows[-1][0]
+
+    # ---- export ----
+    def export(self, path, start: float, end: float, fmt: str = "csv", status: str | None = None) -> int:
+        """Stream invoices in [start, end) to ``path`` as CSV or JSONL. Returns the row count."""
+        if fmt not in ("csv", "jsonl"):
+            raise ValueError(f"Unknown export format: {fmt}")
+        check_status(status)
+        count = 0
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f) if fmt == "csv" else None
+            if writer:
+                writer.writerow(EXPORT_FIELDS)
+            for inv in self.iter_range(start, end, status):
+                record = {
+                    "id": inv["id"],
+                    "customer_id": inv["customer_id"],
+                    "customer_name": inv["customer_name"],
+                    "currency": inv["currency"],
+                    "amount": f"{inv['amount_cents'] / 100:.2f}",
+                    "status": inv["status"],
+                    "created_at": _iso(inv["created_at"]),
+                    "updated_at": _iso(inv["updated_at"]),
+                    "items": serialization.dumps(inv["items"]),
+                }
+                if writer:
+                    writer.writerow([record[k] for k in EXPORT_FIELDS])
+                else:
+                    record["items"] = inv["items"]
+                    f.write(serialization.dumps(record))
+                    f.write("\n")
+                count += 1
+        return count
+
+    # ---- async wrappers (keep sqlite off the event loop) ----
+    async def acreate(self, *args, **kwargs) -> int:
+        return await asyncio.to_thread(self.create, *args, **kwargs)
+
+    async def acreate_many(self, rows: list[dict]) -> list[int]:
+        return await asyncio.to_thread(self.create_many, rows)
+
+    async def aset_status(self, *args, **kwargs):
+        return await asyncio.to_thread(self.set_status, *args, **kwargs)
+
+    async def aget(self, invoice_id: int):
+        return await asyncio.to_thread(self.get, invoice_id)
+
+    async def aby_customer(self, customer_id: int, limit: int = 25):
+        return await asyncio.to_thread(self.by_customer, customer_id, limit)
+
+    async def aexport(self, *args, **kwargs) -> int:
+        return await asyncio.to_thread(self.export, *args, **kwargs)
+
+    async def arange(self, start: float, end: float, status: str | None = None) -> list[dict]:
+        return await asyncio.to_thread(lambda: list(self.iter_range(start, end, status)))
+
+# ==============================
+# 🖨 Rendering (process pool)
+# ==============================
+def render_invoice(inv: dict, footer: str = "Nuvix Market • Your wishes, more cheap!") -> str:
+    """Render one invoice as a self-contained HTML document. Pure function, safe to run in a worker process."""
+    esc = html.escape
+    rows = "".join(
+        f"<tr><td>{esc(str(it.get('description', '')))}</td><td>{int(it.get('quantity', 1))}</td>"
+        f"<td>{int(it['unit_cents']) / 100:.2f}</td><td>{int(it.get('quantity', 1)) * int(it['unit_cents']) / 100:.2f}</td></tr>"
+        for it in inv["items"]
+    )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<title>Invoice #{inv['id']:06d}</title>"
+        "<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;width:100%}"
+        "td,th{border:1px solid #ccc;padding:6px;text-align:left}.total{font-weight:bold}</style></head><body>"
+        f"<h1>Invoice #{inv['id']:06d}</h1>"
+        f"<p>Customer: {esc(inv['customer_name'])} ({inv['customer_id']})<br>"
+        f"Date: {_iso(inv['created_at'])} UTC<br>Status: {esc(inv['status'])}</p>"
+        "<table><tr><th>Description</th><th>Qty</th><th>Unit</th><th>Total</th></tr>"
+        f"{rows}<tr class='total'><td colspan='3'>Total ({esc(inv['currency'])})</td>"
+        f"<td>{inv['amount_cents'] / 100:.2f}</td></tr></table>"
+        f"<p><small>{esc(footer)}</small></p></body></html>"
+    )
+
+
+def render_batch(invoices: list[dict], footer: str) -> list[str]:
+    return [render_invoice(inv, footer) for inv in invoices]
+
+
+def write_pages_zip(path, invoices: list[dict], pages: list[str]) -> int:
+    """One ``invoice_<id>.html`` per rendered page in a zip archive (month-end HTML export)."""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for inv, page in zip(invoices, pages):
+            zf.writestr(f"invoice_{inv['id']:06d}.html", page)
+    return len(pages)
+
+
+class InvoiceRenderer:
+    """Runs :func:`render_invoice` in a process pool so large batches never block the loop."""
+
+    def __init__(self, workers: int | None = None, footer: str = "Nuvix Market • Your wishes, more cheap!"):
+        self.workers = workers
+        self.footer = footer
+        self._pool = None
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    async def render(self, inv: dict) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(), render_invoice, inv, self.footer)
+
+    async def render_many(self, invoices: list[dict], chunk: int = 200) -> list[str]:
+        """Render in chunks (one IPC round-trip per chunk) and keep input order."""
+        loop = asyncio.get_running_loop()
+        batches = [invoices[i:i + chunk] for i in range(0, len(invoices), chunk)]
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self._executor(), render_batch, b, self.footer) for b in batches)
+        )
+        return [page for batch in results for page in batch]
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
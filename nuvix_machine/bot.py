@@ -1,13 +1,26 @@
-import os, time, asyncio
+import os, sys, time, asyncio, hmac, ipaddress
 from aiohttp import web
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+# Sibling modules live next to bot.py, shared ones (config, utils) in the repo root.
+# main.py exec()s this file from the repo root (no __file__).
+BOT_DIR = os.path.dirname(os.path.abspath(globals().get("__file__") or os.path.join("nuvix_machine", "bot.py")))
+ROOT_DIR = os.path.dirname(BOT_DIR)
+for _path in (ROOT_DIR, BOT_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import config
+import event_bus
+import gateway_session
+import runtime
+
+from telemetry import METRICS, TelemetryCollector
+
 BOT_NAME = "Nuvix Machine"
-TOKEN = os.getenv("NUVIX_MACHINE_TOKEN")
-OWNER_ROLE_ID = int(os.getenv("OWNER_ROLE_ID", "0"))
-EMBED_COLOR = int(os.getenv("EMBED_COLOR_HEX", "0xE91E63"), 16)  # default Nuvix pink
+TOKEN = config.settings().token("nuvix_machine")
 
 UPTIME = time.time()
 
@@ -18,15 +31,59 @@ intents.members = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 tree = bot.tree
 
+collector = TelemetryCollector(
+    interval=config.settings().get_float("TELEMETRY_INTERVAL", 5),
+    self_name="nuvix_machine",
+    bot_dirs={name: os.path.join(ROOT_DIR, name) for name in config.BOT_TOKENS},
+)
+
+@event_bus.bus().subscribe(event_bus.LOOP_LAG)
+def on_loop_lag(event):
+    collector.report_lag(event.payload["pid"], event.payload["lag_ms"])
+
 async def health_handler(request):
     alive = int(time.time() - UPTIME)
     return web.Response(text=f"Nuvix Machine connected | alive {alive}s")
 
+def check_telemetry_access(request):
+    """/telemetry exposes process details: with TELEMETRY_TOKEN set it needs
+    ``Authorization: Bearer <token>``, otherwise it only answers on localhost."""
+    token = config.settings().get("TELEMETRY_TOKEN")
+    if token:
+        given = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(given.encode(), token.encode()):
+            raise web.HTTPUnauthorized()
+        return
+    try:
+        local = ipaddress.ip_address(request.remote or "").is_loopback
+    except ValueError:
+        local = False
+    if not local:
+        raise web.HTTPForbidden(text="set TELEMETRY_TOKEN to read telemetry remotely")
+
+async def telemetry_handler(request):
+    check_telemetry_access(request)
+    return web.json_response({"interval": collector.interval, "host": collector.host,
+                              "sample_cost_ms": collector.sample_cost_ms, "processes": collector.snapshot()})
+
+async def telemetry_history_handler(request):
+    check_telemetry_access(request)
+    name, metric = request.match_info["name"], request.match_info["metric"]
+    if name not in collector.series or metric not in METRICS:
+        raise web.HTTPNotFound()
+    tier = int(request.query.get("tier", "0"))
+    if not 0 <= tier < len(collector.tiers):
+        raise web.HTTPBadRequest(text="unknown tier")
+    return web.json_response({"name": name, "metric": metric, "tier": tier,
+                              "points": collector.history(name, metric, tier)})
+
 async def run_web():
     app = web.Application()
     app.router.add_get("/", health_handler)
     app.router.add_get("/health", health_handler)
-    port = int(os.getenv("PORT", "10000"))
+    app.router.add_get("/telemetry", telemetry_handler)
+    app.router.add_get("/telemetry/{name}/{metric}", telemetry_history_handler)
+    port = config.settings().port
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
@@ -37,7 +94,8 @@ async def run_web():
 def owner_only(interaction: discord.Interaction) -> bool:
     if interaction.user is None or not interaction.guild:
         return False
-    if OWNER_ROLE_ID and any(r.id == OWNER_ROLE_ID for r in interaction.user.roles):
+    owner_role_id = config.settings().owner_role_id
+    if owner_role_id and any(r.id == owner_role_id for r in interaction.user.roles):
         return True
     # also allow guild owner and admins
     if interaction.user.id == interaction.guild.owner_id:
@@ -53,7 +111,7 @@ async def status(interaction: discord.Interaction):
     hours, mins = divmod(mins, 60)
     days, hours = divmod(hours, 24)
     human = (f"{days}d " if days else "") + (f"{hours}h " if hours else "") + (f"{mins}m {secs}s")
-    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=EMBED_COLOR)
+    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=config.settings().embed_color)
     embed.set_footer(text="Nuvix System • Connected")
     try:
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -67,6 +125,37 @@ async def status_error(interaction: discord.Interaction, error):
     else:
         await interaction.response.send_message("Unexpected error.", ephemeral=True)
 
+def _fmt(value, unit="") -> str:
+    return "—" if value is None or value < 0 else f"{value:g}{unit}"
+
+@tree.command(name="machine", description="Show CPU, memory, file descriptors and loop lag of every bot (owner only).")
+@app_commands.describe(sort="Metric to sort by")
+@app_commands.choices(sort=[app_commands.Choice(name=m, value=m) for m in METRICS])
+@app_commands.check(lambda i: owner_only(i))
+async def machine(interaction: discord.Interaction, sort: app_commands.Choice[str] | None = None):
+    snap = collector.snapshot()
+    key = sort.value if sort else "rss_mb"
+    rows = sorted(snap.items(), key=lambda kv: kv[1].get(key) or 0, reverse=True)
+    lines = [
+        f"`{name:<18}` CPU {_fmt(m['cpu'], '%')} · RSS {_fmt(m['rss_mb'], ' MB')} · fds {_fmt(m['fds'])}"
+        + (f" · lag {_fmt(m['lag_ms'], ' ms')}" if m.get("lag_ms") is not None else "")
+        for name, m in rows
+    ]
+    host = collector.host
+    if host:
+        used = (host["mem_total"] - host["mem_available"]) / 1048576
+        lines.append(f"\n🖥 **Host:** load {host['load1']:.2f} · mem {used:.0f}/{host['mem_total'] / 1048576:.0f} MB")
+    embed = discord.Embed(title="📈 Machine telemetry", description="\n".join(lines) or "No samples yet.", color=config.settings().embed_color)
+    embed.set_footer(text=f"Nuvix Machine • every {collector.interval:g}s • sample cost {collector.sample_cost_ms:.2f} ms")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+@machine.error
+async def machine_error(interaction: discord.Interaction, error):
+    if isinstance(error, app_commands.CheckFailure):
+        await interaction.response.send_message("You don't have permission to use this command.", ephemeral=True)
+    else:
+        await interaction.response.send_message("Unexpected error.", ephemeral=True)
+
 @bot.event
 async def on_ready():
     try:
@@ -78,12 +167,19 @@ async def on_ready():
 async def main():
     if not TOKEN:
         raise RuntimeError(f"Missing token env: NUVIX_MACHINE_TOKEN")
+    collector.start()
+    config_task = asyncio.create_task(config.watch())
+    await event_bus.bus().start("nuvix_machine")
+    gateway_session.install(bot, "nuvix_machine", on_shutdown=[collector.stop, event_bus.bus().stop])
     web_task = asyncio.create_task(run_web())
     bot_task = asyncio.create_task(bot.start(TOKEN))
-    await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    try:
+        await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        config_task.cancel()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        runtime.run(main())
     except KeyboardInterrupt:
         pass
@@ -0,0 +1,279 @@
+# ==================================================
+# Nuvix Machine — Telemetry
+# /proc sampling of the whole suite into fixed-size, downsampled ring buffers
+# ==================================================
+
+import asyncio
+import os
+import time
+from array import array
+
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+METRICS = ("cpu", "rss_mb", "fds", "lag_ms")
+
+# ==============================
+# 🔁 Ring buffers
+# ==============================
+class RingBuffer:
+    """Preallocated circular buffer of (timestamp, value) doubles — no per-sample allocation."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._ts = array("d", bytes(8 * size))
+        self._val = array("d", bytes(8 * size))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, ts: float, value: float):
+        self._ts[self._next] = ts
+        self._val[self._next] = value
+        self._next = (self._next + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+
+    def last(self):
+        if not self._count:
+            return None
+        i = (self._next - 1) % self.size
+        return self._ts[i], self._val[i]
+
+    def items(self) -> list[tuple[float, float]]:
+        """Oldest → newest."""
+        start = (self._next - self._count) % self.size
+        return [(self._ts[(start + k) % self.size], self._val[(start + k) % self.size]) for k in range(self._count)]
+
+
+class DownsampledSeries:
+    """A raw ring plus coarser rings fed with the average of every ``factor`` raw samples.
+
+    ``tiers`` = [(factor, size), ...]; factor 1 is the raw tier."""
+
+    def __init__(self, tiers=((1, 120), (12, 360), (144, 336))):
+        self.tiers = [(factor, RingBuffer(size)) for factor, size in tiers]
+        self._acc = [[0.0, 0] for _ in self.tiers]
+
+    def append(self, ts: float, value: float):
+        for (factor, ring), acc in zip(self.tiers, self._acc):
+            if factor == 1:
+                ring.append(ts, value)
+                continue
+            acc[0] += value
+            acc[1] += 1
+            if acc[1] >= factor:
+                ring.append(ts, acc[0] / acc[1])
+                acc[0], acc[1] = 0.0, 0
+
+    def last(self):
+        return self.tiers[0][1].last()
+
+    def history(self, tier: int = 0) -> list[tuple[float, float]]:
+        return self.tiers[tier][1].items()
+
+# ==============================
+# 🔍 /proc readers
+# ==============================
+def read_proc_stat(pid: int) -> tuple[int, int]:
+    """(cpu ticks used, rss bytes) from /proc/<pid>/stat."""
+    with open(f"/proc/{pid}/stat", "rb") as f:
+        data = f.read()
+    # comm may contain spaces/parens; fields resume after the last ')'
+    fields = data[data.rindex(b")") + 2:].split()
+    utime, stime = int(fields[11]), int(fields[12])
+    rss_pages = int(fields[21])
+    return utime + stime, rss_pages * PAGE_SIZE
+
+
+def count_fds(pid: int) -> int:
+    try:
+        return len(os.listdir(f"/proc/{pid}/fd"))
+    except PermissionError:
+        return -1
+
+
+def read_ppid(pid: int) -> int:
+    with open(f"/proc/{pid}/stat", "rb") as f:
+        data = f.read()
+    return int(data[data.rindex(b")") + 2:].split()[1])
+
+
+def read_cmdline(pid: int) -> list[str]:
+    with open(f"/proc/{pid}/cmdline", "rb") as f:
+        return f.read().decode("utf-8", "replace").split("\0")
+
+
+def identify_bot(pid: int, bot_dirs: dict[str, str]) -> str | None:
+    """Which bot ``pid`` runs, from the path of its bot.py: main.py passes the absolute
+    path, a Procfile runs ``python bot.py`` from inside the bot's directory."""
+    args = read_cmdline(pid)
+    for name, path in bot_dirs.items():
+        script = os.path.join(path, "bot.py")
+        if any(script in arg for arg in args):
+            return name
+    if "bot.py" in args:
+        cwd = os.path.realpath(f"/proc/{pid}/cwd")
+        for name, path in bot_dirs.items():
+            if os.path.realpath(path) == cwd:
+                return name
+    return None
+
+
+def read_host() -> dict:
+    mem = {}
+    with open("/proc/meminfo") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("MemTotal", "MemAvailable"):
+                mem[key] = int(rest.split()[0]) * 1024
+    with open("/proc/loadavg") as f:
+        load1 = float(f.read().split()[0])
+    return {"mem_total": mem.get("MemTotal", 0), "mem_available": mem.get("MemAvailable", 0), "load1": load1}
+
+
+def discover_suite(bot_dirs: dict[str, str], self_pid: int | None = None) -> dict[str, int]:
+    """Map bot name → pid for every sibling launched by the same parent (main.py).
+    ``bot_dirs`` maps bot name → its directory.
+
+    When the bot was started on its own (Procfile / start_all.bat) only itself is returned."""
+    self_pid = self_pid or os.getpid()
+    parent = read_ppid(self_pid)
+    found = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        pid = int(entry)
+        try:
+            if pid != self_pid and read_ppid(pid) != parent:
+                continue
+            name = identify_bot(pid, bot_dirs)
+        except (FileNotFoundError, ProcessLookupError, PermissionError, ValueError):
+            continue
+        if name:
+            found[name] = pid
+    if self_pid not in found.values():
+        found["self"] = self_pid
+    return found
+
+# ==============================
+# 📡 Collector
+# ==============================
+class TelemetryCollector:
+    """Samples CPU %, RSS, open fds for each suite process every ``interval`` seconds.
+    Event-loop lag is measured here for this process and taken from :meth:`report_lag`
+    (fed by the other bots over the event bus) for the rest."""
+
+    def __init__(self, interval: float = 5.0, rediscover_every: int = 12, tiers=None, self_name: str = "self",
+                 bot_dirs: dict[str, str] | None = None, lag_timeout: float = 30.0):
+        self.interval = interval
+        self.bot_dirs = bot_dirs or {}
+        self.lag_timeout = lag_timeout
+        self.rediscover_every = rediscover_every
+        self.tiers = tiers or ((1, 120), (12, 360), (144, 336))
+        self.self_name = self_name
+        self.series: dict[str, dict[str, DownsampledSeries]] = {}
+        self.host: dict = {}
+        self.pids: dict[str, int] = {}
+        self._prev: dict[int, tuple[float, int]] = {}
+        self._samples = 0
+        self._lag_ms = 0.0
+        self._reported_lag: dict[int, tuple[float, float]] = {}  # pid -> (monotonic time, lag ms)
+        self._task = None
+        self.sample_cost_ms = 0.0
+
+    def _series(self, name: str) -> dict[str, DownsampledSeries]:
+        s = self.series.get(name)
+        if s is None:
+            s = self.series[name] = {m: DownsampledSeries(self.tiers) for m in METRICS}
+        return s
+
+    def report_lag(self, pid: int, lag_ms: float):
+        self._reported_lag[pid] = (time.monotonic(), lag_ms)
+
+    def _lag_for(self, pid: int, wall: float) -> float | None:
+        if pid == os.getpid():
+            return self._lag_ms
+        reported = self._reported_lag.get(pid)
+        # no report for a while (bot stuck or bus down): record nothing rather than old data
+        if reported is None or wall - reported[0] > self.lag_timeout:
+            return None
+        return reported[1]
+
+    def rediscover(self):
+        pids = discover_suite(self.bot_dirs)
+        me = os.getpid()
+        self.pids = {(self.self_name if pid == me else name): pid for name, pid in pids.items()}
+
+    def sample(self, now: float | None = None):
+        """Take one sample of every known process. Cheap: two small /proc reads + one listdir per pid."""
+        started = time.perf_counter()
+        if self._samples % self.rediscover_every == 0 or not self.pids:
+            self.rediscover()
+        self._samples += 1
+        now = time.time() if now is None else now
+        wall = time.monotonic()
+        for name, pid in list(self.pids.items()):
+            try:
+                ticks, rss = read_proc_stat(pid)
+                fds = count_fds(pid)
+            except (FileNotFoundError, ProcessLookupError):
+                self.pids.pop(name, None)
+                self._prev.pop(pid, None)
+                self._reported_lag.pop(pid, None)
+                continue
+            prev = self._prev.get(pid)
+            self._prev[pid] = (wall, ticks)
+            cpu = 0.0
+            if prev is not None and wall > prev[0]:
+                cpu = 100.0 * (ticks - prev[1]) / CLK_TCK / (wall - prev[0])
+            s = self._series(name)
+            s["cpu"].append(now, cpu)
+            s["rss_mb"].append(now, rss / 1048576)
+            s["fds"].append(now, fds)
+            lag = self._lag_for(pid, wall)
+            if lag is not None:
+                s["lag_ms"].append(now, lag)
+        try:
+            self.host = read_host()
+        except OSError:
+            self.host = {}
+        self.sample_cost_ms = (time.perf_counter() - started) * 1000
+
+    def snapshot(self) -> dict:
+        """Latest value of every metric, per process."""
+        out = {}
+        for name, series in self.series.items():
+            if name not in self.pids:
+                continue
+            out[name] = {"pid": self.pids[name]}
+            for metric, s in series.items():
+                last = s.last()
+                out[name][metric] = None if last is None else round(last[1], 2)
+        return out
+
+    def history(self, name: str, metric: str, tier: int = 0) -> list[tuple[float, float]]:
+        return self.series[name][metric].history(tier)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            # how late the loop woke us up = event-loop lag
+            self._lag_ms = max(0.0, (loop.time() - expected) * 1000)
+            self.sample()
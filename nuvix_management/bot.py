@@ -1,13 +1,26 @@
-import os, time, asyncio
+import os, sys, time, asyncio
 from aiohttp import web
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+# Sibling modules live next to bot.py, shared ones (config, utils) in the repo root.
+# main.py exec()s this file from the repo root (no __file__).
+BOT_DIR = os.path.dirname(os.path.abspath(globals().get("__file__") or os.path.join("nuvix_management", "bot.py")))
+ROOT_DIR = os.path.dirname(BOT_DIR)
+for _path in (ROOT_DIR, BOT_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import config
+import event_bus
+import gateway_session
+import runtime
+
+from bulk_ops import BulkExecutor, CheckpointStore, RateLimited, plan, progress_bar
+
 BOT_NAME = "Nuvix Management"
-TOKEN = os.getenv("NUVIX_MANAGEMENT_TOKEN")
-OWNER_ROLE_ID = int(os.getenv("OWNER_ROLE_ID", "0"))
-EMBED_COLOR = int(os.getenv("EMBED_COLOR_HEX", "0xE91E63"), 16)  # default Nuvix pink
+TOKEN = config.settings().token("nuvix_management")
 
 UPTIME = time.time()
 
@@ -18,6 +31,25 @@ intents.members = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 tree = bot.tree
 
+async def apply_change(job, member_id: int):
+    reason = f"Bulk job {job.id} by {job.requested_by}"
+    try:
+        if job.op == "add_role":
+            await bot.http.add_role(job.guild_id, member_id, job.role_id, reason=reason)
+        else:
+            await bot.http.remove_role(job.guild_id, member_id, job.role_id, reason=reason)
+    except discord.HTTPException as e:
+        if e.status == 429:
+            retry_after = float(e.response.headers.get("Retry-After", "1")) if e.response is not None else 1.0
+            raise RateLimited(retry_after)
+        raise
+
+executor = BulkExecutor(
+    CheckpointStore(config.settings().get("BULK_JOBS_DIR", os.path.join(ROOT_DIR, "data", "bulk_jobs"))),
+    apply_change,
+    checkpoint_every=config.settings().get_int("BULK_CHECKPOINT_EVERY", 25),
+)
+
 async def health_handler(request):
     alive = int(time.time() - UPTIME)
     return web.Response(text=f"Nuvix Management connected | alive {alive}s")
@@ -26,7 +58,7 @@ async def run_web():
     app = web.Application()
     app.router.add_get("/", health_handler)
     app.router.add_get("/health", health_handler)
-    port = int(os.getenv("PORT", "10000"))
+    port = config.settings().port
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
@@ -37,7 +69,8 @@ async def run_web():
 def owner_only(interaction: discord.Interaction) -> bool:
     if interaction.user is None or not interaction.guild:
         return False
-    if OWNER_ROLE_ID and any(r.id == OWNER_ROLE_ID for r in interaction.user.roles):
+    owner_role_id = config.settings().owner_role_id
+    if owner_role_id and any(r.id == owner_role_id for r in interaction.user.roles):
         return True
     # also allow guild owner and admins
     if interaction.user.id == interaction.guild.owner_id:
@@ -53,7 +86,7 @@ async def status(interaction: discord.Interaction):
     hours, mins = divmod(mins, 60)
     days, hours = divmod(hours, 24)
     human = (f"{days}d " if days else "") + (f"{hours}h " if hours else "") + (f"{mins}m {secs}s")
-    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=EMBED_COLOR)
+    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=config.settings().embed_color)
     embed.set_footer(text="Nuvix System • Connected")
     try:
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -67,6 +100,84 @@ async def status_error(interaction: discord.Interaction, error):
     else:
         await interaction.response.send_message("Unexpected error.", ephemeral=True)
 
+async def owner_check_error(interaction: discord.Interaction, error):
+    if isinstance(error, app_commands.CheckFailure):
+        msg = "You don't have permission to use this command."
+    else:
+        msg = "Unexpected error."
+    if interaction.response.is_done():
+        await interaction.followup.send(msg, ephemeral=True)
+    else:
+        await interaction.response.send_message(msg, ephemeral=True)
+
+def job_embed(job, limiter=None) -> discord.Embed:
+    done, total = job.progress
+    verb = "Adding" if job.op == "add_role" else "Removing"
+    desc = (f"{verb} <@&{job.role_id}> — **{done}/{total}**\n`{progress_bar(done, total)}`\n"
+            f"✅ {len(job.done)} · ❌ {len(job.failed)} · status **{job.status}**")
+    if limiter is not None:
+        desc += f"\n⚙️ concurrency {limiter.limit} ({limiter.in_flight} in flight)"
+    embed = discord.Embed(title=f"🧰 Bulk job `{job.id}`", description=desc, color=config.settings().embed_color)
+    embed.set_footer(text="Nuvix Management")
+    return embed
+
+async def update_progress(job, limiter):
+    channel = bot.get_channel(job.channel_id) if job.channel_id else None
+    if channel is None or job.message_id is None:
+        return
+    await channel.get_partial_message(job.message_id).edit(embed=job_embed(job, limiter))
+
+@tree.command(name="bulk_role", description="Add or remove a role for many members at once (owner only).")
+@app_commands.describe(role="Role to add/remove", only_with="Only members having this role (default: everyone)")
+@app_commands.choices(action=[app_commands.Choice(name="add", value="add_role"),
+                              app_commands.Choice(name="remove", value="remove_role")])
+@app_commands.check(lambda i: owner_only(i))
+async def bulk_role(interaction: discord.Interaction, action: app_commands.Choice[str], role: discord.Role,
+                    only_with: discord.Role | None = None):
+    members = only_with.members if only_with is not None else interaction.guild.members
+    job = plan(interaction.guild_id, action.value, role.id, members, interaction.user.id)
+    if not job.targets:
+        await interaction.response.send_message("Nothing to do: every member is already in that state.", ephemeral=True)
+        return
+    await interaction.response.send_message(f"Started bulk job `{job.id}` ({len(job.targets)} members).", ephemeral=True)
+    message = await interaction.channel.send(embed=job_embed(job))
+    job.channel_id, job.message_id = message.channel.id, message.id
+    executor.start(job, update_progress)
+
+@tree.command(name="bulk_jobs", description="List unfinished bulk jobs (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def bulk_jobs(interaction: discord.Interaction):
+    jobs = [j for j in executor.unfinished() if j.guild_id == interaction.guild_id]
+    lines = [f"`{j.id}` {j.op} <@&{j.role_id}> — {j.progress[0]}/{j.progress[1]} ({'running' if j.id in executor.running else j.status})"
+             for j in jobs]
+    embed = discord.Embed(title="🧰 Bulk jobs", description="\n".join(lines) or "No unfinished jobs.", color=config.settings().embed_color)
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+@tree.command(name="bulk_resume", description="Resume an interrupted bulk job (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def bulk_resume(interaction: discord.Interaction, job_id: str):
+    job = executor.store.load(job_id)
+    if job is None or job.guild_id != interaction.guild_id or job.status in ("finished", "cancelled"):
+        await interaction.response.send_message("No resumable job with that ID.", ephemeral=True)
+        return
+    if job_id in executor.running:
+        await interaction.response.send_message("That job is already running.", ephemeral=True)
+        return
+    executor.start(job, update_progress)
+    await interaction.response.send_message(f"Resumed `{job.id}`: {len(job.remaining)} members left.", ephemeral=True)
+
+@tree.command(name="bulk_cancel", description="Cancel a bulk job (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def bulk_cancel(interaction: discord.Interaction, job_id: str):
+    job = executor.store.load(job_id)
+    if job is None or job.guild_id != interaction.guild_id or not await executor.cancel(job_id):
+        await interaction.response.send_message("No cancellable job with that ID.", ephemeral=True)
+        return
+    await interaction.response.send_message(f"Cancelled `{job_id}`.", ephemeral=True)
+
+for _cmd in (bulk_role, bulk_jobs, bulk_resume, bulk_cancel):
+    _cmd.error(owner_check_error)
+
 @bot.event
 async def on_ready():
     try:
@@ -74,16 +185,26 @@ async def on_ready():
     except Exception:
         pass
     print(f"🌐 {BOT_NAME} connected as {bot.user}")
+    # pick up jobs interrupted by a restart (checkpointed as running/paused)
+    for job in executor.unfinished():
+        if job.id not in executor.running and job.status in ("running", "paused"):
+            executor.start(job, update_progress)
 
 async def main():
     if not TOKEN:
         raise RuntimeError(f"Missing token env: NUVIX_MANAGEMENT_TOKEN")
+    config_task = asyncio.create_task(config.watch())
+    await event_bus.bus().start("nuvix_management")
+    gateway_session.install(bot, "nuvix_management", on_shutdown=[executor.pause_all, event_bus.bus().stop])
     web_task = asyncio.create_task(run_web())
     bot_task = asyncio.create_task(bot.start(TOKEN))
-    await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    try:
+        await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        config_task.cancel()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        runtime.run(main())
     except KeyboardInterrupt:
         pass
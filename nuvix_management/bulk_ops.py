@@ -0,0 +1,272 @@
+# ==================================================
+# Nuvix Management — Bulk operations
+# Planned, checkpointed mass role changes with adaptive, rate-limit-aware concurrency
+# ==================================================
+
+import asyncio
+import os
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field
+
+import serialization
+
+OPS = ("add_role", "remove_role")
+
+
+class RateLimited(Exception):
+    """Raised by an action when Discord answered 429 (or the bucket is exhausted)."""
+
+    def __init__(self, retry_after: float = 1.0):
+        super().__init__(f"rate limited for {retry_after}s")
+        self.retry_after = retry_after
+
+
+@dataclass
+class BulkJob:
+    id: str
+    guild_id: int
+    op: str
+    role_id: int
+    targets: list
+    requested_by: int
+    created_at: float = field(default_factory=time.time)
+    done: list = field(default_factory=list)
+    failed: dict = field(default_factory=dict)
+    status: str = "pending"  # pending | running | paused | finished | cancelled
+    channel_id: int | None = None
+    message_id: int | None = None
+
+    @property
+    def remaining(self) -> list:
+        finished = set(self.done) | {int(k) for k in self.failed}
+        return [t for t in self.targets if t not in finished]
+
+    @property
+    def progress(self) -> tuple[int, int]:
+        return len(self.done) + len(self.failed), len(self.targets)
+
+
+def plan(guild_id: int, op: str, role_id: int, members, requested_by: int) -> BulkJob:
+    """Build a job, skipping members that are already in the desired state."""
+    if op not in OPS:
+        raise ValueError(f"Unknown bulk operation: {op}")
+    want = op == "add_role"
+    targets = [m.id for m in members if any(r.id == role_id for r in m.roles) != want]
+    return BulkJob(uuid.uuid4().hex[:8], guild_id, op, role_id, targets, requested_by)
+
+# ==============================
+# 💾 Checkpoints
+# ==============================
+class CheckpointStore:
+    """One JSON file per job, replaced atomically."""
+
+    def __init__(self, directory):
+        self.directory = str(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, job_id: str) -> str:
+        return os.path.join(self.directory, f"{job_id}.json")
+
+    def save(self, job: BulkJob):
+        path = self._path(job.id)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            serialization.dump(asdict(job), f)
+        os.replace(tmp, path)
+
+    def load(self, job_id: str) -> BulkJob | None:
+        try:
+            with open(self._path(job_id), "r", encoding="utf-8") as f:
+                return BulkJob(**serialization.load(f))
+        except FileNotFoundError:
+            return None
+
+    def all(self) -> list[BulkJob]:
+        jobs = []
+        for name in sorted(os.listdir(self.directory)):
+            if name.endswith(".json"):
+                job = self.load(name[:-5])
+                if job is not None:
+                    jobs.append(job)
+        return jobs
+
+# ==============================
+# 🚦 Adaptive concurrency
+# ==============================
+class AdaptiveLimiter:
+    """AIMD window: grow by one after ``grow_after`` clean calls, halve on a 429 or
+    when a call is slow enough that the HTTP client must have waited on a bucket."""
+
+    def __init__(self, initial: int = 2, minimum: int = 1, maximum: int = 8,
+                 grow_after: int = 10, slow_call: float = 2.0):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.grow_after = grow_after
+        self.slow_call = slow_call
+        self.in_flight = 0
+        self._streak = 0
+        self._paused_until = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._cond:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait > 0:
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                if self.in_flight < self.limit:
+                    self.in_flight += 1
+                    return
+                await self._cond.wait()
+
+    async def release(self, elapsed: float, retry_after: float | None = None):
+        async with self._cond:
+            self.in_flight -= 1
+            if retry_after is not None:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+                self._streak = 0
+            elif elapsed >= self.slow_call:
+                self.limit = max(self.minimum, self.limit - 1)
+                self._streak = 0
+            else:
+                self._streak += 1
+                if self._streak >= self.grow_after and self.limit < self.maximum:
+                    self.limit += 1
+                    self._streak = 0
+            self._cond.notify_all()
+
+# ==============================
+# ⚙️ Executor
+# ==============================
+class BulkExecutor:
+    """Runs jobs: ``action(job, member_id)`` performs one change. Progress is
+    checkpointed every ``checkpoint_every`` operations and reported through
+    ``on_progress(job, limiter)`` at most once per ``report_interval`` seconds."""
+
+    def __init__(self, store: CheckpointStore, action, limiter_factory=AdaptiveLimiter,
+                 checkpoint_every: int = 25, report_interval: float = 2.0, max_retries: int = 5):
+        self.store = store
+        self.action = action
+        self.limiter_factory = limiter_factory
+        self.checkpoint_every = checkpoint_every
+        self.report_interval = report_interval
+        self.max_retries = max_retries
+        self.running: dict[str, asyncio.Task] = {}
+
+    def unfinished(self) -> list[BulkJob]:
+        return [j for j in self.store.all() if j.status in ("pending", "running", "paused")]
+
+    def start(self, job: BulkJob, on_progress=None) -> asyncio.Task:
+        task = asyncio.create_task(self.run(job, on_progress))
+        self.running[job.id] = task
+        task.add_done_callback(lambda _: self.running.pop(job.id, None))
+        return task
+
+    async def cancel(self, job_id: str) -> bool:
+        task = self.running.get(job_id)
+        if task is None:
+            job = self.store.load(job_id)
+            if job is None or job.status in ("finished", "cancelled"):
+                return False
+            job.status = "cancelled"
+            self.store.save(job)
+            return True
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        job = self.store.load(job_id)
+        if job is not None:
+            job.status = "cancelled"
+            self.store.save(job)
+        return True
+
+    async def pause_all(self):
+        """Stop every running job where it is (status "paused", checkpoint saved) for a restart."""
+        tasks = list(self.running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, job: BulkJob, on_progress=None) -> BulkJob:
+        limiter = self.limiter_factory()
+        queue = deque(job.remaining)
+        attempts: dict[int, int] = {}
+        since_checkpoint = 0
+        last_report = 0.0
+        job.status = "running"
+        self.store.save(job)
+
+        async def report(force: bool = False):
+            nonlocal last_report
+            if on_progress is None:
+                return
+            now = time.monotonic()
+            if force or now - last_report >= self.report_interval:
+                last_report = now
+                try:
+                    await on_progress(job, limiter)
+                except Exception:
+                    pass  # progress messages are best effort
+
+        async def one(member_id: int):
+            nonlocal since_checkpoint
+            started = time.monotonic()
+            try:
+                await self.action(job, member_id)
+            except RateLimited as e:
+                await limiter.release(time.monotonic() - started, e.retry_after)
+                attempts[member_id] = attempts.get(member_id, 0) + 1
+                if attempts[member_id] > self.max_retries:
+                    job.failed[str(member_id)] = "rate limited"
+                else:
+                    queue.append(member_id)
+                return
+            except Exception as e:
+                await limiter.release(time.monotonic() - started)
+                job.failed[str(member_id)] = type(e).__name__
+            else:
+                await limiter.release(time.monotonic() - started)
+                job.done.append(member_id)
+            since_checkpoint += 1
+            if since_checkpoint >= self.checkpoint_every:
+                since_checkpoint = 0
+                self.store.save(job)
+
+        tasks = set()
+        try:
+            await report(force=True)
+            while queue or tasks:
+                while queue:
+                    await limiter.acquire()
+                    t = asyncio.create_task(one(queue.popleft()))
+                    tasks.add(t)
+                    t.add_done_callback(tasks.discard)
+                    await report()
+                if tasks:
+                    await asyncio.wait(set(tasks), return_when=asyncio.FIRST_COMPLETED)
+                    await report()
+            job.status = "finished"
+        except asyncio.CancelledError:
+            for t in tasks:
+                t.cancel()
+            job.status = "paused"
+            raise
+        finally:
+            self.store.save(job)
+            await report(force=True)
+        return job
+
+
+def progress_bar(done: int, total: int, width: int = 20) -> str:
+    filled = width if not total else int(width * done / total)
+    return "█" * filled + "░" * (width - filled)
@@ -1,13 +1,26 @@
-import os, time, asyncio
+import os, sys, time, asyncio
 from aiohttp import web
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+# Sibling modules live next to bot.py, shared ones (config, utils) in the repo root.
+# main.py exec()s this file from the repo root (no __file__).
+BOT_DIR = os.path.dirname(os.path.abspath(globals().get("__file__") or os.path.join("nuvix_sanctions", "bot.py")))
+ROOT_DIR = os.path.dirname(BOT_DIR)
+for _path in (ROOT_DIR, BOT_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import config
+import event_bus
+import gateway_session
+import runtime
+
+from sanctions_engine import RetryLater, SanctionActions, SanctionEngine, SanctionStore, parse_duration
+
 BOT_NAME = "Nuvix Sanctions"
-TOKEN = os.getenv("NUVIX_SANCTIONS_TOKEN")
-OWNER_ROLE_ID = int(os.getenv("OWNER_ROLE_ID", "0"))
-EMBED_COLOR = int(os.getenv("EMBED_COLOR_HEX", "0xE91E63"), 16)  # default Nuvix pink
+TOKEN = config.settings().token("nuvix_sanctions")
 
 UPTIME = time.time()
 
@@ -18,6 +31,46 @@ intents.members = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 tree = bot.tree
 
+def muted_role_id() -> int:
+    return config.settings().get_int("MUTED_ROLE_ID", 0)  # read per use so a reload applies
+
+class DiscordSanctionActions(SanctionActions):
+    async def lift(self, sanction):
+        guild = bot.get_guild(sanction.guild_id)
+        if guild is None:
+            raise RetryLater(30, rate_limited=False)  # not connected yet (or guild unavailable)
+        try:
+            if sanction.kind == "ban":
+                await guild.unban(discord.Object(id=sanction.user_id), reason="Sanction expired")
+            else:
+                member = guild.get_member(sanction.user_id)
+                role = guild.get_role(muted_role_id())
+                if member is not None and role is not None and role in member.roles:
+                    await member.remove_roles(role, reason="Sanction expired")
+        except discord.NotFound:
+            return  # already lifted by hand
+        except discord.Forbidden:
+            print(f"⚠️ Missing permissions to lift {sanction.kind} #{sanction.id} in {sanction.guild_id}")
+            return
+        except discord.HTTPException as e:
+            if e.status == 429 or e.status >= 500:
+                raise RetryLater(float(getattr(e, "retry_after", 0) or 5))
+            raise
+
+def publish_lift(sanction, by):
+    event_bus.bus().publish(event_bus.SANCTION_LIFTED, {
+        "guild_id": sanction.guild_id, "user_id": sanction.user_id, "kind": sanction.kind, "by": by,
+    })
+
+engine = SanctionEngine(
+    SanctionStore(config.settings().get("SANCTIONS_DB_PATH", os.path.join(ROOT_DIR, "data", "sanctions.sqlite3"))),
+    DiscordSanctionActions(),
+    batch_size=config.settings().get_int("SANCTIONS_BATCH_SIZE", 50),
+    concurrency=config.settings().get_int("SANCTIONS_CONCURRENCY", 4),
+    rate=config.settings().get_float("SANCTIONS_RATE", 5),
+    on_lift=publish_lift,
+)
+
 async def health_handler(request):
     alive = int(time.time() - UPTIME)
     return web.Response(text=f"Nuvix Sanctions connected | alive {alive}s")
@@ -26,7 +79,7 @@ async def run_web():
     app = web.Application()
     app.router.add_get("/", health_handler)
     app.router.add_get("/health", health_handler)
-    port = int(os.getenv("PORT", "10000"))
+    port = config.settings().port
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
@@ -37,7 +90,8 @@ async def run_web():
 def owner_only(interaction: discord.Interaction) -> bool:
     if interaction.user is None or not interaction.guild:
         return False
-    if OWNER_ROLE_ID and any(r.id == OWNER_ROLE_ID for r in interaction.user.roles):
+    owner_role_id = config.settings().owner_role_id
+    if owner_role_id and any(r.id == owner_role_id for r in interaction.user.roles):
         return True
     # also allow guild owner and admins
     if interaction.user.id == interaction.guild.owner_id:
@@ -53,7 +107,7 @@ async def status(interaction: discord.Interaction):
     hours, mins = divmod(mins, 60)
     days, hours = divmod(hours, 24)
     human = (f"{days}d " if days else "") + (f"{hours}h " if hours else "") + (f"{mins}m {secs}s")
-    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=EMBED_COLOR)
+    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=config.settings().embed_color)
     embed.set_footer(text="Nuvix System • Connected")
     try:
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -67,6 +121,109 @@ async def status_error(interaction: discord.Interaction, error):
     else:
         await interaction.response.send_message("Unexpected error.", ephemeral=True)
 
+async def owner_check_error(interaction: discord.Interaction, error):
+    if isinstance(error, app_commands.CheckFailure):
+        msg = "You don't have permission to use this command."
+    else:
+        msg = "Unexpected error."
+    if interaction.response.is_done():
+        await interaction.followup.send(msg, ephemeral=True)
+    else:
+        await interaction.response.send_message(msg, ephemeral=True)
+
+def sanction_embed(title: str, member, duration: int | None, reason: str) -> discord.Embed:
+    until = f"<t:{int(time.time() + duration)}:R>" if duration is not None else "permanent"
+    embed = discord.Embed(title=title, description=f"**User:** {member.mention}\n**Expires:** {until}\n**Reason:** {reason or '—'}",
+                          color=config.settings().embed_color)
+    embed.set_footer(text="Nuvix Sanctions")
+    return embed
+
+def read_duration(text: str | None) -> int | None:
+    return parse_duration(text) if text else None
+
+@tree.command(name="tempban", description="Ban a member, optionally for a limited time (owner only).")
+@app_commands.describe(duration="e.g. 30m, 12h, 7d (empty = permanent)")
+@app_commands.check(lambda i: owner_only(i))
+async def tempban(interaction: discord.Interaction, member: discord.Member, duration: str | None = None, reason: str = ""):
+    await interaction.response.defer(ephemeral=True)  # the ban + DB write can outlast the 3 s window
+    try:
+        seconds = read_duration(duration)
+    except ValueError as e:
+        await interaction.followup.send(str(e), ephemeral=True)
+        return
+    await interaction.guild.ban(member, reason=reason or None, delete_message_days=0)
+    s = await engine.apply(interaction.guild_id, member.id, "ban", seconds, reason, interaction.user.id)
+    event_bus.bus().publish(event_bus.SanctionApplied(s.guild_id, s.user_id, s.kind, s.expires_at, s.reason))
+    await interaction.followup.send(embed=sanction_embed("🔨 Banned", member, seconds, reason), ephemeral=True)
+
+@tree.command(name="tempmute", description="Mute a member, optionally for a limited time (owner only).")
+@app_commands.describe(duration="e.g. 30m, 12h, 7d (empty = permanent)")
+@app_commands.check(lambda i: owner_only(i))
+async def tempmute(interaction: discord.Interaction, member: discord.Member, duration: str | None = None, reason: str = ""):
+    await interaction.response.defer(ephemeral=True)
+    role = interaction.guild.get_role(muted_role_id())
+    if role is None:
+        await interaction.followup.send("MUTED_ROLE_ID is not configured.", ephemeral=True)
+        return
+    try:
+        seconds = read_duration(duration)
+    except ValueError as e:
+        await interaction.followup.send(str(e), ephemeral=True)
+        return
+    await member.add_roles(role, reason=reason or None)
+    s = await engine.apply(interaction.guild_id, member.id, "mute", seconds, reason, interaction.user.id)
+    event_bus.bus().publish(event_bus.SanctionApplied(s.guild_id, s.user_id, s.kind, s.expires_at, s.reason))
+    await interaction.followup.send(embed=sanction_embed("🔇 Muted", member, seconds, reason), ephemeral=True)
+
+@tree.command(name="unban", description="Lift a ban (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def unban(interaction: discord.Interaction, user_id: str):
+    if not user_id.isdigit():
+        await interaction.response.send_message("Invalid user ID.", ephemeral=True)
+        return
+    try:
+        await interaction.guild.unban(discord.Object(id=int(user_id)), reason=f"Unbanned by {interaction.user}")
+    except discord.NotFound:
+        pass
+    lifted = await engine.revoke(interaction.guild_id, int(user_id), "ban")
+    await interaction.response.send_message("✅ Unbanned." if lifted else "✅ Done (no tracked ban).", ephemeral=True)
+
+@tree.command(name="unmute", description="Lift a mute (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def unmute(interaction: discord.Interaction, member: discord.Member):
+    role = interaction.guild.get_role(muted_role_id())
+    if role is not None and role in member.roles:
+        await member.remove_roles(role, reason=f"Unmuted by {interaction.user}")
+    await engine.revoke(interaction.guild_id, member.id, "mute")
+    await interaction.response.send_message("✅ Unmuted.", ephemeral=True)
+
+@tree.command(name="sanctions", description="Show active sanctions of a member (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def sanctions(interaction: discord.Interaction, member: discord.Member):
+    active = engine.active_for(interaction.guild_id, member.id)
+    lines = [
+        f"**{s.kind}** — {'expires <t:%d:R>' % s.expires_at if s.expires_at else 'permanent'} — {s.reason or '—'}"
+        for s in active
+    ]
+    embed = discord.Embed(title=f"⚖️ Sanctions of {member.display_name}",
+                          description="\n".join(lines) or "No active sanctions.", color=config.settings().embed_color)
+    embed.set_footer(text=f"Nuvix Sanctions • {len(engine)} active • {len(engine.wheel)} timers")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+for _cmd in (tempban, tempmute, unban, unmute, sanctions):
+    _cmd.error(owner_check_error)
+
+@bot.event
+async def on_member_join(member: discord.Member):
+    # Leaving and rejoining must not shake off a mute.
+    if engine.active(member.guild.id, member.id, "mute") is not None:
+        role = member.guild.get_role(muted_role_id())
+        if role is not None:
+            try:
+                await member.add_roles(role, reason="Active mute")
+            except discord.HTTPException:
+                pass
+
 @bot.event
 async def on_ready():
     try:
@@ -78,12 +235,21 @@ async def on_ready():
 async def main():
     if not TOKEN:
         raise RuntimeError(f"Missing token env: NUVIX_SANCTIONS_TOKEN")
+    loaded = await engine.load()
+    print(f"⚖️ {BOT_NAME} loaded {loaded} active sanctions")
+    engine.start()
+    config_task = asyncio.create_task(config.watch())
+    await event_bus.bus().start("nuvix_sanctions")
+    gateway_session.install(bot, "nuvix_sanctions", on_shutdown=[engine.stop, event_bus.bus().stop])
     web_task = asyncio.create_task(run_web())
     bot_task = asyncio.create_task(bot.start(TOKEN))
-    await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    try:
+        await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        config_task.cancel()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        runtime.run(main())
     except KeyboardInterrupt:
         pass
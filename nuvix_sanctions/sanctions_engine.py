@@ -0,0 +1,428 @@
+# ==================================================
+# Nuvix Sanctions — Engine
+# Persisted sanctions + hierarchical timer wheel + batched, rate-limited expiry
+# ==================================================
+
+import abc
+import asyncio
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+KINDS = ("ban", "mute")
+
+# ==============================
+# ⏱ Durations
+# ==============================
+_DURATION = re.compile(r"(\d+)\s*([smhdw])", re.I)
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+def parse_duration(text: str) -> int:
+    """'90s', '10m', '1d12h', '2w' → seconds. Raises ValueError on garbage or a zero duration."""
+    text = text.strip().lower()
+    parts = _DURATION.findall(text)
+    if not parts or _DURATION.sub("", text).strip():
+        raise ValueError(f"Invalid duration: {text!r}")
+    seconds = sum(int(n) * _UNITS[u] for n, u in parts)
+    if seconds <= 0:
+        raise ValueError(f"Duration must be positive: {text!r}")
+    return seconds
+
+# ==============================
+# 🗂 Records + store
+# ==============================
+@dataclass
+class Sanction:
+    id: int
+    guild_id: int
+    user_id: int
+    kind: str
+    reason: str
+    moderator_id: int | None
+    created_at: float
+    expires_at: float | None
+
+    @property
+    def key(self) -> tuple[int, int, str]:
+        return (self.guild_id, self.user_id, self.kind)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sanctions (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id     INTEGER NOT NULL,
+    user_id      INTEGER NOT NULL,
+    kind         TEXT    NOT NULL,
+    reason       TEXT    NOT NULL DEFAULT '',
+    moderator_id INTEGER,
+    created_at   REAL    NOT NULL,
+    expires_at   REAL,
+    lifted_at    REAL,
+    lifted_by    TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sanctions_active ON sanctions(lifted_at, expires_at);
+CREATE INDEX IF NOT EXISTS idx_sanctions_member ON sanctions(guild_id, user_id);
+"""
+
+_COLUMNS = "id, guild_id, user_id, kind, reason, moderator_id, created_at, expires_at"
+
+
+class SanctionStore:
+    """SQLite persistence; everything the engine needs survives a restart."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def add(self, guild_id, user_id, kind, reason, moderator_id, created_at, expires_at) -> Sanction:
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO sanctions (guild_id, user_id, kind, reason, moderator_id, created_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (guild_id, user_id, kind, reason, moderator_id, created_at, expires_at),
+            )
+        return Sanction(cur.lastrowid, guild_id, user_id, kind, reason, moderator_id, created_at, expires_at)
+
+    def lift_many(self, ids, lifted_by: str, now: float):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE sanctions SET lifted_at = ?, lifted_by = ? WHERE id = ? AND lifted_at IS NULL",
+                [(now, lifted_by, i) for i in ids],
+            )
+
+    def load_active(self) -> list[Sanction]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {_COLUMNS} FROM sanctions WHERE lifted_at IS NULL").fetchall()
+        return [Sanction(*r) for r in rows]
+
+    def history(self, guild_id: int, user_id: int, limit: int = 10) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT kind, reason, created_at, expires_at, lifted_at, lifted_by FROM sanctions"
+                " WHERE guild_id = ? AND user_id = ? ORDER BY created_at DESC LIMIT ?",
+                (guild_id, user_id, limit),
+            ).fetchall()
+
+# ==============================
+# 🎡 Hierarchical timer wheel
+# ==============================
+class TimerWheel:
+    """Hierarchical timing wheel (Varghese & Lauck). O(1) schedule/cancel; each tick
+    touches one slot, and higher levels cascade down only when a lower level wraps.
+
+    With the defaults (1 s ticks, 4 levels × 64 slots) timers up to ~194 days sit in
+    the wheel; anything further out waits in an overflow list and is re-inserted
+    as it comes into range."""
+
+    def __init__(self, tick: float = 1.0, slots: int = 64, levels: int = 4, now: float | None = None):
+        self.tick = tick
+        self.bits = slots.bit_length() - 1
+        if 1 << self.bits != slots:
+            raise ValueError("slots must be a power of two")
+        self.slots = slots
+        self.levels = levels
+        self._wheels = [[set() for _ in range(slots)] for _ in range(levels)]
+        self._overflow = set()
+        self._deadline = {}  # key -> absolute tick
+        self._where = {}  # key -> (level, slot) or None for overflow
+        self.current = self._to_tick(time.time() if now is None else now)
+
+    def __len__(self):
+        return len(self._deadline)
+
+    def __contains__(self, key):
+        return key in self._deadline
+
+    def _to_tick(self, ts: float) -> int:
+        return int(ts // self.tick)
+
+    def _place(self, key, tick: int):
+        delta = tick - self.current
+        for level in range(self.levels):
+            if delta < 1 << (self.bits * (level + 1)):
+                slot = (tick >> (self.bits * level)) & (self.slots - 1)
+                self._wheels[level][slot].add(key)
+                self._where[key] = (level, slot)
+                return
+        self._overflow.add(key)
+        self._where[key] = None
+
+    def schedule(self, key, deadline: float):
+        """(Re)schedule ``key`` to fire at unix time ``deadline``."""
+        self.cancel(key)
+        tick = max(self._to_tick(deadline), self.current + 1)
+        self._deadline[key] = tick
+        self._place(key, tick)
+
+    def cancel(self, key) -> bool:
+        if key not in self._deadline:
+            return False
+        where = self._where.pop(key)
+        if where is None:
+            self._overflow.discard(key)
+        else:
+            self._wheels[where[0]][where[1]].discard(key)
+        del self._deadline[key]
+        return True
+
+    def _cascade(self, level: int):
+        slot = (self.current >> (self.bits * level)) & (self.slots - 1)
+        bucket, self._wheels[level][slot] = self._wheels[level][slot], set()
+        for key in bucket:
+            self._place(key, self._deadline[key])
+
+    def advance(self, now: float | None = None) -> list:
+        """Move the wheel up to ``now`` and return every key that expired."""
+        target = self._to_tick(time.time() if now is None else now)
+        expired = []
+        while self.current < target:
+            if not self._deadline:
+                self.current = target
+                break
+            self.current += 1
+            # cascade top-down so entries land in lower slots before those are drained
+            if self._overflow and not self.current & ((1 << (self.bits * self.levels)) - 1):
+                pending, self._overflow = self._overflow, set()
+                for key in pending:
+                    self._place(key, self._deadline[key])
+            wrapped = 1
+            while wrapped < self.levels and not self.current & ((1 << (self.bits * wrapped)) - 1):
+                wrapped += 1
+            for level in range(wrapped - 1, 0, -1):
+                self._cascade(level)
+            slot = self.current & (self.slots - 1)
+            bucket, self._wheels[0][slot] = self._wheels[0][slot], set()
+            for key in bucket:
+                del self._deadline[key], self._where[key]
+                expired.append(key)
+        return expired
+
+# ==============================
+# 🚦 Rate limiting
+# ==============================
+class RetryLater(Exception):
+    """Raised by an action to try again later. ``rate_limited`` means Discord asked us to
+    slow down (a 429/5xx): only then is the shared bucket drained; otherwise (e.g. the
+    guild isn't cached yet) the token taken for the call is given back."""
+
+    def __init__(self, retry_after: float = 5.0, rate_limited: bool = True):
+        super().__init__(f"retry after {retry_after}s")
+        self.retry_after = retry_after
+        self.rate_limited = rate_limited
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def penalize(self, seconds: float):
+        """Drain the bucket so nothing else fires for ``seconds`` (after a 429)."""
+        self.tokens = -seconds * self.rate
+
+    def refund(self):
+        """Give back a token that was taken but not spent on a request."""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class SanctionActions(abc.ABC):
+    """Discord side of an expiry. Return normally when the sanction is gone (or
+    was already gone); raise :class:`RetryLater` to try again later."""
+
+    @abc.abstractmethod
+    async def lift(self, sanction: Sanction):
+        ...
+
+# ==============================
+# ⚙️ Engine
+# ==============================
+class SanctionEngine:
+    """``on_lift(sanction, by)`` is called for every sanction that stops being active
+    (``by`` is "expired", "manual", ...)."""
+
+    def __init__(self, store: SanctionStore, actions: SanctionActions, tick: float = 1.0,
+                 batch_size: int = 50, concurrency: int = 4, rate: float = 5.0, burst: int = 5,
+                 on_lift=None):
+        self.store = store
+        self.actions = actions
+        self.on_lift = on_lift
+        self.tick = tick
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.limiter = TokenBucket(rate, burst)
+        self.wheel = TimerWheel(tick)
+        self._active: dict[tuple[int, int, str], Sanction] = {}
+        self._by_id: dict[int, Sanction] = {}
+        self._due: list[int] = []
+        self._task = None
+        self.stats = {"expired": 0, "retried": 0, "failed": 0, "batches": 0}
+
+    # ---- index ----
+    def active(self, guild_id: int, user_id: int, kind: str) -> Sanction | None:
+        """O(1) active-sanction lookup."""
+        return self._active.get((guild_id, user_id, kind))
+
+    def active_for(self, guild_id: int, user_id: int) -> list[Sanction]:
+        return [s for s in (self._active.get((guild_id, user_id, k)) for k in KINDS) if s]
+
+    def __len__(self):
+        return len(self._active)
+
+    def _index(self, s: Sanction):
+        previous = self._active.get(s.key)
+        if previous is not None:
+            self._unindex(previous)
+        self._active[s.key] = s
+        self._by_id[s.id] = s
+        if s.expires_at is not None:
+            self.wheel.schedule(s.id, s.expires_at)
+
+    def _is_due(self, s: Sanction) -> bool:
+        """Still the active sanction for its key and past its expiry: not revoked,
+        superseded or re-applied since its timer fired."""
+        return self._active.get(s.key) is s and s.expires_at is not None and s.expires_at <= time.time() + self.tick
+
+    def _unindex(self, s: Sanction):
+        self.wheel.cancel(s.id)
+        self._by_id.pop(s.id, None)
+        if self._active.get(s.key) is s:
+            del self._active[s.key]
+
+    # ---- lifecycle ----
+    async def load(self) -> int:
+        """Rebuild the in-memory index and wheel from the store (one indexed scan)."""
+        rows = await asyncio.to_thread(self.store.load_active)
+        now = time.time()
+        self.wheel = TimerWheel(self.tick, now=now)
+        self._active.clear()
+        self._by_id.clear()
+        for s in rows:
+            self._index(s)
+            if s.expires_at is not None and s.expires_at <= now:
+                self.wheel.cancel(s.id)
+                self._due.append(s.id)  # expired while we were offline
+        return len(rows)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            self._due.extend(self.wheel.advance())
+            while self._due:
+                batch, self._due = self._due[:self.batch_size], self._due[self.batch_size:]
+                await self._process(batch)
+            await asyncio.sleep(self.tick)
+
+    # ---- commands ----
+    async def apply(self, guild_id: int, user_id: int, kind: str, duration: int | None,
+                    reason: str = "", moderator_id: int | None = None) -> Sanction:
+        if kind not in KINDS:
+            raise ValueError(f"Unknown sanction kind: {kind}")
+        now = time.time()
+        expires = now + duration if duration is not None else None
+        s = await asyncio.to_thread(self.store.add, guild_id, user_id, kind, reason, moderator_id, now, expires)
+        previous = self._active.get(s.key)
+        if previous is not None:
+            await asyncio.to_thread(self.store.lift_many, [previous.id], "superseded", now)
+        self._index(s)
+        return s
+
+    async def revoke(self, guild_id: int, user_id: int, kind: str, by: str = "manual") -> Sanction | None:
+        """Forget an active sanction (the caller already undid it on Discord)."""
+        s = self._active.get((guild_id, user_id, kind))
+        if s is None:
+            return None
+        self._unindex(s)
+        await asyncio.to_thread(self.store.lift_many, [s.id], by, time.time())
+        self._notify([s], by)
+        return s
+
+    def _notify(self, sanctions: list[Sanction], by: str):
+        if self.on_lift is None:
+            return
+        for s in sanctions:
+            try:
+                self.on_lift(s, by)
+            except Exception as e:
+                print(f"⚠️ on_lift failed for sanction #{s.id}: {e}")
+
+    # ---- expiry ----
+    async def _process(self, ids: list[int]):
+        self.stats["batches"] += 1
+        sanctions = [self._by_id[i] for i in ids if i in self._by_id]
+        sem = asyncio.Semaphore(self.concurrency)
+        lifted = []
+
+        async def one(s: Sanction):
+            async with sem:
+                await self.limiter.acquire()
+                if not self._is_due(s):  # changed while we waited for a slot or a token
+                    self.limiter.refund()
+                    return
+                try:
+                    await self.actions.lift(s)
+                except RetryLater as e:
+                    if e.rate_limited:
+                        self.limiter.penalize(e.retry_after)
+                    else:
+                        self.limiter.refund()
+                    self.stats["retried"] += 1
+                    self.wheel.schedule(s.id, time.time() + e.retry_after)
+                    return
+                except Exception:
+                    # unknown failure: try again in a minute instead of dropping it
+                    self.stats["failed"] += 1
+                    self.wheel.schedule(s.id, time.time() + 60)
+                    return
+                lifted.append(s)
+
+        await asyncio.gather(*(one(s) for s in sanctions))
+        # Revoked by hand or re-applied while the lift was in flight: that sanction is no
+        # longer ours to record. A re-apply may have been undone on Discord, so say so.
+        for s in lifted:
+            if self._active.get(s.key) not in (None, s):
+                print(f"⚠️ {s.kind} of {s.user_id} in {s.guild_id} was re-applied while the old one was lifted; check it")
+        lifted = [s for s in lifted if self._active.get(s.key) is s]
+        for s in lifted:
+            self._unindex(s)
+        if lifted:
+            self.stats["expired"] += len(lifted)
+            await asyncio.to_thread(self.store.lift_many, [s.id for s in lifted], "expired", time.time())
+            self._notify(lifted, "expired")
@@ -1,23 +1,60 @@
-import os, time, asyncio
+import io, os, re, sys, time, asyncio
 from aiohttp import web
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+# Sibling modules live next to bot.py, shared ones (config, utils) in the repo root.
+# main.py exec()s this file from the repo root (no __file__).
+BOT_DIR = os.path.dirname(os.path.abspath(globals().get("__file__") or os.path.join("nuvix_tickets", "bot.py")))
+ROOT_DIR = os.path.dirname(BOT_DIR)
+for _path in (ROOT_DIR, BOT_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import config
+import event_bus
+import gateway_session
+import runtime
+import transcript_archive
+import utils
+
+from rollups import Rollup, TicketRollups
+from transcripts import TranscriptNames, TranscriptRenderer
+
 BOT_NAME = "Nuvix Tickets"
-TOKEN = os.getenv("NUVIX_TICKETS_TOKEN")
-OWNER_ROLE_ID = int(os.getenv("OWNER_ROLE_ID", "0"))
-EMBED_COLOR = int(os.getenv("EMBED_COLOR_HEX", "0xE91E63"), 16)  # default Nuvix pink
+TOKEN = config.settings().token("nuvix_tickets")
 
 UPTIME = time.time()
 
 intents = discord.Intents.none()
 intents.guilds = True
 intents.members = True
+intents.guild_messages = True  # first staff reply / assignment timing (no message content needed)
 
 bot = commands.Bot(command_prefix="!", intents=intents)
 tree = bot.tree
 
+TRANSCRIPTS_DIR = config.settings().get("TICKETS_LOG_DIR", os.path.join(ROOT_DIR, "data", "tickets_logs"))
+renderer = TranscriptRenderer(
+    config.settings().get("TICKETS_HTML_CACHE_DIR", os.path.join(ROOT_DIR, "data", "tickets_html")),
+    config.settings().get_int("TICKETS_RENDER_WORKERS", 2),
+    footer=config.settings().footer_text,
+)
+
+archive = transcript_archive.TranscriptArchive(
+    config.settings().get("TICKETS_ARCHIVE_DIR", os.path.join(ROOT_DIR, "data", "tickets_archive")),
+    config.settings().get_int("TICKETS_SEGMENT_MB", 64) * 1024 * 1024,
+)
+
+transcript_names = TranscriptNames()
+
+rollups = TicketRollups(config.settings().get("TICKETS_ROLLUP_PATH", os.path.join(ROOT_DIR, "data", "ticket_rollups.bin")))
+
+@config.on_reload
+def _reload_footer(old, new):
+    renderer.footer = new.footer_text
+
 async def health_handler(request):
     alive = int(time.time() - UPTIME)
     return web.Response(text=f"Nuvix Tickets connected | alive {alive}s")
@@ -26,7 +63,7 @@ async def run_web():
     app = web.Application()
     app.router.add_get("/", health_handler)
     app.router.add_get("/health", health_handler)
-    port = int(os.getenv("PORT", "10000"))
+    port = config.settings().port
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
@@ -37,7 +74,8 @@ async def run_web():
 def owner_only(interaction: discord.Interaction) -> bool:
     if interaction.user is None or not interaction.guild:
         return False
-    if OWNER_ROLE_ID and any(r.id == OWNER_ROLE_ID for r in interaction.user.roles):
+    owner_role_id = config.settings().owner_role_id
+    if owner_role_id and any(r.id == owner_role_id for r in interaction.user.roles):
         return True
     # also allow guild owner and admins
     if interaction.user.id == interaction.guild.owner_id:
@@ -53,7 +91,7 @@ async def status(interaction: discord.Interaction):
     hours, mins = divmod(mins, 60)
     days, hours = divmod(hours, 24)
     human = (f"{days}d " if days else "") + (f"{hours}h " if hours else "") + (f"{mins}m {secs}s")
-    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=EMBED_COLOR)
+    embed = discord.Embed(title="✅ Connected", description=f"🟢 **Alive since:** {human}", color=config.settings().embed_color)
     embed.set_footer(text="Nuvix System • Connected")
     try:
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -67,6 +105,248 @@ async def status_error(interaction: discord.Interaction, error):
     else:
         await interaction.response.send_message("Unexpected error.", ephemeral=True)
 
+async def owner_check_error(interaction: discord.Interaction, error):
+    if isinstance(error, app_commands.CheckFailure):
+        msg = "You don't have permission to use this command."
+    else:
+        msg = "Unexpected error."
+    if interaction.response.is_done():
+        await interaction.followup.send(msg, ephemeral=True)
+    else:
+        await interaction.response.send_message(msg, ephemeral=True)
+
+# ==============================
+# 📄 Transcripts (HTML export)
+# ==============================
+def transcript_source(name: str):
+    """Path of a live transcript, or a zero-copy view of an archived one; None if unknown.
+    Blocking (stat + archive index): call it in a thread."""
+    if os.path.basename(name) != name or not name.endswith(".txt"):
+        return None
+    path = os.path.join(TRANSCRIPTS_DIR, name)
+    if os.path.isfile(path):
+        return path
+    m = transcript_archive.TRANSCRIPT_FILE.match(name)
+    return archive.get(m.group(1), int(m.group(2))) if m else None
+
+async def resolve_mentions(guild: discord.Guild, ids: set[int], max_fetches: int = 10) -> dict[int, str]:
+    """Display names for mentioned members, roles and channels; users who left are fetched (a few at most)."""
+    names = {}
+    for target in ids:
+        obj = guild.get_member(target) or guild.get_role(target) or guild.get_channel(target) or bot.get_user(target)
+        if obj is None and max_fetches > 0:
+            max_fetches -= 1
+            try:
+                obj = await bot.fetch_user(target)
+            except discord.HTTPException:
+                obj = None
+        if obj is not None:
+            names[target] = getattr(obj, "display_name", None) or obj.name
+    return names
+
+async def refresh_transcript_names():
+    await asyncio.to_thread(transcript_names.load, TRANSCRIPTS_DIR, archive)
+
+# discord.py ignores the command's checks for autocomplete: the callback needs its own.
+@app_commands.check(lambda i: owner_only(i))
+async def transcript_autocomplete(interaction: discord.Interaction, current: str):
+    return [app_commands.Choice(name=n[:100], value=n) for n in transcript_names.search(current)]
+
+@tree.command(name="transcript", description="Export a ticket transcript as an HTML page (owner only).")
+@app_commands.describe(ticket="Transcript file", send_to="Also DM the page to this member (e.g. the customer)")
+@app_commands.autocomplete(ticket=transcript_autocomplete)
+@app_commands.check(lambda i: owner_only(i))
+async def transcript(interaction: discord.Interaction, ticket: str, send_to: discord.Member | None = None):
+    await interaction.response.defer(ephemeral=True)
+    source = await asyncio.to_thread(transcript_source, ticket)
+    if source is None:
+        await interaction.followup.send(f"Transcript `{ticket}` not found.", ephemeral=True)
+        return
+    page, cached = await renderer.render(source, lambda ids: resolve_mentions(interaction.guild, ids),
+                                         title=os.path.splitext(ticket)[0])
+    filename = os.path.splitext(ticket)[0] + ".html"
+    note = ""
+    if send_to is not None:
+        try:
+            await send_to.send(f"📄 Your ticket transcript from **{interaction.guild.name}**",
+                               file=discord.File(io.BytesIO(page), filename=filename))
+            note = f" Sent to {send_to.mention}."
+        except discord.HTTPException:
+            note = f" ⚠️ Could not DM {send_to.mention} (DMs closed?)."
+    await interaction.followup.send(f"📄 `{ticket}`{' (cached)' if cached else ''}.{note}",
+                                    file=discord.File(io.BytesIO(page), filename=filename), ephemeral=True)
+
+# ==============================
+# 🗜 Archive compaction
+# ==============================
+# Transcripts older than TICKETS_ARCHIVE_AFTER_DAYS move from one file per ticket into
+# append-only segments (see transcript_archive.py); /transcript reads both.
+async def compact_transcripts() -> dict:
+    older_than = config.settings().get_float("TICKETS_ARCHIVE_AFTER_DAYS", 30.0) * 86400
+    summary = await asyncio.to_thread(archive.compact, TRANSCRIPTS_DIR, older_than)
+    await refresh_transcript_names()
+    if summary["archived"]:
+        event_bus.bus().publish(event_bus.ARCHIVE_COMPACTED, {k: summary[k] for k in ("archived", "bytes", "sealed")})
+        print(f"🗜 Archived {summary['archived']} transcripts ({summary['bytes'] / 1024:.0f} KiB)")
+    return summary
+
+async def compaction_loop():
+    while True:
+        try:
+            await compact_transcripts()
+        except Exception as e:
+            print(f"⚠️ Transcript compaction failed: {e}")
+        await asyncio.sleep(config.settings().get_float("TICKETS_COMPACT_EVERY_HOURS", 6.0) * 3600)
+
+@tree.command(name="transcripts_compact", description="Pack old transcripts into the archive now (owner only).")
+@app_commands.check(lambda i: owner_only(i))
+async def transcripts_compact(interaction: discord.Interaction):
+    await interaction.response.defer(ephemeral=True)
+    summary = await compact_transcripts()
+    segments, size = await asyncio.to_thread(archive.disk_usage)
+    embed = discord.Embed(
+        title="🗜 Transcript archive",
+        description=(f"**Archived now:** {summary['archived']} ({summary['bytes'] / 1024:.0f} KiB)\n"
+                     f"**In archive:** {len(transcript_names.archived)} transcripts in {segments} segments ({size / 1048576:.1f} MiB)"),
+        color=config.settings().embed_color,
+    )
+    embed.set_footer(text=config.settings().footer_text)
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
+for _cmd in (transcript, transcripts_compact):
+    _cmd.error(owner_check_error)
+
+# ==============================
+# 📈 Support rollups
+# ==============================
+# Ticket channels are created and deleted by the ticket panel, so their gateway events
+# are the source of ticket.opened / ticket.closed for the whole suite (rollups here,
+# guild stats in nuvix_information, transcript mirroring in nuvix_backup).
+TICKET_NAME = re.compile(r"^[\w.]+-\d{6}$")
+ticket_category_ids = set(config.settings().get_ids("TICKET_CATEGORY_IDS"))
+
+@config.on_reload
+def _reload_ticket_categories(old, new):
+    global ticket_category_ids
+    ticket_category_ids = set(new.get_ids("TICKET_CATEGORY_IDS"))
+
+def is_ticket_channel(channel) -> bool:
+    """Inside one of TICKET_CATEGORY_IDS when set, otherwise named ``<user>-<HHMMSS>``."""
+    if not isinstance(channel, discord.TextChannel):
+        return False
+    if ticket_category_ids:
+        return channel.category_id in ticket_category_ids
+    return bool(TICKET_NAME.match(channel.name))
+
+def ticket_opener(channel: discord.TextChannel) -> int:
+    """The member the ticket was opened for: the one non-bot member given access to the channel."""
+    for target in channel.overwrites:
+        if isinstance(target, discord.Member) and not target.bot:
+            return target.id
+    return 0
+
+def latest_transcript(channel_name: str) -> str | None:
+    try:
+        entries = [e for e in os.scandir(TRANSCRIPTS_DIR)
+                   if e.name.startswith(f"transcript_{channel_name}_") and e.name.endswith(".txt")]
+    except FileNotFoundError:
+        return None
+    return max(entries, key=lambda e: e.stat().st_mtime).path if entries else None
+
+@bot.listen("on_guild_channel_create")
+async def publish_ticket_opened(channel):
+    if not is_ticket_channel(channel):
+        return
+    event_bus.bus().publish(event_bus.TicketOpened(
+        guild_id=channel.guild.id, channel_id=channel.id, user_id=ticket_opener(channel),
+        category=channel.category.name if channel.category else "",
+    ))
+
+@bot.listen("on_guild_channel_delete")
+async def publish_ticket_closed(channel):
+    if not (rollups.is_open(channel.id) or is_ticket_channel(channel)):
+        return
+    path = await asyncio.to_thread(latest_transcript, channel.name)
+    if path is not None:
+        transcript_names.add_live(os.path.basename(path))
+    event_bus.bus().publish(event_bus.TicketClosed(
+        guild_id=channel.guild.id, channel_id=channel.id, transcript_path=path,
+    ))
+
+@event_bus.bus().subscribe("ticket.*")
+def on_ticket_event(event):
+    p = event.payload
+    if event.type == event_bus.TICKET_OPENED:
+        rollups.ticket_opened(p["channel_id"], p.get("category", ""), event.ts)
+    elif event.type == event_bus.TICKET_CLOSED:
+        rollups.ticket_closed(p["channel_id"], event.ts)
+
+def is_support_staff(member) -> bool:
+    return isinstance(member, discord.Member) and (
+        utils.can_staff(member) or utils.can_highstaff_or_above(member) or utils.can_owner_or_coowner(member))
+
+@bot.listen("on_message")
+async def track_ticket_activity(message: discord.Message):
+    if message.guild is None or not rollups.is_open(message.channel.id):
+        return
+    ts = message.created_at.timestamp()
+    if bot.user is not None and message.author.id == bot.user.id:
+        if "assigned themself" in message.content:
+            rollups.ticket_assigned(message.channel.id, ts)
+    elif not message.author.bot and is_support_staff(message.author):
+        rollups.staff_replied(message.channel.id, ts)
+
+rollup_lock = asyncio.Lock()
+
+async def save_rollups():
+    """Snapshot on the loop, write in a thread; one save at a time."""
+    async with rollup_lock:
+        await asyncio.to_thread(rollups.write, rollups.snapshot())
+
+async def rollup_flush_loop():
+    while True:
+        await asyncio.sleep(config.settings().get_float("TICKETS_ROLLUP_FLUSH_SECONDS", 60.0))
+        try:
+            await save_rollups()
+        except Exception as e:
+            print(f"⚠️ Could not save ticket rollups: {e}")
+
+def fmt_duration(seconds: float | None) -> str:
+    if seconds is None:
+        return "—"
+    seconds = int(seconds)
+    hours, rem = divmod(seconds, 3600)
+    mins, secs = divmod(rem, 60)
+    return f"{hours}h {mins}m" if hours else f"{mins}m {secs}s"
+
+def rollup_line(r) -> str:
+    return (f"📥 {r.opens} opened • 📤 {r.closed} closed\n"
+            f"💬 first reply {fmt_duration(r.avg_reply)} • 🙋 assigned {fmt_duration(r.avg_assign)} "
+            f"• ✅ resolved {fmt_duration(r.avg_resolve)}")
+
+@tree.command(name="ticket_stats", description="Support dashboard: volume and response times (owner only).")
+@app_commands.choices(period=[app_commands.Choice(name="Last 24 hours", value=24),
+                              app_commands.Choice(name="Last 7 days", value=168),
+                              app_commands.Choice(name="All time", value=0)])
+@app_commands.check(lambda i: owner_only(i))
+async def ticket_stats(interaction: discord.Interaction, period: app_commands.Choice[int] | None = None):
+    hours = period.value if period else 24
+    per_category = rollups.window(hours) if hours else rollups.totals
+    overall = Rollup()
+    for r in per_category.values():
+        overall.add(r)
+    embed = discord.Embed(
+        title=f"📈 Tickets — {period.name if period else 'Last 24 hours'}",
+        description=f"{rollup_line(overall)}\n🟢 **Open now:** {len(rollups.open)}",
+        color=config.settings().embed_color,
+    )
+    for name, r in sorted(per_category.items(), key=lambda kv: -kv[1].opens)[:24]:
+        embed.add_field(name=name, value=rollup_line(r), inline=False)
+    embed.set_footer(text=config.settings().footer_text)
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+ticket_stats.error(owner_check_error)
+
 @bot.event
 async def on_ready():
     try:
@@ -78,12 +358,26 @@ async def on_ready():
 async def main():
     if not TOKEN:
         raise RuntimeError(f"Missing token env: NUVIX_TICKETS_TOKEN")
+    config_task = asyncio.create_task(config.watch())
+    await event_bus.bus().start("nuvix_tickets")
+    await refresh_transcript_names()
+    gateway_session.install(bot, "nuvix_tickets", on_shutdown=[event_bus.bus().stop, save_rollups])
     web_task = asyncio.create_task(run_web())
+    compaction_task = asyncio.create_task(compaction_loop())
+    flush_task = asyncio.create_task(rollup_flush_loop())
     bot_task = asyncio.create_task(bot.start(TOKEN))
-    await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    try:
+        await asyncio.wait([web_task, bot_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        config_task.cancel()
+        compaction_task.cancel()
+        flush_task.cancel()
+        rollups.flush()
+        renderer.shutdown()
+        archive.close()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        runtime.run(main())
     except KeyboardInterrupt:
         pass
@@ -0,0 +1,267 @@
+# ==================================================
+# Nuvix Tickets — Support rollups
+# Per-hour, per-category counters kept up to date as tickets open, get their
+# first staff reply, get assigned and close. Reads never rescan history.
+#
+#   ticket_rollups.bin    fixed 50-byte slots, one per (hour, category):
+#                         [hour u32][category u16][opens u32][closed u32]
+#                         [replied u32][reply_s u64][assigned u32][assign_s u64]
+#                         [resolved u32][resolve_s u64]
+#   ticket_rollups.json   category names + tickets still open
+# Dirty slots are rewritten in place on flush; a new slot is appended per new
+# (hour, category), so the file grows by at most hours × categories.
+# ==================================================
+
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass, fields
+
+import serialization
+
+_SLOT = struct.Struct("<IHIIIQIQIQ")
+UNCATEGORIZED = "uncategorized"
+
+
+@dataclass
+class Rollup:
+    opens: int = 0
+    closed: int = 0
+    replied: int = 0      # tickets that got a first staff reply
+    reply_s: int = 0      # sum of open → first staff reply, seconds
+    assigned: int = 0
+    assign_s: int = 0     # sum of open → "assigned themself"
+    resolved: int = 0     # closes whose open time is known
+    resolve_s: int = 0    # sum of open → close
+
+    def add(self, other: "Rollup"):
+        for name in _FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    @staticmethod
+    def _avg(total: int, n: int) -> float | None:
+        return total / n if n else None
+
+    @property
+    def avg_reply(self):
+        return self._avg(self.reply_s, self.replied)
+
+    @property
+    def avg_assign(self):
+        return self._avg(self.assign_s, self.assigned)
+
+    @property
+    def avg_resolve(self):
+        return self._avg(self.resolve_s, self.resolved)
+
+
+_FIELDS = tuple(f.name for f in fields(Rollup))
+
+
+class TicketRollups:
+    """Incremental support KPIs. Reads cost the same however long the history is:
+    all-time totals are kept per category, and windowed reads sum at most
+    ``window_hours`` in-memory buckets."""
+
+    def __init__(self, path: str, window_hours: int = 168):
+        self.path = path
+        self.state_path = os.path.splitext(path)[0] + ".json"
+        self.window_hours = window_hours
+        self.categories: list[str] = []
+        self.open: dict[int, dict] = {}            # channel id -> {"opened", "category", "replied", "assigned"}
+        self.totals: dict[str, Rollup] = {}
+        self._recent: dict[tuple[int, int], Rollup] = {}  # (hour, category id) inside the window
+        self._slots: dict[tuple[int, int], int] = {}      # (hour, category id) -> slot number
+        self._dirty: dict[tuple[int, int], Rollup] = {}   # buckets outside the window still to flush
+        self._dirty_keys: set[tuple[int, int]] = set()
+        self._state_dirty = False
+        # write() may run in a thread: snapshots are numbered so an older one finishing
+        # late never overwrites what a newer one already put on disk.
+        self._io_lock = threading.Lock()
+        self._seq = 0
+        self._written_seq = 0
+        self._state_seq = 0
+        self._slot_seq: dict[int, int] = {}
+        self._dirty_seq: dict[tuple[int, int], int] = {}
+        self.load()
+
+    # ---- storage ----
+    def load(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = serialization.load(f)
+            self.categories = list(state.get("categories", []))
+            self.open = {int(k): v for k, v in state.get("open", {}).items()}
+        except FileNotFoundError:
+            pass
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return
+        oldest = self._hour(time.time()) - self.window_hours
+        for slot, (hour, cat, *counters) in enumerate(_SLOT.iter_unpack(raw[:len(raw) - len(raw) % _SLOT.size])):
+            rollup = Rollup(*counters)
+            self._slots[(hour, cat)] = slot
+            self.totals.setdefault(self._category(cat), Rollup()).add(rollup)
+            if hour >= oldest:
+                self._recent[(hour, cat)] = rollup
+
+    def snapshot(self) -> tuple[int, bytes | None, list[tuple[int, bytes]]]:
+        """Copy what needs saving and mark it clean. Call on the event loop; hand the
+        result to :meth:`write`, which may run in a thread."""
+        self._seq += 1
+        # Out-of-window buckets stay readable here until a write covering them is on disk,
+        # so a late event never re-reads a slot that's still being written.
+        for key in [k for k, seq in self._dirty_seq.items() if seq <= self._written_seq and k not in self._dirty_keys]:
+            self._dirty.pop(key, None)
+            del self._dirty_seq[key]
+        state = None
+        if self._state_dirty:
+            state = serialization.dumpb({"categories": self.categories, "open": self.open})
+            self._state_dirty = False
+        records = []
+        for key in sorted(self._dirty_keys):
+            rollup = self._recent.get(key)
+            if rollup is None:
+                rollup = self._dirty[key]
+                self._dirty_seq[key] = self._seq
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = len(self._slots)
+            records.append((slot, _SLOT.pack(*key, *(getattr(rollup, name) for name in _FIELDS))))
+        self._dirty_keys.clear()
+        return self._seq, state, records
+
+    def write(self, snapshot: tuple[int, bytes | None, list[tuple[int, bytes]]]):
+        """Write a :meth:`snapshot`: changed buckets in place (new ones appended) and the
+        open-ticket state. Skips anything a newer snapshot already wrote."""
+        seq, state, records = snapshot
+        with self._io_lock:
+            if state is not None and seq > self._state_seq:
+                tmp = self.state_path + ".tmp"
+                with open(tmp, "wb") as f:
+                    f.write(state)
+                os.replace(tmp, self.state_path)
+                self._state_seq = seq
+            records = [(slot, packed) for slot, packed in records if self._slot_seq.get(slot, 0) < seq]
+            if records:
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    for slot, packed in records:
+                        os.pwrite(fd, packed, slot * _SLOT.size)
+                        self._slot_seq[slot] = seq
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            self._written_seq = max(self._written_seq, seq)
+
+    def flush(self):
+        """Snapshot and write in one go (on the loop, e.g. at shutdown)."""
+        self.write(self.snapshot())
+
+    # ---- buckets ----
+    @staticmethod
+    def _hour(ts: float) -> int:
+        return int(ts // 3600)
+
+    def _category(self, cat: int) -> str:
+        return self.categories[cat] if cat < len(self.categories) else f"#{cat}"
+
+    def _category_id(self, name: str) -> int:
+        try:
+            return self.categories.index(name)
+        except ValueError:
+            self.categories.append(name)
+            self._state_dirty = True
+            return len(self.categories) - 1
+
+    def _bucket(self, ts: float, category: str) -> Rollup:
+        key = (self._hour(ts), self._category_id(category))
+        self._dirty_keys.add(key)
+        rollup = self._recent.get(key)
+        if rollup is None:
+            if key[0] >= self._hour(time.time()) - self.window_hours:
+                rollup = self._recent[key] = Rollup()
+                self._evict()
+            else:  # late event for an hour outside the window: only flushed, not kept
+                rollup = self._dirty.get(key)
+                if rollup is None:
+                    rollup = self._dirty[key] = self._stored(key)
+        return rollup
+
+    def _stored(self, key) -> Rollup:
+        slot = self._slots.get(key)
+        if slot is None:
+            return Rollup()
+        with open(self.path, "rb") as f:
+            f.seek(slot * _SLOT.size)
+            return Rollup(*_SLOT.unpack(f.read(_SLOT.size))[2:])
+
+    def _evict(self):
+        oldest = self._hour(time.time()) - self.window_hours
+        for key in [k for k in self._recent if k[0] < oldest]:
+            rollup = self._recent.pop(key)
+            if key in self._dirty_keys:
+                self._dirty[key] = rollup
+
+    def _record(self, ts: float, category: str, **deltas):
+        bucket = self._bucket(ts, category)
+        total = self.totals.setdefault(category, Rollup())
+        for name, value in deltas.items():
+            setattr(bucket, name, getattr(bucket, name) + value)
+            setattr(total, name, getattr(total, name) + value)
+
+    # ---- events ----
+    def is_open(self, channel_id: int) -> bool:
+        return channel_id in self.open
+
+    def ticket_opened(self, channel_id: int, category: str = "", ts: float | None = None):
+        ts = ts or time.time()
+        if channel_id in self.open:
+            return
+        category = category or UNCATEGORIZED
+        self.open[channel_id] = {"opened": ts, "category": category, "replied": False, "assigned": False}
+        self._state_dirty = True
+        self._record(ts, category, opens=1)
+
+    def staff_replied(self, channel_id: int, ts: float | None = None):
+        ticket = self.open.get(channel_id)
+        if ticket is None or ticket["replied"]:
+            return
+        ts = ts or time.time()
+        ticket["replied"] = True
+        self._state_dirty = True
+        self._record(ts, ticket["category"], replied=1, reply_s=max(0, round(ts - ticket["opened"])))
+
+    def ticket_assigned(self, channel_id: int, ts: float | None = None):
+        ticket = self.open.get(channel_id)
+        if ticket is None or ticket["assigned"]:
+            return
+        ts = ts or time.time()
+        ticket["assigned"] = True
+        self._state_dirty = True
+        self._record(ts, ticket["category"], assigned=1, assign_s=max(0, round(ts - ticket["opened"])))
+
+    def ticket_closed(self, channel_id: int, ts: float | None = None, known_only: bool = False):
+        """Count a close; a ticket opened before tracking started counts without a resolution time.
+        ``known_only`` ignores channels that were never seen opening (e.g. any deleted channel)."""
+        ts = ts or time.time()
+        ticket = self.open.pop(channel_id, None)
+        if ticket is None:
+            if not known_only:
+                self._record(ts, UNCATEGORIZED, closed=1)
+            return
+        self._state_dirty = True
+        self._record(ts, ticket["category"], closed=1, resolved=1, resolve_s=max(0, round(ts - ticket["opened"])))
+
+    # ---- reads ----
+    def window(self, hours: int) -> dict[str, Rollup]:
+        """Per-category sums over the last ``hours`` (≤ window_hours) hourly buckets."""
+        oldest = self._hour(time.time()) - min(hours, self.window_hours) + 1
+        out: dict[str, Rollup] = {}
+        for (hour, cat), rollup in self._recent.items():
+            if hour >= oldest:
+                out.setdefault(self._category(cat), Rollup()).add(rollup)
+        return out
@@ -0,0 +1,249 @@
+# ==================================================
+# Nuvix Tickets — Transcripts
+# Parse data/tickets_logs/*.txt, render them as self-contained HTML in a process
+# pool and cache the pages by content hash.
+# ==================================================
+
+import asyncio
+import bisect
+import hashlib
+import html
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import serialization
+import transcript_archive
+
+# Bump when the page layout changes so cached pages are rendered again.
+RENDER_VERSION = 1
+
+_LINE = re.compile(r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] (.+?): ?(.*)$")
+_MENTION = re.compile(r"<(@!?|@&|#)(\d{15,20})>")
+_DISCRIMINATOR = re.compile(r"^(.*)#(\d{4})$")
+
+# ==============================
+# 📜 Parsing
+# ==============================
+def parse_transcript(text: str) -> list[dict]:
+    """``[YYYY-MM-DD HH:MM:SS] Author: content`` lines → messages. Lines without the
+    prefix continue the previous message (multi-line content)."""
+    messages = []
+    for line in text.splitlines():
+        m = _LINE.match(line)
+        if m:
+            messages.append({"ts": m.group(1), "author": m.group(2), "content": m.group(3)})
+        elif messages:
+            messages[-1]["content"] += "\n" + line
+        elif line.strip():
+            messages.append({"ts": "", "author": "", "content": line})
+    return messages
+
+
+def mention_ids(text: str) -> set[int]:
+    """User, role and channel IDs mentioned anywhere in the transcript."""
+    return {int(m.group(2)) for m in _MENTION.finditer(text)}
+
+# ==============================
+# 🖨 Rendering (process pool)
+# ==============================
+_STYLE = (
+    "body{font-family:'gg sans','Segoe UI',sans-serif;background:#313338;color:#dbdee1;margin:0;padding:2em}"
+    "header{border-bottom:1px solid #4e5058;margin-bottom:1em;padding-bottom:1em}h1{margin:0 0 .3em;color:#f2f3f5}"
+    ".meta{color:#949ba4;font-size:.9em}.group{display:flex;gap:12px;margin:14px 0}"
+    ".avatar{flex:none;width:40px;height:40px;border-radius:50%;display:flex;align-items:center;"
+    "justify-content:center;font-weight:bold;color:#fff}.author{font-weight:600;color:#f2f3f5}"
+    ".tag{color:#949ba4;font-weight:normal;font-size:.85em}time{color:#949ba4;font-size:.75em;margin-left:.5em}"
+    ".msg{white-space:pre-wrap;word-wrap:break-word;margin:2px 0}.msg time{margin:0 .5em 0 0}"
+    ".mention{background:rgba(88,101,242,.3);color:#c9cdfb;border-radius:3px;padding:0 2px}"
+    ".empty{color:#949ba4;font-style:italic}footer{margin-top:2em;color:#949ba4;font-size:.8em}"
+)
+
+
+def _colour(author: str) -> str:
+    return f"hsl({int(hashlib.md5(author.encode('utf-8')).hexdigest()[:4], 16) % 360},45%,45%)"
+
+
+def _content(text: str, names: dict) -> str:
+    """Escape message text and turn ``<@id>`` / ``<@&id>`` / ``<#id>`` into readable names."""
+    if not text:
+        return "<span class='empty'>embed or attachment</span>"
+    out, pos = [], 0
+    for m in _MENTION.finditer(text):
+        out.append(html.escape(text[pos:m.start()]))
+        kind, target = m.group(1), m.group(2)
+        name = names.get(target)
+        prefix = "#" if kind == "#" else "@"
+        out.append(f"<span class='mention' title='{target}'>{prefix}{html.escape(name or target)}</span>")
+        pos = m.end()
+    out.append(html.escape(text[pos:]))
+    return "".join(out)
+
+
+def render_transcript(text: str, names: dict, title: str, footer: str = "") -> str:
+    """Render one transcript as a self-contained HTML document. Pure function, safe to run
+    in a worker process. ``names`` maps mentioned IDs (as strings) to display names."""
+    esc = html.escape
+    messages = parse_transcript(text)
+    groups = []
+    for msg in messages:
+        if groups and groups[-1][0] == msg["author"]:
+            groups[-1][1].append(msg)
+        else:
+            groups.append((msg["author"], [msg]))
+
+    body = []
+    for author, msgs in groups:
+        m = _DISCRIMINATOR.match(author)
+        name, tag = (m.group(1), m.group(2)) if m else (author or "Unknown", "")
+        lines = [f"<div class='msg'>{_content(msgs[0]['content'], names)}</div>"]
+        lines += [f"<div class='msg'><time>{esc(x['ts'][11:])}</time>{_content(x['content'], names)}</div>"
+                  for x in msgs[1:]]
+        body.append(
+            f"<div class='group'><div class='avatar' style='background:{_colour(name)}'>{esc(name[:1].upper())}</div>"
+            f"<div><span class='author'>{esc(name)}</span>" + (f" <span class='tag'>#{tag}</span>" if tag else "")
+            + f"<time datetime='{esc(msgs[0]['ts'])}'>{esc(msgs[0]['ts'])}</time>{''.join(lines)}</div></div>"
+        )
+
+    authors = {}
+    for msg in messages:
+        authors[msg["author"]] = authors.get(msg["author"], 0) + 1
+    participants = ", ".join(f"{esc(a or 'Unknown')} ({n})" for a, n in authors.items())
+    span = f"{messages[0]['ts']} → {messages[-1]['ts']}" if messages else "empty"
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<title>{esc(title)}</title><style>{_STYLE}</style></head><body>"
+        f"<header><h1>🎫 {esc(title)}</h1><div class='meta'>{esc(span)} • {len(messages)} messages"
+        f"<br>Participants: {participants or '—'}</div></header>"
+        f"{''.join(body)}<footer>{esc(footer)}</footer></body></html>"
+    )
+
+# ==============================
+# 🗄 Renderer + cache
+# ==============================
+def _read(source) -> tuple[str, str, set[int]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            source = f.read()
+    text = str(source, "utf-8", errors="replace")
+    return text, hashlib.sha256(source).hexdigest(), mention_ids(text)
+
+
+def _read_cached(path: str) -> bytes | None:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _write_cached(path: str, page: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(page)
+    os.replace(tmp, path)
+
+
+class TranscriptRenderer:
+    """Runs :func:`render_transcript` in a process pool. Pages are cached on disk under the
+    hash of the transcript bytes + the resolved names, so repeated exports only read a file."""
+
+    def __init__(self, cache_dir: str, workers: int | None = None, footer: str = ""):
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.footer = footer
+        self._pool = None
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.stats = {"rendered": 0, "cache_hits": 0, "coalesced": 0}
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def cache_key(self, digest: str, names: dict) -> str:
+        extra = serialization.dumpb([RENDER_VERSION, self.footer, names], sort_keys=True)
+        return hashlib.sha256(digest.encode("ascii") + extra).hexdigest()
+
+    async def render(self, source, resolve=None, title: str | None = None) -> tuple[bytes, bool]:
+        """HTML for a transcript (a file path, or its bytes / a memoryview from the archive) and
+        whether it came from the cache. ``resolve`` is an optional coroutine function
+        ``ids -> {id: name}`` for mentions."""
+        text, digest, ids = await asyncio.to_thread(_read, source)
+        resolved = await resolve(ids) if resolve and ids else {}
+        names = {str(k): v for k, v in resolved.items() if v}
+        key = self.cache_key(digest, names)
+        cache_path = os.path.join(self.cache_dir, key[:2], f"{key}.html")
+
+        page = await asyncio.to_thread(_read_cached, cache_path)
+        if page is not None:
+            self.stats["cache_hits"] += 1
+            return page, True
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(task), False
+        if title is None:
+            title = os.path.splitext(os.path.basename(source))[0] if isinstance(source, (str, os.PathLike)) else "transcript"
+        task = asyncio.ensure_future(self._render(text, names, title, cache_path))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task), False
+
+    async def _render(self, text: str, names: dict, title: str, cache_path: str) -> bytes:
+        loop = asyncio.get_running_loop()
+        page = (await loop.run_in_executor(self._executor(), render_transcript, text, names, title, self.footer)).encode("utf-8")
+        self.stats["rendered"] += 1
+        await asyncio.to_thread(_write_cached, cache_path, page)
+        return page
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+# ==============================
+# 🔎 Names (autocomplete)
+# ==============================
+def list_transcripts(logs_dir: str) -> list[str]:
+    """``*.txt`` file names in ``logs_dir``, newest first."""
+    try:
+        entries = [e for e in os.scandir(logs_dir) if e.name.endswith(".txt") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [e.name for e in entries]
+
+
+class TranscriptNames:
+    """Transcript names kept in memory so autocomplete never touches the disk or the
+    archive. :meth:`load` does the I/O (run it in a thread) and swaps the lists in whole."""
+
+    def __init__(self):
+        self.live: list[str] = []                  # newest first
+        self.archived: list[tuple[str, str]] = []  # (ticket lowercased, file name), sorted
+
+    def load(self, logs_dir: str, archive=None):
+        """Re-list ``logs_dir`` and, when given, every ticket in ``archive`` (after a compaction)."""
+        self.live = list_transcripts(logs_dir)
+        if archive is not None:
+            self.archived = sorted((ticket.lower(), transcript_archive.transcript_filename(ticket, ts))
+                                   for ticket, ts in archive.entries())
+
+    def add_live(self, name: str):
+        """A transcript was just written (its ticket closed)."""
+        self.live = [name, *(n for n in self.live if n != name)]
+
+    def search(self, text: str, limit: int = 25) -> list[str]:
+        """Live names containing ``text``, then archived tickets starting with it."""
+        needle = text.lower()
+        found = [n for n in self.live if needle in n.lower()][:limit]
+        if needle and len(found) < limit:  # archived tickets only once something was typed
+            prefix = needle.removeprefix("transcript_")
+            i = bisect.bisect_left(self.archived, (prefix,))
+            while i < len(self.archived) and len(found) < limit and self.archived[i][0].startswith(prefix):
+                found.append(self.archived[i][1])
+                i += 1
+        return found
@@ -0,0 +1,42 @@
+# ==================================================
+# Nuvix Suite — Runtime profile
+# NUVIX_FAST_RUNTIME=1 opts a bot into uvloop + orjson (see serialization.py).
+# Each piece falls back to the stdlib on its own when the package is missing.
+# ==================================================
+
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+import config
+import serialization
+
+
+def fast_requested() -> bool:
+    return config.settings().get_bool("NUVIX_FAST_RUNTIME")
+
+
+def loop_factory():
+    """Event loop factory for the current profile (None = asyncio's default)."""
+    if fast_requested() and uvloop is not None:
+        return uvloop.new_event_loop
+    return None
+
+
+def describe() -> str:
+    loop = "uvloop" if loop_factory() is not None else "asyncio"
+    return f"{loop} + {serialization.backend()}"
+
+
+def run(main):
+    """``asyncio.run(main)`` on the loop picked by the runtime profile."""
+    if fast_requested():
+        missing = [name for name, mod in (("uvloop", uvloop), ("orjson", serialization.orjson)) if mod is None]
+        if missing:
+            print(f"⚠️ Fast runtime requested but {', '.join(missing)} not installed — using the stdlib instead")
+        print(f"⚡ Runtime: {describe()}")
+    with asyncio.Runner(loop_factory=loop_factory()) as runner:
+        return runner.run(main)
@@ -0,0 +1,66 @@
+# ==================================================
+# Nuvix Suite — Serialization
+# One JSON API for the whole suite: orjson when the fast runtime is on and
+# installed, the stdlib json module otherwise. Both produce the same compact
+# UTF-8 output, so files written in one mode read back in the other (floats that
+# need an exponent are spelled differently; orjson rejects ints beyond 64 bits).
+# ==================================================
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import config
+
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError subclasses it
+
+if orjson is not None:
+    _OPT = orjson.OPT_NON_STR_KEYS  # int keys become strings, like the stdlib does
+    _OPT_SORTED = _OPT | orjson.OPT_SORT_KEYS
+
+_fast = False
+
+
+def use(fast: bool) -> str:
+    """Pick the backend; returns the one actually in use ("orjson" or "json")."""
+    global _fast
+    _fast = bool(fast) and orjson is not None
+    return backend()
+
+
+def backend() -> str:
+    return "orjson" if _fast else "json"
+
+
+def dumpb(obj, *, sort_keys: bool = False, default=None) -> bytes:
+    """Compact UTF-8 JSON as bytes (sockets, binary files)."""
+    if _fast:
+        return orjson.dumps(obj, default=default, option=_OPT_SORTED if sort_keys else _OPT)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys,
+                      default=default).encode("utf-8")
+
+
+def dumps(obj, *, sort_keys: bool = False, default=None) -> str:
+    """Compact JSON as text (text files, SQLite columns, cache keys)."""
+    if _fast:
+        return orjson.dumps(obj, default=default, option=_OPT_SORTED if sort_keys else _OPT).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys, default=default)
+
+
+def loads(data):
+    """Parse ``str`` or ``bytes``."""
+    return orjson.loads(data) if _fast else json.loads(data)
+
+
+def dump(obj, f, **kwargs):
+    f.write(dumps(obj, **kwargs))
+
+
+def load(f):
+    return loads(f.read())
+
+
+use(config.settings().get_bool("NUVIX_FAST_RUNTIME"))
@@ -0,0 +1,15 @@
+# ==================================================
+# Nuvix Suite — Tests: shared setup
+# Same import layout as the bots: shared modules from the repo root, a bot's own
+# modules from its directory. Settings never come from the local .env.
+# ==================================================
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ["NUVIX_ENV_FILE"] = os.devnull
+for _path in (ROOT_DIR, *(os.path.join(ROOT_DIR, name) for name in ("nuvix_ai", "nuvix_invoices", "nuvix_sanctions", "nuvix_tickets"))):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
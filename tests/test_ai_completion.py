@@ -0,0 +1,131 @@
+# ==================================================
+# Nuvix Ai — completion cache and request coalescing (nuvix_ai/completion.py)
+# ==================================================
+
+import asyncio
+
+import pytest
+
+from completion import CompletionPipeline, StubBackend, TTLCache, cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# ==============================
+# 🗃 TTLCache
+# ==============================
+def test_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.set("a", "1")
+    clock.now = 9.9
+    assert cache.get("a") == "1"
+    clock.now = 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("1", "3")
+
+
+def test_cache_ttl_zero_never_expires():
+    clock = FakeClock()
+    cache = TTLCache(ttl=0, clock=clock)
+    cache.set("a", "1")
+    clock.now = 10**9
+    assert cache.get("a") == "1"
+
+
+def test_cache_key_ignores_case_spacing_and_punctuation():
+    assert cache_key("  How do I PAY?? ") == cache_key("how do i pay")
+    assert cache_key("how do i pay", {"guild": 1}) != cache_key("how do i pay", {"guild": 2})
+
+# ==============================
+# 🚀 Pipeline
+# ==============================
+def test_second_ask_is_a_cache_hit():
+    async def scenario():
+        backend = StubBackend({"refund policy": "14 days."})
+        pipeline = CompletionPipeline(backend)
+        first = await pipeline.complete("Refund policy?")
+        second = await pipeline.complete("refund   POLICY")
+        return backend, pipeline, first, second
+
+    backend, pipeline, first, second = asyncio.run(scenario())
+    assert first == second == "14 days."
+    assert backend.calls == 1
+    assert pipeline.stats["hits"] == 1
+
+
+def test_faq_answers_without_the_backend():
+    async def scenario():
+        backend = StubBackend()
+        pipeline = CompletionPipeline(backend)
+        pipeline.seed_faq({"How do I open a ticket?": "Use the panel."})
+        return backend, await pipeline.complete("how do i open a ticket", {"guild": 5})
+
+    backend, answer = asyncio.run(scenario())
+    assert answer == "Use the panel."
+    assert backend.calls == 0
+
+
+def test_identical_requests_in_flight_share_one_backend_call():
+    async def scenario():
+        backend = StubBackend(delay=0.05)
+        pipeline = CompletionPipeline(backend)
+        answers = await asyncio.gather(*(pipeline.complete("Is the shop open?") for _ in range(10)))
+        return backend, pipeline, answers
+
+    backend, pipeline, answers = asyncio.run(scenario())
+    assert len(set(answers)) == 1
+    assert backend.calls == 1
+    assert pipeline.stats["coalesced"] == 9
+
+
+def test_followers_get_the_leaders_error_and_nothing_is_cached():
+    class FailingBackend(StubBackend):
+        async def complete(self, prompt, context=None):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("backend down")
+
+    async def scenario():
+        pipeline = CompletionPipeline(FailingBackend())
+        results = await asyncio.gather(*(pipeline.complete("hi") for _ in range(3)), return_exceptions=True)
+        return pipeline, results
+
+    pipeline, results = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert pipeline.backend.calls == 1
+    assert len(pipeline.cache) == 0
+
+
+def test_follower_retries_when_the_leader_is_cancelled():
+    async def scenario():
+        backend = StubBackend(delay=0.05)
+        pipeline = CompletionPipeline(backend)
+        leader = asyncio.create_task(pipeline.complete("hello"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(pipeline.complete("hello"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return backend, await follower
+
+    backend, answer = asyncio.run(scenario())
+    assert answer == "[stub] I received your question: hello"
+    assert backend.calls == 2
@@ -0,0 +1,148 @@
+# ==================================================
+# Nuvix Ai — fair-share queue (nuvix_ai/inference_queue.py)
+# ==================================================
+
+import asyncio
+
+import pytest
+
+from completion import StubBackend
+from inference_queue import DeficitRoundRobin, InferenceQueue, QueueClosedError, QueueFullError, ThrottledEditor
+
+
+def drain(drr) -> list:
+    return [drr.pop() for _ in range(len(drr))]
+
+
+# ==============================
+# ⚖️ Deficit round-robin
+# ==============================
+def test_busy_flow_does_not_starve_a_quiet_one():
+    drr = DeficitRoundRobin()
+    for i in range(6):
+        drr.push(("A",), 1, f"a{i}")
+    drr.push(("B",), 1, "b0")
+    drr.push(("B",), 1, "b1")
+    assert drain(drr) == ["a0", "b0", "a1", "b1", "a2", "a3", "a4", "a5"]
+
+
+def test_cost_is_charged_against_the_flow_share():
+    drr = DeficitRoundRobin()
+    for i in range(3):
+        drr.push(("heavy",), 2, f"h{i}")
+    for i in range(6):
+        drr.push(("light",), 1, f"l{i}")
+    order = drain(drr)
+    # by the time the heavy flow got 2 items (cost 4), the light one got about as much
+    assert order.index("h1") > order.index("l2")
+    assert sorted(order) == sorted(f"h{i}" for i in range(3)) + sorted(f"l{i}" for i in range(6))
+
+
+def test_guilds_share_first_then_users_inside_a_guild():
+    drr = DeficitRoundRobin(depth=2)
+    for i in range(4):
+        drr.push(("big", "u1"), 1, f"big-u1-{i}")
+    for i in range(2):
+        drr.push(("big", "u2"), 1, f"big-u2-{i}")
+    drr.push(("small", "u3"), 1, "small-u3-0")
+    assert drain(drr)[:4] == ["big-u1-0", "small-u3-0", "big-u2-0", "big-u1-1"]
+    assert drr.pending_for("big") == 0
+
+
+def test_pending_for_and_empty_pop():
+    drr = DeficitRoundRobin(depth=2)
+    drr.push((1, 10), 1, "x")
+    drr.push((1, 11), 1, "y")
+    assert drr.pending_for(1) == 2
+    assert drr.pending_for(1, 10) == 1
+    assert drr.pending_for(2) == 0
+    drain(drr)
+    with pytest.raises(IndexError):
+        drr.pop()
+
+# ==============================
+# 🧵 Queue
+# ==============================
+def test_queue_serves_guilds_in_turn():
+    async def scenario():
+        queue = InferenceQueue(StubBackend(), concurrency=1, max_per_user=10)
+        done = []
+        jobs = [await queue.submit(f"a{i}", "A", f"a{i}") for i in range(4)]
+        jobs += [await queue.submit(f"b{i}", "B", f"b{i}") for i in range(2)]
+        for job in jobs:
+            job.future.add_done_callback(lambda _, p=job.prompt: done.append(p))
+        queue.start()
+        await asyncio.gather(*(job.wait() for job in jobs))
+        await queue.stop()
+        return done, queue.snapshot()
+
+    done, snapshot = asyncio.run(scenario())
+    assert done == ["a0", "b0", "a1", "b1", "a2", "a3"]
+    assert snapshot["completed"] == 6 and snapshot["depth"] == 0
+
+
+def test_streams_chunks_and_returns_the_full_answer():
+    async def scenario():
+        queue = InferenceQueue(StubBackend({"hello": "hi there friend"}))
+        chunks = []
+        queue.start()
+        job = await queue.submit(1, 1, "hello", on_chunk=chunks.append)
+        answer = await job.wait()
+        await queue.stop()
+        return chunks, answer
+
+    chunks, answer = asyncio.run(scenario())
+    assert answer == "hi there friend"
+    assert chunks == ["hi", " there", " friend"]
+
+
+def test_editor_coalesces_chunks_into_few_edits():
+    async def scenario():
+        sent = []
+
+        async def edit(text):
+            sent.append(text)
+
+        editor = ThrottledEditor(edit, interval=0.05)
+        for i in range(1000):
+            editor.append(f"w{i} ")
+            if i % 100 == 0:
+                await asyncio.sleep(0)
+        await asyncio.sleep(0.12)
+        await editor.stop()
+        return editor, sent
+
+    editor, sent = asyncio.run(scenario())
+    full = "".join(f"w{i} " for i in range(1000))
+    assert editor.text == full and sent[-1] == full
+    assert len(sent) <= 4 and editor.edits == len(sent)
+
+
+def test_per_user_limit_rejects():
+    async def scenario():
+        queue = InferenceQueue(StubBackend(), max_per_user=2)
+        await queue.submit(1, 1, "q1")
+        await queue.submit(1, 1, "q2")
+        with pytest.raises(QueueFullError):
+            await queue.submit(1, 1, "q3")
+        await queue.submit(2, 1, "other user")
+        return queue.snapshot()
+
+    assert asyncio.run(scenario())["rejected"] == 1
+
+
+def test_stop_fails_queued_and_running_jobs():
+    async def scenario():
+        queue = InferenceQueue(StubBackend(delay=10), concurrency=1)
+        queue.start()
+        running = await queue.submit(1, 1, "slow")
+        queued = await queue.submit(2, 1, "waiting")
+        await asyncio.sleep(0.01)
+        await queue.stop()
+        results = await asyncio.gather(running.wait(), queued.wait(), return_exceptions=True)
+        with pytest.raises(QueueClosedError):
+            await queue.submit(3, 1, "late")
+        return results
+
+    results = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    assert all(isinstance(r, QueueClosedError) for r in results)
@@ -0,0 +1,106 @@
+# ==================================================
+# Nuvix Suite — configuration (config.py)
+# ==================================================
+
+import pytest
+
+import config
+
+TOKEN = "x" * 60
+
+
+def build(declared=(), **raw):
+    return config.build_settings(raw, declared=declared)
+
+# ==============================
+# 🧾 build_settings
+# ==============================
+def test_fields_are_parsed():
+    s = build(NUVIX_AI_TOKEN=TOKEN, OWNER_ROLE_ID="42", STAFF_ROLE_IDS="1, 2,3", EMBED_COLOR_HEX="#00ff00", PORT="8080")
+    assert s.token("nuvix_ai") == TOKEN and s.token("nuvix_apps") is None
+    assert (s.owner_role_id, s.staff_role_ids, s.embed_color, s.port) == (42, frozenset({1, 2, 3}), 0x00FF00, 8080)
+
+
+def test_every_problem_is_reported_at_once():
+    with pytest.raises(config.ConfigError) as e:
+        build(NUVIX_AI_TOKEN="short", OWNER_ROLE_ID="owner", PORT="70000", AI_CACHE_SIZE="lots")
+    problems = "\n".join(e.value.problems)
+    for name in ("NUVIX_AI_TOKEN", "OWNER_ROLE_ID", "PORT", "AI_CACHE_SIZE"):
+        assert name in problems
+
+
+@pytest.mark.parametrize("name,value", [("AI_CONCURRENCY", "two"), ("NUVIX_LAG_INTERVAL", "5s"),
+                                        ("TICKET_CATEGORY_IDS", "1,abc"), ("MUTED_ROLE_ID", "muted")])
+def test_typed_knobs_are_checked_at_build_time(name, value):
+    with pytest.raises(config.ConfigError, match=name):
+        build(**{name: value})
+
+
+def test_id_names_are_only_checked_when_declared():
+    unrelated = {"CI_RUNNER_ROLE_ID": "runner-7", "HOST_CHANNEL_ID": "stable"}
+    assert build(**unrelated).raw["CI_RUNNER_ROLE_ID"] == "runner-7"
+    with pytest.raises(config.ConfigError, match="CI_RUNNER_ROLE_ID"):
+        build(declared={"CI_RUNNER_ROLE_ID"}, **unrelated)
+
+
+def test_load_raw_lets_the_environment_win(tmp_path):
+    env = tmp_path / ".env"
+    env.write_text('export PORT=1\nFOOTER_TEXT="Hi # there"\nBANNER_URL=x # comment\n')
+    raw, declared = config.load_raw(str(env), environ={"PORT": "2"})
+    assert raw == {"PORT": "2", "FOOTER_TEXT": "Hi # there", "BANNER_URL": "x"}
+    assert declared == {"PORT", "FOOTER_TEXT", "BANNER_URL"}
+
+# ==============================
+# 🔢 Typed getters
+# ==============================
+def test_typed_getters_parse_once_per_snapshot():
+    s = build(AI_CACHE_SIZE="0x10", SANCTIONS_RATE="2.5", NUVIX_FAST_RUNTIME="Yes", EXTRA_KNOB="7")
+    assert s.get_int("AI_CACHE_SIZE", 1) == 16
+    assert s.get_float("SANCTIONS_RATE") == 2.5
+    assert s.get_bool("NUVIX_FAST_RUNTIME") is True
+    assert s.get_int("AI_QUEUE_SIZE", 200) == 200  # unset: the caller's default
+    assert s.get_int("EXTRA_KNOB") == 7
+    ids = s.get_ids("TICKET_CATEGORY_IDS")
+    assert ids == frozenset() and s.get_ids("TICKET_CATEGORY_IDS") is ids
+    assert {("AI_CACHE_SIZE", "int"), ("EXTRA_KNOB", "int")} <= set(s._memo)
+
+
+def test_blank_values_fall_back_to_the_default():
+    s = build(AI_CACHE_SIZE="  ", EXTRA_KNOB="")
+    assert s.get_int("AI_CACHE_SIZE", 5) == 5
+    assert s.get_float("EXTRA_KNOB", 1.5) == 1.5
+
+# ==============================
+# 🔁 Reload
+# ==============================
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    path = tmp_path / ".env"
+    path.write_text(f"NUVIX_AI_TOKEN={TOKEN}\nFOOTER_TEXT=first\n")
+    monkeypatch.setattr(config, "ENV_FILE", str(path))
+    monkeypatch.setattr(config, "_current", None)
+    monkeypatch.setattr(config, "_listeners", [])
+    for name in ("NUVIX_AI_TOKEN", "FOOTER_TEXT", "PORT"):
+        monkeypatch.delenv(name, raising=False)
+    return path
+
+
+def test_reload_swaps_the_snapshot_and_calls_listeners(env_file):
+    seen = []
+    old = config.settings()
+    config.on_reload(lambda old, new: 1 / 0)  # a broken listener doesn't stop the others
+    config.on_reload(lambda old, new: seen.append((old.footer_text, new.footer_text)))
+    env_file.write_text(f"NUVIX_AI_TOKEN={TOKEN}\nFOOTER_TEXT=second\n")
+    new = config.reload()
+    assert config.settings() is new and new.version == old.version + 1
+    assert seen == [("first", "second")]
+
+
+def test_invalid_reload_keeps_the_old_snapshot(env_file):
+    seen = []
+    old = config.settings()
+    config.on_reload(lambda old, new: seen.append(new))
+    env_file.write_text("PORT=not-a-port\n")
+    with pytest.raises(config.ConfigError):
+        config.reload()
+    assert config.settings() is old and seen == []
@@ -0,0 +1,163 @@
+# ==================================================
+# Nuvix Suite — event bus (event_bus.py)
+# ==================================================
+
+import asyncio
+import time
+from collections import deque
+
+import pytest
+
+import serialization
+from event_bus import Event, EventBus, TicketOpened, _Peer, matches
+
+
+async def until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached in time")
+        await asyncio.sleep(0.01)
+
+# ==============================
+# 🏷 Patterns + events
+# ==============================
+@pytest.mark.parametrize("pattern,event_type,expected", [
+    ("*", "ticket.opened", True),
+    ("ticket.*", "ticket.closed", True),
+    ("ticket.*", "tickets.closed", False),
+    ("ticket.closed", "ticket.closed", True),
+    ("ticket.closed", "ticket.opened", False),
+    ("ticket", "ticket.opened", False),
+])
+def test_matches(pattern, event_type, expected):
+    assert matches(pattern, event_type) is expected
+
+
+def test_event_round_trips_and_rejects_junk():
+    event = Event("ticket.closed", {"channel_id": 2**60}, source="nuvix_tickets")
+    assert Event.decode(event.encode()) == event
+    for data in ({"type": "x", "payload": {}, "extra": 1}, {"payload": {}}, {"type": 1, "payload": {}},
+                 {"type": "x", "payload": [1]}):
+        with pytest.raises(ValueError):
+            Event.from_dict(data)
+
+# ==============================
+# 📮 In-process dispatch
+# ==============================
+def test_local_dispatch_sync_and_async_handlers():
+    async def scenario():
+        bus = EventBus()
+        seen = []
+
+        @bus.subscribe("ticket.*")
+        def on_ticket(event):
+            seen.append(("sync", event.type, event.payload))
+
+        @bus.subscribe("ticket.opened")
+        async def on_opened(event):
+            seen.append(("async", event.type, event.payload["user_id"]))
+
+        bus.subscribe("invoice.*", lambda event: seen.append(("invoice",)))
+        bus.subscribe("ticket.closed", lambda event: 1 / 0)
+        bus.publish(TicketOpened(guild_id=1, channel_id=2, user_id=3))
+        bus.publish("ticket.closed", {"channel_id": 2})
+        await asyncio.sleep(0)
+        return bus, seen
+
+    bus, seen = asyncio.run(scenario())
+    assert seen == [
+        ("sync", "ticket.opened", {"guild_id": 1, "channel_id": 2, "user_id": 3, "category": ""}),
+        ("sync", "ticket.closed", {"channel_id": 2}),
+        ("async", "ticket.opened", 3),
+    ]
+    assert bus.stats["handler_errors"] == 1 and bus.stats["published"] == 2
+
+
+# ==============================
+# 🔌 Broker + clients
+# ==============================
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "bus.sock")
+
+
+def test_publish_from_another_thread_runs_on_the_bus_loop(socket_path):
+    async def scenario():
+        bus = EventBus(socket_path)
+        await bus.start("test")
+        on_loop = []
+        bus.subscribe("*", lambda event: on_loop.append(asyncio.get_running_loop() is bus._loop))
+        await asyncio.to_thread(bus.publish, "x.y")
+        await until(lambda: on_loop)
+        await bus.stop()
+        return on_loop
+
+    assert asyncio.run(asyncio.wait_for(scenario(), timeout=10)) == [True]
+
+
+def test_broker_fans_out_to_matching_clients(socket_path):
+    async def scenario():
+        broker, tickets, invoices = EventBus(socket_path), EventBus(socket_path), EventBus(socket_path)
+        got = {"broker": [], "tickets": [], "invoices": []}
+        broker.subscribe("*", lambda e: got["broker"].append(e.type))
+        tickets.subscribe("ticket.*", lambda e: got["tickets"].append((e.type, e.source)))
+        invoices.subscribe("invoice.*", lambda e: got["invoices"].append((e.type, e.source)))
+        await broker.start("broker")
+        await until(lambda: broker.role == "broker")
+        await tickets.start("tickets")
+        await invoices.start("invoices")
+        await until(lambda: tickets.role == invoices.role == "client" and len(broker._peers) == 2
+                    and all(p.patterns for p in broker._peers.values()))
+        broker.publish("ticket.opened", {"channel_id": 1})
+        invoices.publish("ticket.closed", {"channel_id": 1})
+        tickets.publish("invoice.created", {"invoice_id": 7})
+        await until(lambda: len(got["tickets"]) == 2 and got["invoices"] and len(got["broker"]) == 3)
+        await asyncio.sleep(0.05)
+        for bus in (invoices, tickets, broker):
+            await bus.stop()
+        return got
+
+    got = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    assert got["tickets"] == [("ticket.opened", "broker"), ("ticket.closed", "invoices")]
+    assert got["invoices"] == [("invoice.created", "tickets")]
+    assert sorted(got["broker"]) == ["invoice.created", "ticket.closed", "ticket.opened"]
+
+
+def test_malformed_lines_are_skipped_not_fatal(socket_path):
+    async def scenario():
+        broker = EventBus(socket_path)
+        got = []
+        broker.subscribe("*", lambda e: got.append(e.payload))
+        await broker.start("broker")
+        await until(lambda: broker.role == "broker")
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        for line in (b"not json", b"[1, 2]", b'{"op": "pub"}', b'{"op": "sub", "patterns": 5}',
+                     b'{"op": "pub", "event": {"type": "x", "payload": {}, "extra": 1}}',
+                     b'{"op": "pub", "event": {"type": 3, "payload": {}}}'):
+            writer.write(line + b"\n")
+        writer.write(serialization.dumpb({"op": "pub", "event": {"type": "ok.event", "payload": {"n": 1}}}) + b"\n")
+        await writer.drain()
+        await until(lambda: got)
+        writer.close()
+        await broker.stop()
+        return broker, got
+
+    broker, got = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    assert got == [{"n": 1}]
+    assert broker.stats["malformed"] == 6 and broker.stats["received"] == 1
+
+
+def test_slow_subscriber_drops_its_oldest_events():
+    async def scenario():
+        bus = EventBus(max_backlog=2)
+        peer = _Peer(deque(maxlen=bus.max_backlog), asyncio.Event(), {"ticket.*"})
+        other = _Peer(deque(maxlen=bus.max_backlog), asyncio.Event(), {"invoice.*"})
+        bus._peers = {"slow": peer, "other": other}
+        for i in range(3):
+            bus._fanout(Event("ticket.opened", {"n": i}), sender=None)
+        return bus, peer, other
+
+    bus, peer, other = asyncio.run(scenario())
+    assert [Event.decode(line).payload["n"] for line in peer.queue] == [1, 2]
+    assert bus.stats["dropped"] == 1 and not other.queue
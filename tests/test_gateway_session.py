@@ -0,0 +1,150 @@
+# ==================================================
+# Nuvix Suite — gateway sessions (gateway_session.py)
+# Pins the discord.py internals the RESUME path relies on, so an upgrade that
+# changes them fails here instead of silently identifying on every start.
+# ==================================================
+
+import asyncio
+import inspect
+import time
+
+import discord
+import pytest
+import yarl
+from discord.gateway import DiscordWebSocket
+from discord.state import ConnectionState
+
+import gateway_session
+import serialization
+
+GUILD_ID = 1432829605298962534
+BOT_USER = {"id": "1310330017963839622", "username": "nuvix", "global_name": None, "discriminator": "0",
+            "avatar": None, "bot": True, "flags": 0}
+
+
+def user(uid: str, name: str, bot: bool = False) -> dict:
+    return {"id": uid, "username": name, "global_name": None, "discriminator": "0", "avatar": None, "bot": bot}
+
+
+def member(uid: str, name: str, roles=(), nick=None, bot=False) -> dict:
+    return {"user": user(uid, name, bot), "roles": list(roles), "joined_at": "2025-11-02T23:33:42+00:00",
+            "nick": nick, "deaf": False, "mute": False, "flags": 0, "pending": False}
+
+
+GUILD = {
+    "id": str(GUILD_ID), "name": "Nuvix Market", "icon": None, "owner_id": "1", "member_count": 3,
+    "large": False, "features": ["COMMUNITY"], "preferred_locale": "es-ES",
+    "roles": [
+        {"id": str(GUILD_ID), "name": "@everyone", "permissions": "104324673", "position": 0, "color": 0,
+         "hoist": False, "managed": False, "mentionable": False, "flags": 0},
+        {"id": "2000", "name": "Staff", "permissions": "8", "position": 1, "color": 0xE91E63,
+         "hoist": True, "managed": False, "mentionable": True, "flags": 0},
+    ],
+    "channels": [
+        {"id": "3000", "type": 4, "name": "Tickets", "position": 0,
+         "permission_overwrites": [{"id": str(GUILD_ID), "type": 0, "allow": "0", "deny": "1024"}]},
+        {"id": "3001", "type": 0, "name": "benyx1-233342", "position": 1, "parent_id": "3000", "topic": "Compra",
+         "nsfw": False, "rate_limit_per_user": 5,
+         "permission_overwrites": [{"id": str(GUILD_ID), "type": 0, "allow": "0", "deny": "1024"},
+                                   {"id": "1", "type": 1, "allow": "3072", "deny": "0"},
+                                   {"id": "2000", "type": 0, "allow": "3072", "deny": "0"}]},
+        {"id": "3002", "type": 2, "name": "Voice", "position": 2, "bitrate": 64000, "user_limit": 5,
+         "permission_overwrites": []},
+        {"id": "3003", "type": 15, "name": "suggestions", "position": 3, "permission_overwrites": []},
+        {"id": "3004", "type": 13, "name": "Events", "position": 4, "bitrate": 64000, "user_limit": 0,
+         "permission_overwrites": []},
+    ],
+    "members": [member("1", "benyx1", ["2000"], nick="Ben"), member("2", "customer"),
+                member(BOT_USER["id"], "nuvix", bot=True)],
+}
+
+
+def logged_in_client() -> discord.Client:
+    """A client as it is right after login(): user known, cache empty."""
+    intents = discord.Intents.none()
+    intents.guilds = True
+    intents.members = True
+    client = discord.Client(intents=intents)
+    client._connection.user = discord.ClientUser(state=client._connection, data=BOT_USER)
+    return client
+
+
+def saved_session() -> dict:
+    source = logged_in_client()
+    source._connection._add_guild_from_data(GUILD)
+    # through the same serializer the session file uses
+    return serialization.loads(serialization.dumpb(gateway_session.client_snapshot(source)))
+
+# ==============================
+# 🔌 Private API contract
+# ==============================
+def test_discord_internals_used_for_resume_still_exist():
+    params = inspect.signature(gateway_session._original_from_client).parameters
+    assert {"initial", "gateway", "session", "sequence", "resume"} <= set(params)
+    # shutdown() stops handling events by emptying the websocket's parser table
+    assert "_discord_parsers" in inspect.getsource(gateway_session._original_from_client)
+    assert callable(ConnectionState._add_guild_from_data)
+    assert "views" in inspect.signature(ConnectionState.clear).parameters
+    assert callable(discord.Client._handle_ready)
+    assert DiscordWebSocket.from_client.__func__ is gateway_session._from_client
+
+# ==============================
+# 📸 Snapshot → restore
+# ==============================
+def test_snapshot_restores_into_a_fresh_connection_state():
+    client = logged_in_client()
+    assert gateway_session._restore(client, saved_session())
+    guild = client.get_guild(GUILD_ID)
+    assert (guild.name, guild.owner_id, guild.preferred_locale) == ("Nuvix Market", 1, discord.Locale.spain_spanish)
+    assert [(c.id, c.type) for c in guild.channels] == [
+        (3000, discord.ChannelType.category), (3001, discord.ChannelType.text), (3002, discord.ChannelType.voice),
+        (3003, discord.ChannelType.forum), (3004, discord.ChannelType.stage_voice)]
+
+    ticket = guild.get_channel(3001)
+    assert (ticket.category_id, ticket.topic, ticket.slowmode_delay) == (3000, "Compra", 5)
+    overwrites = {getattr(t, "id", None): o.pair() for t, o in ticket.overwrites.items()}
+    assert overwrites[GUILD_ID][1].view_channel is True
+    assert overwrites[1][0].send_messages is True and overwrites[2000][0].view_channel is True
+    assert guild.get_channel(3002).user_limit == 5
+
+    staff = guild.get_role(2000)
+    assert (staff.colour.value, staff.hoist, staff.permissions.administrator) == (0xE91E63, True, True)
+    ben = guild.get_member(1)
+    assert (ben.nick, [r.id for r in ben.roles]) == ("Ben", [GUILD_ID, 2000])
+    assert guild.get_member(2) is not None and guild.me is not None
+    assert client.user.id == int(BOT_USER["id"])
+
+
+def test_restore_refuses_a_session_saved_for_another_bot():
+    saved = saved_session()
+    saved["user"] = dict(saved["user"], id="42")
+    client = logged_in_client()
+    assert not gateway_session._restore(client, saved)
+    assert len(client.guilds) == 0
+
+
+def test_first_connect_resumes_with_the_saved_session(monkeypatch):
+    calls = []
+
+    async def fake_original(cls, client, **kwargs):
+        calls.append(kwargs)
+        return kwargs
+
+    monkeypatch.setattr(gateway_session, "_original_from_client", fake_original)
+    client = logged_in_client()
+    saved = dict(saved_session(), session_id="abc", sequence=41, gateway="wss://gateway.discord.gg")
+    gateway_session._pending[id(client)] = saved
+    asyncio.run(DiscordWebSocket.from_client(client, initial=True))
+    asyncio.run(DiscordWebSocket.from_client(client, initial=False))  # a later reconnect: left alone
+    assert calls[0] == {"initial": True, "resume": True, "session": "abc", "sequence": 41,
+                        "gateway": yarl.URL("wss://gateway.discord.gg")}
+    assert calls[1] == {"initial": False}
+    assert client._nuvix_resuming and client.get_guild(GUILD_ID) is not None
+
+
+@pytest.mark.parametrize("age,expected", [(10, True), (1000, False)])
+def test_take_is_single_use_and_honours_the_window(tmp_path, monkeypatch, age, expected):
+    monkeypatch.setattr(gateway_session, "session_path", lambda name: str(tmp_path / f"{name}.json"))
+    gateway_session.save("nuvix_tickets", {"session_id": "abc", "saved_at": time.time() - age})
+    assert (gateway_session.take("nuvix_tickets", 90) is not None) is expected
+    assert gateway_session.take("nuvix_tickets", 90) is None
@@ -0,0 +1,138 @@
+# ==================================================
+# Nuvix Invoices — ledger (nuvix_invoices/ledger.py)
+# ==================================================
+
+import csv
+import json
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from ledger import InvoiceLedger, month_range, read_import
+
+JAN = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+FEB = datetime(2025, 2, 1, tzinfo=timezone.utc).timestamp()
+
+
+def item(cents=499, quantity=1, description="Nitro"):
+    return [{"description": description, "quantity": quantity, "unit_cents": cents}]
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = InvoiceLedger(tmp_path / "invoices.sqlite3")
+    yield ledger
+    ledger.close()
+
+# ==============================
+# 🔒 Append-only
+# ==============================
+@pytest.mark.parametrize("sql", [
+    "UPDATE invoices SET amount_cents = 1",
+    "DELETE FROM invoices",
+    "UPDATE invoice_events SET status = 'paid'",
+    "DELETE FROM invoice_events",
+    "UPDATE invoice_state SET status = 'open' WHERE status = 'void'",
+])
+def test_history_cannot_be_rewritten(ledger, sql):
+    invoice_id = ledger.create(1, "benyx1", item())
+    ledger.set_status(invoice_id, "void")
+    with pytest.raises(sqlite3.IntegrityError):
+        ledger._conn.execute(sql)
+    assert ledger.get(invoice_id)["amount_cents"] == 499
+
+
+def test_create_validates_and_totals(ledger):
+    invoice_id = ledger.create(1, "benyx1", item(250, quantity=3), currency="USD", created_by=9)
+    inv = ledger.get(invoice_id)
+    assert (inv["amount_cents"], inv["currency"], inv["status"], inv["created_by"]) == (750, "USD", "open", 9)
+    for items, currency in ((item(0), "EUR"), (item(quantity=0), "EUR"), (item(), "euro"), ([], "EUR")):
+        with pytest.raises(ValueError):
+            ledger.create(1, "benyx1", items, currency)
+
+# ==============================
+# 🔁 Status transitions
+# ==============================
+def test_allowed_transitions_are_recorded(ledger):
+    invoice_id = ledger.create(1, "benyx1", item(), now=JAN)
+    ledger.set_status(invoice_id, "paid", actor_id=7, now=JAN + 10)
+    ledger.set_status(invoice_id, "refunded", actor_id=7, now=JAN + 20)
+    assert ledger.get(invoice_id)["status"] == "refunded"
+    assert ledger.history(invoice_id) == [("open", None, JAN), ("paid", 7, JAN + 10), ("refunded", 7, JAN + 20)]
+
+
+@pytest.mark.parametrize("path,bad", [(["void"], "paid"), (["paid"], "open"), (["paid"], "void"),
+                                      ([], "refunded"), ([], "open"), ([], "draft")])
+def test_other_transitions_are_rejected(ledger, path, bad):
+    invoice_id = ledger.create(1, "benyx1", item())
+    for status in path:
+        ledger.set_status(invoice_id, status)
+    with pytest.raises(ValueError):
+        ledger.set_status(invoice_id, bad)
+    assert len(ledger.history(invoice_id)) == len(path) + 1
+
+
+def test_unknown_invoice(ledger):
+    with pytest.raises(KeyError):
+        ledger.set_status(404, "paid")
+
+# ==============================
+# 📤 Range reads + export
+# ==============================
+def seed(ledger):
+    ids = [ledger.create(i, f"customer{i}", item(100 * (i + 1)), now=JAN + i * 86400) for i in range(7)]
+    ledger.create(99, "february", item(), now=FEB)
+    ledger.create(98, "december", item(), now=JAN - 1)
+    for invoice_id in ids[::2]:
+        ledger.set_status(invoice_id, "paid")
+    return ids
+
+
+def test_iter_range_pages_in_id_order(ledger):
+    ids = seed(ledger)
+    assert [inv["id"] for inv in ledger.iter_range(JAN, FEB, batch=2)] == ids
+    assert [inv["id"] for inv in ledger.iter_range(JAN, FEB, status="paid", batch=2)] == ids[::2]
+    assert list(ledger.iter_range(FEB + 1, FEB + 2)) == []
+    with pytest.raises(ValueError):
+        list(ledger.iter_range(JAN, FEB, status="draft"))
+
+
+def test_export_csv(ledger, tmp_path):
+    ids = seed(ledger)
+    path = tmp_path / "out.csv"
+    assert ledger.export(path, *month_range(2025, 1), status="open") == 3
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [int(r["id"]) for r in rows] == ids[1::2]
+    assert rows[0]["amount"] == "2.00" and rows[0]["created_at"] == "2025-01-02 00:00:00"
+    assert json.loads(rows[0]["items"]) == item(200)
+
+
+def test_export_jsonl(ledger, tmp_path):
+    seed(ledger)
+    path = tmp_path / "out.jsonl"
+    assert ledger.export(path, JAN, FEB, fmt="jsonl") == 7
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert records[0]["items"] == item(100) and records[0]["status"] == "paid"
+    with pytest.raises(ValueError):
+        ledger.export(path, JAN, FEB, fmt="xml")
+
+# ==============================
+# 📅 Helpers
+# ==============================
+def test_month_range_covers_the_whole_month():
+    assert month_range(2025, 1) == (JAN, FEB)
+    start, end = month_range(2024, 2)
+    assert end - start == 29 * 86400
+    start, end = month_range(9999, 12)  # no 10000-01-01 to end on
+    assert end - start == 31 * 86400
+
+
+def test_read_import_names_the_bad_line():
+    text = "customer_id,customer_name,description,quantity,unit_price\n1,benyx1,Nitro,2,4.99\n2,x,Boost,0,1\n"
+    with pytest.raises(ValueError, match="Line 3"):
+        read_import(text)
+    rows = read_import(text.rsplit("\n", 2)[0] + "\n")
+    assert rows == [{"customer_id": 1, "customer_name": "benyx1", "currency": "EUR",
+                     "items": [{"description": "Nitro", "quantity": 2, "unit_cents": 499}]}]
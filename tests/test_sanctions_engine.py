@@ -0,0 +1,166 @@
+# ==================================================
+# Nuvix Sanctions — durations, timer wheel and expiry (nuvix_sanctions/sanctions_engine.py)
+# ==================================================
+
+import asyncio
+import time
+
+import pytest
+
+from sanctions_engine import (RetryLater, SanctionActions, SanctionEngine, SanctionStore, TimerWheel,
+                              TokenBucket, parse_duration)
+
+
+class RecordingActions(SanctionActions):
+    def __init__(self, fail_once: set | None = None):
+        self.lifted = []
+        self.fail_once = set(fail_once or ())
+
+    async def lift(self, sanction):
+        if sanction.id in self.fail_once:
+            self.fail_once.discard(sanction.id)
+            raise RetryLater(0, rate_limited=False)
+        self.lifted.append(sanction.id)
+
+
+def make_engine(tmp_path, actions=None, **kwargs):
+    lifts = []
+    engine = SanctionEngine(SanctionStore(tmp_path / "sanctions.sqlite3"), actions or RecordingActions(),
+                            tick=0.01, rate=1000, burst=100, on_lift=lambda s, by: lifts.append((s.id, by)), **kwargs)
+    return engine, lifts
+
+
+async def until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached in time")
+        await asyncio.sleep(0.01)
+
+# ==============================
+# ⏱ Durations
+# ==============================
+def test_parse_duration_sums_units():
+    assert parse_duration("90s") == 90
+    assert parse_duration("1d12h") == 86400 + 12 * 3600
+    assert parse_duration(" 2W ") == 2 * 604800
+
+
+@pytest.mark.parametrize("text", ["", "soon", "10x", "5m later", "0s", "0m", "0d0h"])
+def test_parse_duration_rejects_garbage_and_zero(text):
+    with pytest.raises(ValueError):
+        parse_duration(text)
+
+
+def test_none_duration_is_permanent_and_a_short_one_expires(tmp_path):
+    async def scenario():
+        engine, _ = make_engine(tmp_path)
+        permanent = await engine.apply(1, 10, "ban", None)
+        short = await engine.apply(1, 11, "ban", 1)
+        return permanent, short
+
+    permanent, short = asyncio.run(scenario())
+    assert permanent.expires_at is None
+    assert short.expires_at == pytest.approx(short.created_at + 1)
+
+# ==============================
+# 🎡 Timer wheel
+# ==============================
+def test_wheel_fires_each_timer_on_its_tick_across_levels():
+    # 4 slots × 2 levels: level 0 holds < 4 ticks, level 1 < 16, the rest overflows
+    wheel = TimerWheel(tick=1, slots=4, levels=2, now=0)
+    deadlines = {"l0": 3, "l1": 10, "l1-edge": 15, "overflow": 40}
+    for key, deadline in deadlines.items():
+        wheel.schedule(key, deadline)
+    assert len(wheel) == 4
+    fired = {}
+    for now in range(1, 45):
+        for key in wheel.advance(now):
+            fired[key] = now
+    assert fired == deadlines
+    assert len(wheel) == 0
+
+
+def test_wheel_cancel_and_reschedule():
+    wheel = TimerWheel(tick=1, slots=4, levels=2, now=0)
+    wheel.schedule("a", 5)
+    wheel.schedule("b", 5)
+    assert wheel.cancel("a") and not wheel.cancel("a")
+    wheel.schedule("b", 20)
+    assert wheel.advance(19) == []
+    assert wheel.advance(20) == ["b"]
+
+
+def test_wheel_past_deadline_fires_on_the_next_tick():
+    wheel = TimerWheel(tick=1, now=100)
+    wheel.schedule("late", 50)
+    assert wheel.advance(100) == []
+    assert wheel.advance(101) == ["late"]
+
+# ==============================
+# 🚦 Token bucket
+# ==============================
+def test_bucket_refund_never_exceeds_capacity():
+    async def scenario():
+        bucket = TokenBucket(rate=1, burst=2)
+        await bucket.acquire()
+        bucket.refund()
+        bucket.refund()
+        return bucket.tokens
+
+    assert asyncio.run(scenario()) == 2
+
+# ==============================
+# ⚙️ Engine
+# ==============================
+def test_overdue_sanctions_are_lifted_in_batches(tmp_path):
+    async def scenario():
+        engine, lifts = make_engine(tmp_path, batch_size=2)
+        past = time.time() - 60
+        ids = [engine.store.add(1, user, "mute", "", None, past - 10, past).id for user in range(5)]
+        assert await engine.load() == 5
+        engine.start()
+        await until(lambda: engine.stats["expired"] == 5)
+        await engine.stop()
+        return engine, lifts, ids
+
+    engine, lifts, ids = asyncio.run(scenario())
+    assert sorted(engine.actions.lifted) == ids
+    assert engine.stats["batches"] == 3
+    assert sorted(lifts) == [(i, "expired") for i in ids]
+    assert engine.store.load_active() == [] and len(engine) == 0
+
+
+def test_retry_later_reschedules_and_refunds(tmp_path):
+    async def scenario():
+        engine, lifts = make_engine(tmp_path)
+        s = engine.store.add(1, 10, "ban", "", None, time.time() - 10, time.time() - 1)
+        engine.actions.fail_once.add(s.id)
+        await engine.load()
+        engine.start()
+        await until(lambda: engine.stats["expired"] == 1)
+        await engine.stop()
+        return engine, lifts
+
+    engine, lifts = asyncio.run(scenario())
+    assert engine.stats["retried"] == 1
+    assert engine.limiter.tokens > engine.limiter.capacity - 2  # the retried call gave its token back
+    assert len(lifts) == 1
+
+
+def test_revoked_or_reapplied_sanction_is_not_lifted(tmp_path):
+    async def scenario():
+        engine, lifts = make_engine(tmp_path)
+        past = time.time() - 1
+        revoked = engine.store.add(1, 10, "ban", "", None, past - 10, past)
+        reapplied = engine.store.add(1, 11, "ban", "", None, past - 10, past)
+        await engine.load()
+        await engine.revoke(1, 10, "ban")
+        fresh = await engine.apply(1, 11, "ban", 3600)
+        await engine._process([revoked.id, reapplied.id])
+        return engine, lifts, fresh
+
+    engine, lifts, fresh = asyncio.run(scenario())
+    assert engine.actions.lifted == []
+    assert lifts == [(lifts[0][0], "manual")]
+    assert engine.active(1, 11, "ban") is fresh
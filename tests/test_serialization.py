@@ -0,0 +1,90 @@
+# ==================================================
+# Nuvix Suite — JSON backends (serialization.py)
+# Files written with the fast runtime on must read back with it off, and the other
+# way round, so both backends have to agree byte for byte.
+# ==================================================
+
+import io
+import json
+
+import pytest
+
+import serialization
+
+BACKENDS = ["json", pytest.param("orjson", marks=pytest.mark.skipif(serialization.orjson is None,
+                                                                      reason="orjson not installed"))]
+
+PAYLOAD = {
+    "guild_id": 1432829605298962534,       # Discord IDs: well above 2**53
+    "limits": [2**53, 2**53 + 1, 2**63 - 1, -(2**63)],
+    "ts": 1762126422.123456,
+    "ratio": 0.1,
+    "ok": True,
+    "missing": None,
+    "text": "Compra — método de pago ✅ \"quoted\"\n",
+    "nested": [{"a": [], "b": {}}],
+}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = serialization.backend()
+    assert serialization.use(request.param == "orjson") == request.param
+    yield request.param
+    serialization.use(previous == "orjson")
+
+
+def stdlib(obj, **kwargs) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), **kwargs).encode("utf-8")
+
+
+def test_output_matches_compact_stdlib_json(backend):
+    assert serialization.dumpb(PAYLOAD) == stdlib(PAYLOAD)
+    assert serialization.dumps(PAYLOAD, sort_keys=True) == stdlib(PAYLOAD, sort_keys=True).decode("utf-8")
+
+
+def test_round_trip(backend):
+    assert serialization.loads(serialization.dumpb(PAYLOAD)) == PAYLOAD
+    assert serialization.loads(serialization.dumps(PAYLOAD)) == PAYLOAD
+    f = io.StringIO()
+    serialization.dump(PAYLOAD, f)
+    f.seek(0)
+    assert serialization.load(f) == PAYLOAD
+
+
+def test_non_str_keys_become_strings(backend):
+    data = {1432829605298962534: "role", 7: 1, None: 2, False: 3}
+    assert serialization.dumpb(data) == stdlib(data)
+    assert serialization.loads(serialization.dumpb(data)) == {"1432829605298962534": "role", "7": 1,
+                                                             "null": 2, "false": 3}
+
+
+def test_default_hook(backend):
+    class Money:
+        cents = 499
+
+    assert serialization.dumps({"price": Money()}, default=lambda o: o.cents) == '{"price":499}'
+
+
+def test_invalid_input_raises_the_shared_error(backend):
+    with pytest.raises(serialization.JSONDecodeError):
+        serialization.loads(b"{not json")
+
+
+@pytest.mark.parametrize("writer", BACKENDS)
+def test_each_backend_reads_what_the_other_wrote(writer, backend):
+    serialization.use(writer == "orjson")
+    data = serialization.dumpb(PAYLOAD)
+    serialization.use(backend == "orjson")
+    assert serialization.loads(data) == PAYLOAD
+
+
+def test_log_lines_are_compact(backend, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    import utils
+
+    utils.log_to_json("cmd_use", {"user": "benyx1", "channel": 1432829783602888775, "reason": "Compra — pago"})
+    line = (tmp_path / "logs" / "cmd_use.json").read_text(encoding="utf-8")
+    assert line.endswith("}\n") and line.count("\n") == 1
+    assert ", " not in line and '": ' not in line
+    assert serialization.loads(line)["data"]["channel"] == 1432829783602888775
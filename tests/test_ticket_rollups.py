@@ -0,0 +1,119 @@
+# ==================================================
+# Nuvix Tickets — support rollups (nuvix_tickets/rollups.py)
+# ==================================================
+
+import os
+import time
+
+import pytest
+
+from rollups import UNCATEGORIZED, TicketRollups, _SLOT
+
+NOW = time.time()
+HOUR = 3600
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "ticket_rollups.bin")
+
+
+def reopen(path) -> TicketRollups:
+    return TicketRollups(path)
+
+# ==============================
+# 💾 Slots
+# ==============================
+def test_slots_round_trip_through_the_file(path):
+    r = TicketRollups(path)
+    r.ticket_opened(1, "Purchases", NOW - 2 * HOUR)
+    r.staff_replied(1, NOW - 2 * HOUR + 90)
+    r.ticket_assigned(1, NOW - 2 * HOUR + 120)
+    r.ticket_closed(1, NOW - HOUR)
+    r.ticket_opened(2, "Support", NOW)
+    r.flush()
+    assert os.path.getsize(path) % _SLOT.size == 0
+
+    again = reopen(path)
+    purchases = again.totals["Purchases"]
+    assert (purchases.opens, purchases.replied, purchases.reply_s) == (1, 1, 90)
+    assert (purchases.assigned, purchases.assign_s, purchases.closed, purchases.resolved) == (1, 120, 1, 1)
+    assert purchases.resolve_s == HOUR
+    assert again.window(24)["Support"].opens == 1
+    assert again.is_open(2) and not again.is_open(1)
+
+
+def test_late_event_outside_the_window_updates_its_stored_slot(path):
+    old = NOW - 400 * HOUR  # past the 168 h window
+    r = TicketRollups(path)
+    r.ticket_closed(10, old)
+    r.flush()
+    r = reopen(path)
+    assert not r.window(168)
+    r.ticket_closed(11, old)
+    r.flush()
+    assert reopen(path).totals[UNCATEGORIZED].closed == 2
+    assert os.path.getsize(path) == _SLOT.size
+
+
+def test_reload_ignores_a_torn_last_slot(path):
+    r = TicketRollups(path)
+    r.ticket_opened(1, "Purchases", NOW - HOUR)
+    r.flush()
+    with open(path, "ab") as f:
+        f.write(b"\xff" * (_SLOT.size // 2))  # crash half way through appending a slot
+    r = reopen(path)
+    assert r.totals["Purchases"].opens == 1 and len(r._slots) == 1
+    r.ticket_opened(2, "Support", NOW)  # the next new slot goes over the torn bytes
+    r.flush()
+    again = reopen(path)
+    assert os.path.getsize(path) == 2 * _SLOT.size
+    assert (again.totals["Purchases"].opens, again.totals["Support"].opens) == (1, 1)
+
+# ==============================
+# 🔢 Snapshot / write ordering
+# ==============================
+def test_a_late_older_write_never_overwrites_a_newer_one(path):
+    r = TicketRollups(path)
+    r.ticket_opened(1, "Purchases", NOW)
+    older = r.snapshot()
+    r.ticket_opened(2, "Purchases", NOW)
+    newer = r.snapshot()
+    r.write(newer)
+    r.write(older)  # e.g. a cancelled to_thread write finishing after the shutdown flush
+    again = reopen(path)
+    assert again.totals["Purchases"].opens == 2
+    assert set(again.open) == {1, 2}
+
+
+def test_flush_after_a_pending_snapshot_keeps_both(path):
+    r = TicketRollups(path)
+    r.ticket_opened(1, "Purchases", NOW)
+    pending = r.snapshot()  # taken, not written yet
+    r.ticket_opened(2, "Support", NOW)
+    r.flush()
+    r.write(pending)
+    again = reopen(path)
+    assert (again.totals["Purchases"].opens, again.totals["Support"].opens) == (1, 1)
+
+
+def test_snapshot_is_empty_once_clean(path):
+    r = TicketRollups(path)
+    r.ticket_opened(1, "Purchases", NOW)
+    r.flush()
+    _, state, records = r.snapshot()
+    assert state is None and records == []
+
+# ==============================
+# 📤 Closes
+# ==============================
+def test_ticket_closed_known_only(path):
+    r = TicketRollups(path)
+    r.ticket_closed(99, NOW, known_only=True)  # any deleted channel: not a ticket we saw
+    assert UNCATEGORIZED not in r.totals
+    r.ticket_closed(98, NOW)  # opened before tracking started: counted, no resolution time
+    assert (r.totals[UNCATEGORIZED].closed, r.totals[UNCATEGORIZED].resolved) == (1, 0)
+    r.ticket_opened(1, "Purchases", NOW - 600)
+    r.ticket_closed(1, NOW, known_only=True)
+    purchases = r.totals["Purchases"]
+    assert (purchases.closed, purchases.resolved, purchases.avg_resolve) == (1, 1, 600)
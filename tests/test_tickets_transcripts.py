@@ -0,0 +1,33 @@
+# ==================================================
+# Nuvix Tickets — transcript names for autocomplete (nuvix_tickets/transcripts.py)
+# ==================================================
+
+import os
+
+from transcripts import TranscriptNames, list_transcripts
+
+
+def write(directory, name, mtime):
+    path = directory / name
+    path.write_text("[2025-01-01 10:00:00] user: hi\n")
+    os.utime(path, (mtime, mtime))
+
+
+def test_live_names_newest_first(tmp_path):
+    write(tmp_path, "transcript_alice-101010_1.txt", 100)
+    write(tmp_path, "transcript_bob-121212_2.txt", 300)
+    write(tmp_path, "notes.md", 400)
+    assert list_transcripts(str(tmp_path)) == ["transcript_bob-121212_2.txt", "transcript_alice-101010_1.txt"]
+    assert list_transcripts(str(tmp_path / "missing")) == []
+
+
+def test_search_is_in_memory_and_sees_new_closes(tmp_path):
+    write(tmp_path, "transcript_alice-101010_1.txt", 100)
+    names = TranscriptNames()
+    names.load(str(tmp_path))
+    write(tmp_path, "transcript_alice-131313_5.txt", 500)  # not seen until reloaded or announced
+    assert names.search("ALICE") == ["transcript_alice-101010_1.txt"]
+    names.add_live("transcript_alice-131313_5.txt")
+    assert names.search("alice") == ["transcript_alice-131313_5.txt", "transcript_alice-101010_1.txt"]
+    assert names.search("", limit=1) == ["transcript_alice-131313_5.txt"]
+    assert names.search("carol") == []
@@ -0,0 +1,116 @@
+# ==================================================
+# Nuvix Suite — transcript archive (transcript_archive.py)
+# ==================================================
+
+import os
+import shutil
+
+import pytest
+
+from transcript_archive import INDEX_NAME, TranscriptArchive, transcript_filename
+from transcripts import TranscriptNames
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = TranscriptArchive(str(tmp_path / "archive"), segment_bytes=1024)
+    yield archive
+    archive.close()
+
+
+def read(archive, ticket, ts=None):
+    view = archive.get(ticket, ts)
+    return None if view is None else bytes(view)
+
+# ==============================
+# 📦 Append + read
+# ==============================
+def test_append_then_get(archive):
+    archive.append([("alice-101010", 100, b"first"), ("bob-121212", 200, b"second")])
+    assert read(archive, "alice-101010", 100) == b"first"
+    assert read(archive, "bob-121212") == b"second"
+    assert read(archive, "carol-131313") is None
+    assert read(archive, "alice-101010", 999) is None
+    assert len(archive) == 2
+
+
+def test_versions_latest_wins(archive):
+    archive.append([("alice-101010", 100, b"v1")])
+    archive.append([("alice-101010", 300, b"v3"), ("alice-101010", 200, b"v2")])
+    assert archive.versions("alice-101010") == [100, 200, 300]
+    assert read(archive, "alice-101010") == b"v3"
+    assert archive.contains("alice-101010", 200) and not archive.contains("alice-101010", 250)
+    assert sorted(archive.entries()) == [("alice-101010", 100), ("alice-101010", 200), ("alice-101010", 300)]
+
+
+def test_full_segments_are_sealed(archive):
+    sealed = archive.append([(f"t{i}", i, b"x" * 400) for i in range(5)])
+    assert sealed and archive.segment_numbers()[-1] == sealed[-1] + 1
+    assert all(read(archive, f"t{i}") == b"x" * 400 for i in range(5))
+
+# ==============================
+# 🩹 Recovery
+# ==============================
+def segment(archive, n=1):
+    return os.path.join(archive.dir, f"seg-{n:06d}.dat")
+
+
+def test_torn_tail_is_truncated(archive):
+    archive.append([("alice-101010", 100, b"kept")])
+    size = os.path.getsize(segment(archive))
+    with open(segment(archive), "ab") as f:
+        f.write(b"\x01\x02\x03 half a record")
+    assert archive.recover() == 0
+    assert os.path.getsize(segment(archive)) == size
+    assert read(archive, "alice-101010") == b"kept"
+
+
+def test_records_written_after_the_last_index_commit_are_reindexed(archive, tmp_path):
+    archive.append([("alice-101010", 100, b"a")])
+    shutil.copyfile(os.path.join(archive.dir, INDEX_NAME), tmp_path / "old-index")
+    archive.append([("bob-121212", 200, b"b")])
+    shutil.copyfile(tmp_path / "old-index", os.path.join(archive.dir, INDEX_NAME))  # crash before the index swap
+    assert read(archive, "bob-121212") is None
+    assert archive.recover() == 1
+    assert read(archive, "bob-121212") == b"b"
+
+
+def test_lost_index_is_rebuilt_from_the_segments(archive):
+    archive.append([(f"t{i}", i, f"body {i}".encode()) for i in range(6)])
+    os.unlink(os.path.join(archive.dir, INDEX_NAME))
+    assert len(archive) == 0
+    assert archive.recover() == 6
+    assert [read(archive, f"t{i}") for i in range(6)] == [f"body {i}".encode() for i in range(6)]
+
+# ==============================
+# 🗜 Compaction
+# ==============================
+def test_compact_moves_only_old_transcripts(archive, tmp_path):
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    (logs / transcript_filename("old-101010", 1000)).write_bytes(b"old")
+    (logs / transcript_filename("new-121212", 9000)).write_bytes(b"new")
+    (logs / "notes.txt").write_bytes(b"not a transcript")
+    summary = archive.compact(str(logs), older_than=5000, now=10000)
+    assert summary["archived"] == 1 and summary["bytes"] == 3
+    assert sorted(os.listdir(logs)) == ["notes.txt", transcript_filename("new-121212", 9000)]
+    assert read(archive, "old-101010", 1000) == b"old"
+
+
+def test_compact_after_a_crash_skips_what_is_already_archived(archive, tmp_path):
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    archive.append([("old-101010", 1000, b"old")])
+    (logs / transcript_filename("old-101010", 1000)).write_bytes(b"old")  # archived, not yet deleted
+    summary = archive.compact(str(logs), older_than=0, now=10000)
+    assert (summary["archived"], summary["skipped"]) == (0, 1)
+    assert os.listdir(logs) == [] and archive.versions("old-101010") == [1000]
+
+
+def test_names_prefix_search_over_the_archive(archive, tmp_path):
+    archive.append([("alice-101010", 100, b"a"), ("alicia-111111", 150, b"b"), ("bob-121212", 200, b"c")])
+    names = TranscriptNames()
+    names.load(str(tmp_path / "logs"), archive)
+    assert names.search("ali") == [transcript_filename("alice-101010", 100), transcript_filename("alicia-111111", 150)]
+    assert names.search("transcript_bob") == [transcript_filename("bob-121212", 200)]
+    assert names.search("") == []  # the archive is only searched once something was typed
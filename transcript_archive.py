@@ -0,0 +1,346 @@
+# ==================================================
+# Nuvix Suite — Transcript archive
+# Old ticket transcripts packed into append-only segment files, with a sorted
+# fixed-width index read through mmap. nuvix_tickets writes it (compaction),
+# nuvix_tickets and nuvix_backup read it.
+#
+#   seg-000001.dat   [crc32 u32][data_len u32][name_len u16][ts i64][name][data] ...
+#   index.bin        header [magic][count u64][active segment u32][active size u64]
+#                    then count × [name_hash u64][ts i64][segment u32][offset u64][data_len u32]
+#                    sorted by (name_hash, ts)
+#
+# Segments are only ever appended to; once a new one is started the old one never
+# changes again, so backups copy each byte once. The index can always be rebuilt
+# from the segments.
+# ==================================================
+
+import bisect
+import hashlib
+import mmap
+import os
+import re
+import shutil
+import struct
+import threading
+import time
+import zlib
+
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+INDEX_NAME = "index.bin"
+
+_MAGIC = b"NVXIDX01"
+_HEADER = struct.Struct("<8sQIQ")
+_ENTRY = struct.Struct("<QqIQI")
+_RECORD = struct.Struct("<IIHq")
+_SEGMENT = re.compile(r"^seg-(\d{6})\.dat$")
+# transcript_<ticket>_<unix ts>.txt, ticket being the channel name or ID
+TRANSCRIPT_FILE = re.compile(r"^transcript_(.+)_(\d+)\.txt$")
+
+
+def name_hash(ticket: str) -> int:
+    return int.from_bytes(hashlib.blake2b(ticket.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def transcript_filename(ticket: str, ts: int) -> str:
+    return f"transcript_{ticket}_{ts}.txt"
+
+
+class _Keys:
+    """(name_hash, ts) of every index entry, straight from the mmap (for :mod:`bisect`)."""
+
+    def __init__(self, view, count: int):
+        self.view = view
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return _ENTRY.unpack_from(self.view, _HEADER.size + i * _ENTRY.size)[:2]
+
+
+class TranscriptArchive:
+    """Random access to archived transcripts without unpacking anything.
+
+    Reads return ``memoryview`` slices of the mmapped segment (no copy). Only one
+    process may write (compaction runs in nuvix_tickets); readers in other processes
+    pick up a new index as soon as it is swapped in."""
+
+    def __init__(self, directory: str, segment_bytes: int = DEFAULT_SEGMENT_BYTES):
+        self.dir = directory
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._index = None      # (mmap, count, stat signature)
+        self._segments = {}     # segment number -> mmap
+        self.stats = {"archived": 0, "reads": 0, "recovered": 0, "last_compaction": None}
+
+    # ---- files ----
+    def _segment_path(self, n: int) -> str:
+        return os.path.join(self.dir, f"seg-{n:06d}.dat")
+
+    def segment_numbers(self) -> list[int]:
+        try:
+            return sorted(int(m.group(1)) for m in map(_SEGMENT.match, os.listdir(self.dir)) if m)
+        except FileNotFoundError:
+            return []
+
+    def disk_usage(self) -> tuple[int, int]:
+        """(segment count, bytes) including the index."""
+        segments = self.segment_numbers()
+        total = sum(os.path.getsize(self._segment_path(n)) for n in segments)
+        index = os.path.join(self.dir, INDEX_NAME)
+        return len(segments), total + (os.path.getsize(index) if os.path.exists(index) else 0)
+
+    # ---- index (read side) ----
+    def _index_view(self):
+        """Current index mmap and entry count; remapped when the file was replaced."""
+        path = os.path.join(self.dir, INDEX_NAME)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None, 0
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if self._index is None or self._index[2] != signature:
+                if st.st_size < _HEADER.size:
+                    return None, 0
+                with open(path, "rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, count, _, _ = _HEADER.unpack_from(mm, 0)
+                if magic != _MAGIC:
+                    raise ValueError(f"{path} is not a transcript index")
+                self._index = (mm, count, signature)  # the old map is freed once no view uses it
+            return self._index[0], self._index[1]
+
+    def _segment_view(self, n: int, end: int):
+        with self._lock:
+            mm = self._segments.get(n)
+            if mm is None or len(mm) < end:  # the active segment grew since it was mapped
+                with open(self._segment_path(n), "rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._segments[n] = mm
+            return mm
+
+    def _read_record(self, segment: int, offset: int, length: int):
+        """(ticket, ts, data view) of the record at ``offset``."""
+        mm = self._segment_view(segment, offset + _RECORD.size)
+        _, data_len, name_len, ts = _RECORD.unpack_from(mm, offset)
+        start = offset + _RECORD.size + name_len
+        mm = self._segment_view(segment, start + data_len)
+        view = memoryview(mm)
+        return str(view[offset + _RECORD.size:start], "utf-8"), ts, view[start:start + length]
+
+    def __len__(self):
+        return self._index_view()[1]
+
+    def _lookup(self, ticket: str) -> list[tuple[int, int, int, int]]:
+        """(ts, segment, offset, length) of every archived version of ``ticket``, oldest first."""
+        view, count = self._index_view()
+        if not count:
+            return []
+        h = name_hash(ticket)
+        keys = _Keys(view, count)
+        found = []
+        for i in range(bisect.bisect_left(keys, (h,)), bisect.bisect_left(keys, (h + 1,))):
+            _, ts, segment, offset, length = _ENTRY.unpack_from(view, _HEADER.size + i * _ENTRY.size)
+            if self._read_record(segment, offset, length)[0] == ticket:  # 64-bit hash collisions
+                found.append((ts, segment, offset, length))
+        return found
+
+    def versions(self, ticket: str) -> list[int]:
+        return [ts for ts, *_ in self._lookup(ticket)]
+
+    def contains(self, ticket: str, ts: int) -> bool:
+        return ts in self.versions(ticket)
+
+    def get(self, ticket: str, ts: int | None = None):
+        """Transcript bytes as a zero-copy ``memoryview`` (latest version when ``ts`` is None)."""
+        matches = [m for m in self._lookup(ticket) if ts is None or m[0] == ts]
+        if not matches:
+            return None
+        _, segment, offset, length = matches[-1]
+        self.stats["reads"] += 1
+        return self._read_record(segment, offset, length)[2]
+
+    def entries(self):
+        """Every archived ``(ticket, ts)``, in index order."""
+        view, count = self._index_view()
+        for i in range(count):
+            _, _, segment, offset, length = _ENTRY.unpack_from(view, _HEADER.size + i * _ENTRY.size)
+            ticket, ts, _ = self._read_record(segment, offset, length)
+            yield ticket, ts
+
+    # ---- index (write side) ----
+    def _read_index(self) -> tuple[list[tuple], int, int] | None:
+        """All entries plus the committed (active segment, size); None when there is no index."""
+        try:
+            with open(os.path.join(self.dir, INDEX_NAME), "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        magic, count, segment, size = _HEADER.unpack_from(raw, 0)
+        if magic != _MAGIC:
+            raise ValueError("not a transcript index")
+        end = _HEADER.size + count * _ENTRY.size
+        return list(_ENTRY.iter_unpack(raw[_HEADER.size:end])), segment, size
+
+    def _write_index(self, entries: list[tuple], segment: int, size: int):
+        entries.sort(key=lambda e: (e[0], e[1]))
+        path = os.path.join(self.dir, INDEX_NAME)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(entries), segment, size))
+            f.write(b"".join(_ENTRY.pack(*e) for e in entries))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def _scan(self, segment: int, start: int, entries: list) -> int:
+        """Index the records of ``segment`` from ``start``; a torn tail is cut off. Returns the end."""
+        path = self._segment_path(segment)
+        with open(path, "rb") as f:
+            f.seek(start)
+            raw = f.read()
+        pos = 0
+        while pos + _RECORD.size <= len(raw):
+            crc, data_len, name_len, ts = _RECORD.unpack_from(raw, pos)
+            data_start = pos + _RECORD.size + name_len
+            end = data_start + data_len
+            if end > len(raw) or zlib.crc32(raw[data_start:end]) != crc:
+                break
+            ticket = raw[pos + _RECORD.size:data_start].decode("utf-8")
+            entries.append((name_hash(ticket), ts, segment, start + pos, data_len))
+            pos = end
+        if pos < len(raw):
+            with open(path, "r+b") as f:
+                f.truncate(start + pos)
+        return start + pos
+
+    def recover(self) -> int:
+        """Bring the index in line with the segments after a crash (or rebuild a lost index).
+        Writer only. Returns how many records were re-indexed."""
+        with self._lock:
+            state = self._read_index()
+            segments = self.segment_numbers()
+            if state is None and not segments:
+                return 0
+            entries, segment, size = state if state else ([], segments[0] if segments else 1, 0)
+            before = len(entries)
+            for n in (s for s in segments if s >= segment):
+                committed = size if n == segment else 0
+                actual = os.path.getsize(self._segment_path(n))
+                if actual != committed:
+                    segment, size = n, self._scan(n, committed, entries)
+                else:
+                    segment, size = n, committed
+            if state is None or len(entries) != before or (segments and segments[-1] != state[1]):
+                os.makedirs(self.dir, exist_ok=True)
+                self._write_index(entries, segment, size)
+            self.stats["recovered"] += len(entries) - before
+            return len(entries) - before
+
+    def append(self, items) -> list[int]:
+        """Append ``(ticket, ts, data)`` records and commit them to the index.
+        Writer only. Returns the numbers of segments sealed by this call."""
+        os.makedirs(self.dir, exist_ok=True)
+        with self._lock:
+            state = self._read_index()
+            entries, segment, size = state if state else ([], 1, 0)
+            sealed = []
+            f = open(self._segment_path(segment), "ab")
+            try:
+                for ticket, ts, data in items:
+                    name = ticket.encode("utf-8")
+                    need = _RECORD.size + len(name) + len(data)
+                    if size and size + need > self.segment_bytes:
+                        f.flush()
+                        os.fsync(f.fileno())
+                        f.close()
+                        sealed.append(segment)
+                        segment, size = segment + 1, 0
+                        f = open(self._segment_path(segment), "ab")
+                    f.write(_RECORD.pack(zlib.crc32(data), len(data), len(name), ts))
+                    f.write(name)
+                    f.write(data)
+                    entries.append((name_hash(ticket), ts, segment, size, len(data)))
+                    size += need
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                f.close()
+            self._write_index(entries, segment, size)
+        return sealed
+
+    # ---- jobs ----
+    def compact(self, logs_dir: str, older_than: float, batch: int = 500, now: float | None = None) -> dict:
+        """Move transcripts closed more than ``older_than`` seconds ago from ``logs_dir`` into
+        the archive. A file is only deleted once its record is committed to the index."""
+        cutoff = (now or time.time()) - older_than
+        candidates = []
+        try:
+            for entry in os.scandir(logs_dir):
+                m = TRANSCRIPT_FILE.match(entry.name)
+                if m and int(m.group(2)) <= cutoff and entry.is_file():
+                    candidates.append((int(m.group(2)), m.group(1), entry.path))
+        except FileNotFoundError:
+            pass
+        candidates.sort()
+        self.recover()
+        summary = {"archived": 0, "bytes": 0, "sealed": [], "skipped": 0}
+        for i in range(0, len(candidates), batch):
+            items, done = [], []
+            for ts, ticket, path in candidates[i:i + batch]:
+                with open(path, "rb") as f:
+                    data = f.read()
+                existing = self.get(ticket, ts)
+                if existing is not None and existing == data:
+                    summary["skipped"] += 1  # archived before a crash, file not yet deleted
+                else:
+                    items.append((ticket, ts, data))
+                    summary["bytes"] += len(data)
+                done.append(path)
+            if items:
+                summary["sealed"] += self.append(items)
+            for path in done:
+                os.unlink(path)
+            summary["archived"] += len(items)
+        self.stats["archived"] += summary["archived"]
+        self.stats["last_compaction"] = time.time()
+        return summary
+
+    def mirror(self, dest_dir: str) -> dict:
+        """Incremental copy for backups: segments only grow, so only the new tail of each
+        is copied (sealed ones once). The index goes first so the copy never references
+        bytes it doesn't have."""
+        os.makedirs(dest_dir, exist_ok=True)
+        summary = {"segments": 0, "bytes": 0}
+        index = os.path.join(self.dir, INDEX_NAME)
+        if os.path.exists(index):
+            tmp = os.path.join(dest_dir, INDEX_NAME + ".tmp")
+            shutil.copyfile(index, tmp)
+            os.replace(tmp, os.path.join(dest_dir, INDEX_NAME))
+        for n in self.segment_numbers():
+            src = self._segment_path(n)
+            dst = os.path.join(dest_dir, os.path.basename(src))
+            have = os.path.getsize(dst) if os.path.exists(dst) else 0
+            size = os.path.getsize(src)
+            if have == size:
+                continue
+            if have > size:
+                have = 0  # not a prefix of the source any more: copy it again
+            with open(src, "rb") as fi, open(dst, "ab" if have else "wb") as fo:
+                fi.seek(have)
+                shutil.copyfileobj(fi, fo, 1024 * 1024)
+            summary["segments"] += 1
+            summary["bytes"] += size - have
+        return summary
+
+    def close(self):
+        with self._lock:
+            for mm in [*self._segments.values(), *(self._index[:1] if self._index else ())]:
+                try:
+                    mm.close()
+                except BufferError:
+                    pass  # a caller still holds a view; freed with it
+            self._segments.clear()
+            self._index = None
@@ -1,8 +1,11 @@
 import discord
-import json
 import os
 from datetime import datetime
 
+import config
+import event_bus
+import serialization
+
 # Añade estas variables si no existen
 from pathlib import Path
 
@@ -17,30 +20,30 @@ STAFF_ROLE_IDS = [1432829631852970095]       # ID del Staff
 # ==============================
 # 📦 Global Configuration
 # ==============================
-BANNER_URL = os.getenv("BANNER_URL", "")
-FOOTER_TEXT = os.getenv("FOOTER_TEXT", "Nuvix Market • Your wishes, more cheap!")
-LOGS_CMD_USE_CHANNEL_ID = os.getenv("LOGS_CMD_USE_CHANNEL_ID")
+# Import-time snapshot kept for existing imports; the helpers below read config.settings()
+# on every call so they follow hot reloads.
+BANNER_URL = config.settings().banner_url
+FOOTER_TEXT = config.settings().footer_text
+LOGS_CMD_USE_CHANNEL_ID = config.settings().logs_cmd_use_channel_id
 
 # ==============================
 # 🧠 Permission Helpers
 # ==============================
 def can_staff(member: discord.Member):
     """Return True if user is staff or higher."""
-    allowed_roles = os.getenv("STAFF_ROLE_IDS", "").split(",")
-    return any(str(role.id) in allowed_roles for role in member.roles)
+    allowed_roles = config.settings().staff_role_ids
+    return any(role.id in allowed_roles for role in member.roles)
 
 def can_highstaff_or_above(member: discord.Member):
     """Return True if user is high staff or higher."""
-    allowed_roles = os.getenv("HIGHSTAFF_ROLE_IDS", "").split(",")
-    return any(str(role.id) in allowed_roles for role in member.roles)
+    allowed_roles = config.settings().highstaff_role_ids
+    return any(role.id in allowed_roles for role in member.roles)
 
 def can_owner_or_coowner(member: discord.Member):
     """Return True if user is owner or co-owner."""
-    allowed_roles = (
-        os.getenv("OWNER_ROLE_IDS", "").split(",") +
-        os.getenv("COOWNER_ROLE_IDS", "").split(",")
-    )
-    return any(str(role.id) in allowed_roles for role in member.roles)
+    cfg = config.settings()
+    allowed_roles = cfg.owner_role_ids | cfg.coowner_role_ids
+    return any(role.id in allowed_roles for role in member.roles)
 
 # ==============================
 # 🧾 Logging Utilities
@@ -56,18 +59,20 @@ def log_to_json(filename: str, data: dict):
     }
 
     with open(filepath, "a", encoding="utf-8") as f:
-        json.dump(log_entry, f, ensure_ascii=False)
-        f.write("\n")
+        f.write(serialization.dumps(log_entry) + "\n")
+    # readers subscribe to "log.<filename>" instead of re-reading the file
+    event_bus.bus().publish(f"log.{filename}", log_entry)
 
 # ==============================
 # 🖼 Embed Builder
 # ==============================
 def default_embed(title: str = "", description: str = "", color=0x5865F2):
     """Create a styled embed with banner and footer."""
+    cfg = config.settings()
     embed = discord.Embed(title=title, description=description, color=color)
-    if BANNER_URL:
-        embed.set_image(url=BANNER_URL)
-    embed.set_footer(text=FOOTER_TEXT)
+    if cfg.banner_url:
+        embed.set_image(url=cfg.banner_url)
+    embed.set_footer(text=cfg.footer_text)
     return embed
 
 # ==============================
@@ -77,8 +82,8 @@ def format_time(ts: datetime):
     return ts.strftime("%Y-%m-%d %H:%M:%S")
 
 def get_env_value(name: str, default=None):
-    """Shortcut to safely load values from environment variables."""
-    return os.getenv(name, default)
+    """Shortcut to read a raw value from the loaded configuration (.env + environment)."""
+    return config.settings().get(name, default)
 
 def log_console(msg: str):
     print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")